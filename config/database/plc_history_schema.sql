@@ -0,0 +1,172 @@
+-- AMPEL360 Space-T PLC Gate History Rollups
+-- Version: 1.0
+-- Date: 2026-10-17
+-- Standard: Nomenclature v6.0 R1.0
+-- Purpose: Bounded gate run history with incrementally maintained aggregates
+--
+-- Applied after plc_ontology_schema.sql by PLCDatabase.initialize_database()
+-- and re-applied by `plc_db.py compact` to upgrade existing databases, so
+-- every statement is idempotent.
+--
+-- gate_run / gate_finding hold the detailed history, which `compact` trims
+-- to the last N runs per gate. The rollup tables below are updated by
+-- triggers on every insert and are never trimmed, so per-gate totals and
+-- daily trends survive compaction and dashboards read precomputed rows
+-- instead of aggregating the full history.
+
+-- ============================================================================
+-- Rollup tables
+-- ============================================================================
+
+-- Per-gate running totals over all runs ever recorded
+CREATE TABLE IF NOT EXISTS gate_run_summary (
+    gate_code VARCHAR(20) PRIMARY KEY,
+    total_runs INTEGER NOT NULL DEFAULT 0,
+    passed_runs INTEGER NOT NULL DEFAULT 0,
+    failed_runs INTEGER NOT NULL DEFAULT 0,
+    total_execution_time_ms INTEGER NOT NULL DEFAULT 0,
+    timed_runs INTEGER NOT NULL DEFAULT 0,      -- Runs with execution_time_ms (for averages)
+    last_run_id INTEGER,
+    last_run_timestamp TIMESTAMP,
+    last_passed BOOLEAN,
+    FOREIGN KEY (gate_code) REFERENCES gate(gate_code)
+);
+
+-- Per-gate, per-day aggregates
+CREATE TABLE IF NOT EXISTS gate_run_daily (
+    gate_code VARCHAR(20) NOT NULL,
+    run_date DATE NOT NULL,
+    runs INTEGER NOT NULL DEFAULT 0,
+    passed_runs INTEGER NOT NULL DEFAULT 0,
+    failed_runs INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    warning_count INTEGER NOT NULL DEFAULT 0,
+    total_execution_time_ms INTEGER NOT NULL DEFAULT 0,
+    timed_runs INTEGER NOT NULL DEFAULT 0,
+    error_findings INTEGER NOT NULL DEFAULT 0,
+    warn_findings INTEGER NOT NULL DEFAULT 0,
+    info_findings INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (gate_code, run_date),
+    FOREIGN KEY (gate_code) REFERENCES gate(gate_code)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gate_run_daily_date ON gate_run_daily(run_date);
+
+-- Newest-first run lookup per gate (retention ranking, latest run)
+CREATE INDEX IF NOT EXISTS idx_gate_run_gate_code_run_id ON gate_run(gate_code, run_id);
+
+-- ============================================================================
+-- Incremental maintenance
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS trg_gate_run_rollup
+AFTER INSERT ON gate_run
+BEGIN
+    INSERT INTO gate_run_summary
+    (gate_code, total_runs, passed_runs, failed_runs, total_execution_time_ms,
+     timed_runs, last_run_id, last_run_timestamp, last_passed)
+    VALUES (
+        NEW.gate_code, 1,
+        CASE WHEN NEW.passed THEN 1 ELSE 0 END,
+        CASE WHEN NEW.passed THEN 0 ELSE 1 END,
+        COALESCE(NEW.execution_time_ms, 0),
+        CASE WHEN NEW.execution_time_ms IS NULL THEN 0 ELSE 1 END,
+        NEW.run_id, NEW.run_timestamp, NEW.passed
+    )
+    ON CONFLICT (gate_code) DO UPDATE SET
+        total_runs = total_runs + 1,
+        passed_runs = passed_runs + excluded.passed_runs,
+        failed_runs = failed_runs + excluded.failed_runs,
+        total_execution_time_ms = total_execution_time_ms + excluded.total_execution_time_ms,
+        timed_runs = timed_runs + excluded.timed_runs,
+        last_run_id = excluded.last_run_id,
+        last_run_timestamp = excluded.last_run_timestamp,
+        last_passed = excluded.last_passed;
+
+    INSERT INTO gate_run_daily
+    (gate_code, run_date, runs, passed_runs, failed_runs, error_count,
+     warning_count, total_execution_time_ms, timed_runs)
+    VALUES (
+        NEW.gate_code, date(NEW.run_timestamp), 1,
+        CASE WHEN NEW.passed THEN 1 ELSE 0 END,
+        CASE WHEN NEW.passed THEN 0 ELSE 1 END,
+        COALESCE(NEW.error_count, 0),
+        COALESCE(NEW.warning_count, 0),
+        COALESCE(NEW.execution_time_ms, 0),
+        CASE WHEN NEW.execution_time_ms IS NULL THEN 0 ELSE 1 END
+    )
+    ON CONFLICT (gate_code, run_date) DO UPDATE SET
+        runs = runs + 1,
+        passed_runs = passed_runs + excluded.passed_runs,
+        failed_runs = failed_runs + excluded.failed_runs,
+        error_count = error_count + excluded.error_count,
+        warning_count = warning_count + excluded.warning_count,
+        total_execution_time_ms = total_execution_time_ms + excluded.total_execution_time_ms,
+        timed_runs = timed_runs + excluded.timed_runs;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_gate_finding_rollup
+AFTER INSERT ON gate_finding
+BEGIN
+    UPDATE gate_run_daily SET
+        error_findings = error_findings + (NEW.severity = 'ERROR'),
+        warn_findings = warn_findings + (NEW.severity = 'WARN'),
+        info_findings = info_findings + (NEW.severity = 'INFO')
+    WHERE gate_code = NEW.gate_code
+      AND run_date = (SELECT date(run_timestamp) FROM gate_run WHERE run_id = NEW.run_id);
+END;
+
+-- ============================================================================
+-- Reporting views (read the rollups, not the full history)
+-- ============================================================================
+
+-- Gate execution summary view
+DROP VIEW IF EXISTS v_gate_execution_summary;
+CREATE VIEW v_gate_execution_summary AS
+SELECT
+    g.gate_code,
+    g.gate_name,
+    g.implementation_status,
+    COALESCE(s.total_runs, 0) as total_runs,
+    COALESCE(s.passed_runs, 0) as passed_runs,
+    COALESCE(s.failed_runs, 0) as failed_runs,
+    s.last_run_timestamp,
+    s.total_execution_time_ms * 1.0 / NULLIF(s.timed_runs, 0) as avg_execution_time_ms
+FROM gate g
+LEFT JOIN gate_run_summary s ON g.gate_code = s.gate_code
+ORDER BY g.gate_code;
+
+-- Unresolved findings view (findings of each gate's latest run, if it failed)
+DROP VIEW IF EXISTS v_unresolved_findings;
+CREATE VIEW v_unresolved_findings AS
+SELECT
+    gf.gate_code,
+    g.gate_name,
+    gf.severity,
+    gf.artifact_path,
+    gf.message,
+    gf.created_at,
+    gr.git_sha,
+    gr.pr_number
+FROM gate_run_summary s
+JOIN gate_run gr ON gr.run_id = s.last_run_id
+JOIN gate_finding gf ON gf.run_id = gr.run_id AND gf.gate_code = s.gate_code
+JOIN gate g ON gf.gate_code = g.gate_code
+WHERE NOT gr.passed
+ORDER BY gf.severity, gf.created_at DESC;
+
+-- Daily gate trend view
+DROP VIEW IF EXISTS v_gate_daily_trend;
+CREATE VIEW v_gate_daily_trend AS
+SELECT
+    d.gate_code,
+    d.run_date,
+    d.runs,
+    d.passed_runs,
+    d.failed_runs,
+    d.error_count,
+    d.warning_count,
+    d.error_findings + d.warn_findings + d.info_findings as finding_count,
+    d.total_execution_time_ms * 1.0 / NULLIF(d.timed_runs, 0) as avg_execution_time_ms
+FROM gate_run_daily d
+ORDER BY d.run_date DESC, d.gate_code;
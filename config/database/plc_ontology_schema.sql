@@ -274,7 +274,9 @@ CREATE TABLE IF NOT EXISTS artifact_metadata (
     file_sha256 VARCHAR(64),
     last_parsed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     parse_valid BOOLEAN DEFAULT TRUE,
-    parse_errors JSON
+    parse_errors JSON,
+    file_size INTEGER,                  -- Change detection for `plc_db.py sync-artifacts`
+    file_mtime_ns INTEGER
 );
 
 CREATE INDEX idx_artifact_path ON artifact_metadata(artifact_path);
@@ -282,6 +284,8 @@ CREATE INDEX idx_artifact_ata_root ON artifact_metadata(ata_root);
 CREATE INDEX idx_artifact_aor ON artifact_metadata(aor);
 CREATE INDEX idx_artifact_type ON artifact_metadata(type);
 CREATE INDEX idx_artifact_status ON artifact_metadata(status);
+CREATE INDEX idx_artifact_aor_type_status ON artifact_metadata(aor, type, status);
+CREATE INDEX idx_artifact_ata_root_block ON artifact_metadata(ata_root, block);
 
 -- ============================================================================
 -- SECTION H: Link Integrity Tracking (for GATE-LINK-001 / KI-PR3-001)
@@ -352,40 +356,8 @@ INSERT OR IGNORE INTO cluster_membership_rule (cluster_id, rule_type, rule_opera
 -- VIEWS FOR REPORTING
 -- ============================================================================
 
--- Gate execution summary view
-CREATE VIEW IF NOT EXISTS v_gate_execution_summary AS
-SELECT 
-    g.gate_code,
-    g.gate_name,
-    g.implementation_status,
-    COUNT(gr.run_id) as total_runs,
-    SUM(CASE WHEN gr.passed THEN 1 ELSE 0 END) as passed_runs,
-    SUM(CASE WHEN NOT gr.passed THEN 1 ELSE 0 END) as failed_runs,
-    MAX(gr.run_timestamp) as last_run_timestamp,
-    AVG(gr.execution_time_ms) as avg_execution_time_ms
-FROM gate g
-LEFT JOIN gate_run gr ON g.gate_code = gr.gate_code
-GROUP BY g.gate_code, g.gate_name, g.implementation_status;
-
--- Unresolved findings view
-CREATE VIEW IF NOT EXISTS v_unresolved_findings AS
-SELECT 
-    gf.gate_code,
-    g.gate_name,
-    gf.severity,
-    gf.artifact_path,
-    gf.message,
-    gf.created_at,
-    gr.git_sha,
-    gr.pr_number
-FROM gate_finding gf
-JOIN gate_run gr ON gf.run_id = gr.run_id
-JOIN gate g ON gf.gate_code = g.gate_code
-WHERE gr.run_id = (
-    SELECT MAX(run_id) FROM gate_run WHERE gate_code = gf.gate_code
-)
-AND NOT gr.passed
-ORDER BY gf.severity, gf.created_at DESC;
+-- Gate execution summary and unresolved findings views are defined on the
+-- rollup tables in plc_history_schema.sql
 
 -- Broken links view
 CREATE VIEW IF NOT EXISTS v_broken_links AS
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Change Set
+===========================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Computes the set of files affected by a branch for incremental
+("changed-since") gate runs.
+
+The changed set is computed once with `git diff --name-status` against the
+merge base of <ref> and HEAD (working tree included, renames detected),
+plus untracked files. Reverse dependencies are added: Markdown files that
+mention the basename of a deleted or renamed file, so links pointing at
+the old location are re-validated.
+
+Gates consume the result as a partial RepoIndex, so a PR run scales with
+the size of the diff rather than the size of the portal.
+
+Usage:
+    from change_set import ChangeSet
+
+    changes = ChangeSet(Path('.'), 'origin/main')
+    index = changes.index()
+    results = validator.validate_directory(Path('.'), index=index)
+
+    # In a gate CLI
+    add_since_argument(parser)
+    changes = change_set_from_args(args, repo_root)   # None without --since
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set
+
+# Import shared repository index
+try:
+    from repo_index import RepoIndex
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex
+
+
+class ChangeSetError(Exception):
+    """Raised when the changed set cannot be computed from git."""
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A single entry from `git diff --name-status`."""
+    status: str                     # A, M, D, R, C, T (score stripped)
+    path: str                       # Current path, relative to the repo root
+    old_path: Optional[str] = None  # Source path for renames/copies
+
+
+class ChangeSet:
+    """Files changed since the merge base with a reference, plus dependents."""
+
+    def __init__(self, repo_root: Path, since: str,
+                 include_untracked: bool = True,
+                 reverse_dependencies: bool = True):
+        """
+        Compute the changed set.
+
+        Args:
+            repo_root: Repository root (or a directory inside it)
+            since: Git reference to diff against (via its merge base with HEAD)
+            include_untracked: Also treat untracked, non-ignored files as added
+            reverse_dependencies: Add Markdown files that reference deleted
+                                  or renamed files
+
+        Raises:
+            ChangeSetError: If git is unavailable or the reference is unknown
+        """
+        self.repo_root = Path(repo_root).resolve()
+        self.since = since
+
+        toplevel = self._git('rev-parse', '--show-toplevel').strip()
+        # Prefix of repo_root inside the git work tree ('' when identical)
+        prefix = os.path.relpath(str(self.repo_root), toplevel)
+        self._prefix = '' if prefix == '.' else prefix.replace(os.sep, '/') + '/'
+
+        try:
+            self.merge_base = self._git('merge-base', since, 'HEAD').strip()
+        except ChangeSetError:
+            # No common ancestor (e.g. shallow clone); diff against the ref itself
+            self.merge_base = self._git('rev-parse', '--verify', f'{since}^{{commit}}').strip()
+
+        self.changes: List[FileChange] = self._diff()
+        if include_untracked:
+            self.changes.extend(self._untracked())
+
+        # Current paths of added, modified, renamed and copied files
+        self.changed_paths: Set[str] = {
+            c.path for c in self.changes if c.status != 'D'
+        }
+        # Paths that no longer exist: deletions and rename sources
+        self.removed_paths: Set[str] = {
+            c.path for c in self.changes if c.status == 'D'
+        }
+        self.removed_paths.update(
+            c.old_path for c in self.changes if c.status == 'R' and c.old_path
+        )
+
+        self.dependents: Set[str] = set()
+        if reverse_dependencies:
+            self.dependents = self._reverse_dependencies() - self.changed_paths
+
+        # Files a gate should re-validate: changes plus reverse dependencies
+        self.affected_paths: Set[str] = self.changed_paths | self.dependents
+
+    def _git(self, *args: str, no_match_ok: bool = False) -> str:
+        """
+        Run a git command in the repository and return its stdout.
+
+        With no_match_ok, exit status 1 (git grep: nothing found) yields ''.
+        """
+        try:
+            result = subprocess.run(
+                ['git', *args], capture_output=True, text=True, cwd=self.repo_root
+            )
+        except OSError as e:
+            raise ChangeSetError(f"git not available: {e}")
+        if no_match_ok and result.returncode == 1:
+            return ''
+        if result.returncode != 0:
+            raise ChangeSetError(
+                f"git {' '.join(args)} failed: {result.stderr.strip()}"
+            )
+        return result.stdout
+
+    def _relative(self, git_path: str) -> Optional[str]:
+        """Map a work-tree path to a repo_root-relative path (None if outside)."""
+        if not git_path.startswith(self._prefix):
+            return None
+        return git_path[len(self._prefix):]
+
+    def _diff(self) -> List[FileChange]:
+        """Parse `git diff --name-status -M -z` against the merge base."""
+        fields = self._git(
+            'diff', '--name-status', '-M', '-z', self.merge_base, '--', '.'
+        ).split('\0')
+
+        changes = []
+        i = 0
+        while i < len(fields) and fields[i]:
+            status = fields[i][0]
+            if status in ('R', 'C'):
+                old_path, new_path = fields[i + 1], fields[i + 2]
+                i += 3
+            else:
+                old_path, new_path = None, fields[i + 1]
+                i += 2
+
+            path = self._relative(new_path)
+            old = self._relative(old_path) if old_path else None
+            if path is None:
+                if old is not None and status == 'R':
+                    # Renamed out of this subtree: a deletion from our view
+                    changes.append(FileChange('D', old))
+                continue
+            changes.append(FileChange(status, path, old))
+        return changes
+
+    def _untracked(self) -> List[FileChange]:
+        """Untracked, non-ignored files reported as additions."""
+        # ls-files reports paths relative to the current directory (repo_root)
+        output = self._git('ls-files', '--others', '--exclude-standard', '-z', '--', '.')
+        return [FileChange('A', p) for p in output.split('\0') if p]
+
+    def _reverse_dependencies(self) -> Set[str]:
+        """Markdown files mentioning the basename of a removed path."""
+        names = sorted({Path(p).name for p in self.removed_paths})
+        if not names:
+            return set()
+
+        args = ['grep', '-l', '-z', '--fixed-strings']
+        for name in names:
+            args.extend(['-e', name])
+        args.extend(['--', '*.md'])
+        output = self._git(*args, no_match_ok=True)
+        # git grep reports paths relative to the current directory (repo_root)
+        return {p for p in output.split('\0') if p}
+
+    # =========================================================================
+    # Views
+    # =========================================================================
+
+    def is_affected(self, rel_path: str) -> bool:
+        """Check whether a repo_root-relative POSIX path is affected."""
+        return rel_path in self.affected_paths
+
+    def index(self, config_path: Optional[str] = None) -> RepoIndex:
+        """Partial repository index over the affected files only."""
+        return RepoIndex(self.repo_root, config_path=config_path,
+                         paths=self.affected_paths)
+
+    def summary(self) -> str:
+        """One-line description for gate output."""
+        return (f"Changed since {self.since} ({self.merge_base[:12]}): "
+                f"{len(self.changed_paths)} changed, {len(self.removed_paths)} removed, "
+                f"{len(self.dependents)} dependent file(s)")
+
+
+def add_since_argument(parser) -> None:
+    """Add the common --since option to a gate CLI."""
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only validate files changed since the merge base with REF '
+             '(plus files referencing removed/renamed paths)'
+    )
+
+
+def change_set_from_args(args, repo_root: Path) -> Optional[ChangeSet]:
+    """
+    Build the change set selected by --since, printing its summary.
+
+    Returns None when --since was not given. ChangeSetError propagates so
+    the gate can exit with a script error instead of silently scanning
+    everything.
+    """
+    since = getattr(args, 'since', None)
+    if not since:
+        return None
+    changes = ChangeSet(repo_root, since)
+    print(f"🔀 {changes.summary()}", file=sys.stderr)
+    return changes
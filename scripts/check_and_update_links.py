@@ -14,38 +14,78 @@ Features:
 Usage:
     python scripts/check_and_update_links.py --check-only
     python scripts/check_and_update_links.py --update
+    python scripts/check_and_update_links.py --update --db-path plc_ontology.db
     python scripts/check_and_update_links.py --generate-reports
+
+With --db-path, --update asks the PLC database's full-text content index
+which Markdown/JSON files mention an old path, and rewrites only those
+instead of running every rename over every file. Within a Markdown file
+only the renames its link targets refer to are applied (RenameMap lookup).
+Links are checked with the shared single-pass extractor (link_extractor.py).
 """
 
 import argparse
-import csv
 import json
 import re
+import sqlite3
 import sys
 import yaml
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from collections import defaultdict
 
+# Import PLC database (full-text content index), shared rename map, repository
+# index and link extractor
+try:
+    from plc_db import PLCDatabase
+    from rename_map import RenameMap, markdown_link_targets
+    from repo_index import RepoIndex
+    from link_extractor import INLINE, read_links
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from plc_db import PLCDatabase
+    from rename_map import RenameMap, markdown_link_targets
+    from repo_index import RepoIndex
+    from link_extractor import INLINE, read_links
+
 
 class LinkChecker:
     """Check and update internal links after v5.0 retrofit."""
     
-    def __init__(self, rename_map_path: str = "rename_map_v5.csv"):
-        """Initialize with rename map."""
-        self.rename_map = self._load_rename_map(rename_map_path)
-        self.old_to_new = {entry['old_path']: entry['new_path'] for entry in self.rename_map}
+    def __init__(self, rename_map_path: str = "rename_map_v5.csv",
+                 db_path: Optional[str] = None):
+        """Initialize with rename map and optional PLC database (content index)."""
+        self.renames = RenameMap.from_csv([rename_map_path])
+        self.rename_map = self.renames.rows
+        self.old_to_new = self.renames.old_to_new
         self.broken_links = []
         self.updated_files = []
+        self.content_db = PLCDatabase(db_path) if db_path else None
         
-    def _load_rename_map(self, csv_path: str) -> List[Dict[str, str]]:
-        """Load rename map from CSV."""
-        entries = []
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                entries.append(row)
-        return entries
+    def _files_mentioning_old_paths(self, directory: Path, suffix: str) -> Optional[Set[Path]]:
+        """
+        Files under directory whose content contains any old path.
+        
+        Refreshes the content index for directory, then probes it once per
+        rename entry. Returns None when no index is in use (or it cannot
+        answer), in which case every file has to be checked.
+        """
+        if self.content_db is None:
+            return None
+        if any(len(old_path) < PLCDatabase.MIN_CONTENT_QUERY_LENGTH for old_path in self.old_to_new):
+            return None
+        try:
+            if not Path(self.content_db.db_path).exists():
+                self.content_db.initialize_database()
+            self.content_db.sync_content_index(directory)
+            candidates = set()
+            for old_path in self.old_to_new:
+                candidates.update(self.content_db.find_content(old_path, suffixes={suffix}))
+        except (sqlite3.Error, OSError) as e:
+            print(f"  Warning: Content index unavailable, checking every file: {e}")
+            self.content_db = None
+            return None
+        return {directory / rel_path for rel_path in candidates}
     
     def check_markdown_links(self, directory: Path = Path('.')) -> List[Dict[str, any]]:
         """
@@ -65,16 +105,17 @@ class LinkChecker:
         
         print(f"Found {len(md_files)} Markdown files to check")
         
+        # Link targets are resolved and checked against one walk of the tree
+        index = RepoIndex(directory, parse_fields=False)
+        root = directory.resolve()
+        
         for md_file in md_files:
-            content = md_file.read_text(encoding='utf-8', errors='ignore')
-            
             # Find Markdown links: [text](path)
-            link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-            matches = re.finditer(link_pattern, content)
-            
-            for match in matches:
-                link_text = match.group(1)
-                link_path = match.group(2)
+            for link in read_links(md_file):
+                if link.kind != INLINE:
+                    continue
+                link_text = link.text
+                link_path = link.target
                 
                 # Skip external links
                 if link_path.startswith('http://') or link_path.startswith('https://'):
@@ -88,11 +129,11 @@ class LinkChecker:
                     target_path = Path(link_path.lstrip('/'))
                 else:
                     # Relative to current file
-                    target_path = (md_file.parent / link_path).resolve().relative_to(directory.resolve())
+                    target_path = index.resolve(md_file.parent / link_path).relative_to(root)
                 
                 # Check if target exists
                 full_target = directory / target_path
-                if not full_target.exists():
+                if not index.exists(full_target):
                     # Check if this was an old path that was renamed
                     target_str = str(target_path)
                     if target_str in self.old_to_new:
@@ -129,12 +170,24 @@ class LinkChecker:
         excluded_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'docs', 'config'}
         md_files = [f for f in md_files if not any(exc in f.parts for exc in excluded_dirs)]
         
+        # A file can only change if it mentions an old path
+        candidates = self._files_mentioning_old_paths(directory, '.md')
+        if candidates is not None:
+            md_files = [f for f in md_files if f in candidates]
+        
         for md_file in md_files:
             content = md_file.read_text(encoding='utf-8', errors='ignore')
             original_content = content
             
+            # Only renames the file's link targets refer to can change it.
+            # Targets are taken with the rewrite patterns' own syntax, so
+            # link text wrapped onto the next line is not missed
+            renames = self.renames.referenced_by(markdown_link_targets(content))
+            if not renames:
+                continue
+            
             # Update links
-            for old_path, new_path in self.old_to_new.items():
+            for old_path, new_path in renames:
                 # Match various link formats
                 patterns = [
                     (rf'\[([^\]]+)\]\({re.escape(old_path)}\)', rf'[\1]({new_path})'),
@@ -168,6 +221,13 @@ class LinkChecker:
         excluded_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'config'}
         manifest_files = [f for f in manifest_files if not any(exc in f.parts for exc in excluded_dirs)]
         
+        # JSON is in the content index; YAML is always checked
+        candidates = self._files_mentioning_old_paths(directory, '.json')
+        if candidates is not None:
+            manifest_files = [
+                f for f in manifest_files if f.suffix != '.json' or f in candidates
+            ]
+        
         for manifest_file in manifest_files:
             try:
                 content = manifest_file.read_text(encoding='utf-8')
@@ -384,6 +444,11 @@ Examples:
         default='rename_map_v5.csv',
         help='Path to rename map CSV'
     )
+    parser.add_argument(
+        '--db-path',
+        help='Select files to update via the content index of this PLC database '
+             '(refreshed incrementally; created if missing)'
+    )
     
     args = parser.parse_args()
     
@@ -393,7 +458,7 @@ Examples:
     
     # Initialize checker
     try:
-        checker = LinkChecker(args.rename_map)
+        checker = LinkChecker(args.rename_map, db_path=args.db_path)
     except FileNotFoundError:
         print(f"Error: Rename map not found: {args.rename_map}", file=sys.stderr)
         return 2
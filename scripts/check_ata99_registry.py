@@ -98,13 +98,17 @@ class ATA99RegistryChecker:
         
         for manifest_file in manifest_files:
             try:
-                content = manifest_file.read_text(encoding='utf-8', errors='ignore')
+                raw = manifest_file.read_bytes()
+                content = raw.decode('utf-8', errors='ignore')
+                artifact_sha256 = None  # Hashed once, on the first match
                 
                 # Look for namespace ID patterns in content
                 for ns_type, pattern in self.NAMESPACE_PATTERNS.items():
                     matches = re.finditer(pattern, content)
                     for match in matches:
                         namespace_id = match.group(0)
+                        if artifact_sha256 is None:
+                            artifact_sha256 = hashlib.sha256(raw).hexdigest()
                         
                         # Try to extract additional context from JSON/YAML
                         # This is a simple implementation; could be enhanced
@@ -114,7 +118,7 @@ class ATA99RegistryChecker:
                             scope='ATA99',
                             owner_aor='DATA',  # Default, should be extracted from context
                             artifact_path=str(manifest_file.relative_to(directory)),
-                            artifact_sha256=self._compute_file_hash(manifest_file),
+                            artifact_sha256=artifact_sha256,
                             description=None
                         ))
                 
@@ -134,20 +138,30 @@ class ATA99RegistryChecker:
         print("Registering namespaces in database...")
         count = 0
         
-        for entry in entries:
-            try:
-                self.db.register_namespace(
-                    namespace_id=entry.namespace_id,
-                    namespace_type=entry.namespace_type,
-                    owner_aor=entry.owner_aor,
-                    artifact_path=entry.artifact_path,
-                    scope=entry.scope,
-                    artifact_sha256=entry.artifact_sha256,
-                    description=entry.description
-                )
-                count += 1
-            except Exception as e:
-                print(f"  Warning: Failed to register {entry.namespace_id}: {e}")
+        rows = [
+            {
+                'namespace_id': entry.namespace_id,
+                'namespace_type': entry.namespace_type,
+                'owner_aor': entry.owner_aor,
+                'artifact_path': entry.artifact_path,
+                'scope': entry.scope,
+                'artifact_sha256': entry.artifact_sha256,
+                'description': entry.description,
+            }
+            for entry in entries
+        ]
+        
+        try:
+            count = self.db.register_namespaces(rows)
+        except Exception:
+            # Fall back to one row at a time to report the failing entries
+            with self.db.transaction():
+                for row in rows:
+                    try:
+                        self.db.register_namespace(**row)
+                        count += 1
+                    except Exception as e:
+                        print(f"  Warning: Failed to register {row['namespace_id']}: {e}")
         
         print(f"Registered {count} namespace entries")
         return count
@@ -307,15 +321,15 @@ def run_gate_004(db_path: str = "plc_ontology.db", directory: Path = Path('.'))
     )
     
     # Record findings
-    for conflict in checker.conflicts:
-        checker.db.record_gate_finding(
-            run_id=run_id,
-            gate_code='GATE-004',
-            severity='ERROR',
-            message=f"Duplicate namespace ID: {conflict['namespace_id']} ({conflict['count']} occurrences)",
-            finding_code='NAMESPACE_DUPLICATE',
-            details=conflict
-        )
+    checker.db.record_gate_findings(run_id, 'GATE-004', (
+        {
+            'severity': 'ERROR',
+            'message': f"Duplicate namespace ID: {conflict['namespace_id']} ({conflict['count']} occurrences)",
+            'finding_code': 'NAMESPACE_DUPLICATE',
+            'details': conflict,
+        }
+        for conflict in checker.conflicts
+    ))
     
     return (passed, report)
 
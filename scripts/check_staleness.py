@@ -29,7 +29,18 @@ import sys
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Import shared filename parser, repository index and change set
+try:
+    import nomenclature
+    from repo_index import RepoIndex, index_for
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    import nomenclature
+    from repo_index import RepoIndex, index_for
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 
 # Staleness thresholds (in days)
 DEFAULT_THRESHOLD_DAYS = 90
@@ -71,17 +82,22 @@ class StaleArtifact:
 class StalenessDetector:
     """Detects stale artifacts in the repository."""
     
-    def __init__(self, repo_root: Path, threshold_days: int = DEFAULT_THRESHOLD_DAYS):
+    def __init__(self, repo_root: Path, threshold_days: int = DEFAULT_THRESHOLD_DAYS,
+                 index: Optional[RepoIndex] = None):
         self.repo_root = repo_root
         self.threshold_days = threshold_days
         self.stale_artifacts: List[StaleArtifact] = []
         self.checked_files = 0
         self.excluded_dirs = {'.git', 'node_modules', '__pycache__', '.github', '.vscode'}
+        self.index = index
+        self._mtimes: Dict[Path, float] = {}
     
     def get_file_age_days(self, file_path: Path) -> int:
         """Get the age of a file in days."""
         try:
-            mtime = os.path.getmtime(file_path)
+            mtime = self._mtimes.get(file_path)
+            if mtime is None:
+                mtime = os.path.getmtime(file_path)
             file_time = datetime.fromtimestamp(mtime)
             age = datetime.now() - file_time
             return age.days
@@ -90,6 +106,11 @@ class StalenessDetector:
     
     def extract_status_from_filename(self, filename: str) -> str:
         """Extract status from filename using v6.0 nomenclature."""
+        fields = nomenclature.parse(filename)
+        if fields:
+            return fields.status if fields.status in STATUS_PATTERNS else "UNKNOWN"
+        
+        # Non-conforming name: look for a status suffix anywhere
         for status, pattern in STATUS_PATTERNS.items():
             if re.search(pattern, filename):
                 return status
@@ -97,7 +118,11 @@ class StalenessDetector:
     
     def extract_type_from_filename(self, filename: str) -> str:
         """Extract TYPE code from v6.0 nomenclature filename."""
-        # Pattern: ..._{TYPE}_I##-R##_{STATUS}.ext
+        fields = nomenclature.parse(filename)
+        if fields:
+            return fields.type
+        
+        # Non-conforming name. Pattern: ..._{TYPE}_I##-R##_{STATUS}.ext
         match = re.search(r'_([A-Z]{2,8})_I\d{2}-R\d{2}_', filename)
         if match:
             return match.group(1)
@@ -188,31 +213,29 @@ class StalenessDetector:
         print(f"   Threshold: {self.threshold_days} days")
         print(f"   Root: {self.repo_root}")
         
-        for root, dirs, files in os.walk(self.repo_root):
-            # Remove excluded directories from search
-            dirs[:] = [d for d in dirs if d not in self.excluded_dirs]
+        # Text files only, skipping excluded directories and templates
+        self.index = index_for(self.repo_root, self.index)
+        prefix = self.index.relative_prefix(self.repo_root)
+        entries = self.index.files(
+            under=self.repo_root,
+            suffixes={'.md', '.json', '.yaml', '.yml', '.csv', '.txt'},
+            exclude_dirs=self.excluded_dirs | {'templates'}
+        )
+        
+        for entry in entries:
+            file_path = self.repo_root / entry.rel_path[len(prefix):]
+            self._mtimes[file_path] = entry.mtime
             
-            for file in files:
-                file_path = Path(root) / file
-                
-                # Skip non-text files
-                if file_path.suffix not in ['.md', '.json', '.yaml', '.yml', '.csv', '.txt']:
-                    continue
-                
-                # Skip templates
-                if '/templates/' in str(file_path):
-                    continue
-                
-                self.checked_files += 1
-                
-                if check_derived_only:
-                    self.check_derived_artifact_staleness(file_path)
-                else:
-                    self.check_draft_staleness(file_path)
-                    self.check_obsolete_staleness(file_path)
-                    self.check_derived_artifact_staleness(file_path)
-                    # Uncomment to check general staleness (can be noisy)
-                    # self.check_general_staleness(file_path)
+            self.checked_files += 1
+            
+            if check_derived_only:
+                self.check_derived_artifact_staleness(file_path)
+            else:
+                self.check_draft_staleness(file_path)
+                self.check_obsolete_staleness(file_path)
+                self.check_derived_artifact_staleness(file_path)
+                # Uncomment to check general staleness (can be noisy)
+                # self.check_general_staleness(file_path)
     
     def print_summary(self) -> None:
         """Print staleness detection summary."""
@@ -279,6 +302,7 @@ def main():
         default='.',
         help='Repository root path (default: current directory)'
     )
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
@@ -288,7 +312,15 @@ def main():
         print(f"❌ Error: Repository root not found: {repo_root}", file=sys.stderr)
         return 2
     
-    detector = StalenessDetector(repo_root, args.threshold_days)
+    try:
+        # Restrict the scan to files changed since --since REF
+        changes = change_set_from_args(args, repo_root)
+    except ChangeSetError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    
+    detector = StalenessDetector(repo_root, args.threshold_days,
+                                 index=changes.index() if changes else None)
     
     try:
         detector.scan_repository(check_derived_only=args.check_derived_only)
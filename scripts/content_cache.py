@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Content Cache
+==============================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Persistent on-disk content/parse cache shared by the governance gates.
+
+Each file is keyed by (path, size, mtime_ns, inode). Derived data - the
+SHA-256 digest, extracted links, identifier and evidence matches, parsed
+JSON/YAML - is stored per file as named facets. When a file's key changes
+all its facets are dropped, so a warm re-run only re-reads files that
+actually changed. The cache is bounded by total payload size and evicts
+least recently used files first.
+
+The cache lives in a SQLite sidecar next to plc_ontology.db
+(plc_content_cache.db by default).
+
+Usage:
+    from content_cache import ContentCache
+
+    with ContentCache.beside("plc_ontology.db") as cache:
+        digest = cache.sha256(path)
+        data = cache.load_json(path)
+        links = cache.get(path, "trace_links", extract)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import yaml
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Import process-wide JSON memo
+try:
+    from json_cache import JSON_CACHE
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from json_cache import JSON_CACHE
+
+
+DEFAULT_CACHE_DB = "plc_content_cache.db"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Fraction of max_bytes to shrink to once eviction kicks in
+EVICTION_TARGET = 0.9
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_file (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    payload_bytes INTEGER NOT NULL DEFAULT 0,
+    last_access REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cache_facet (
+    path TEXT NOT NULL REFERENCES cache_file(path) ON DELETE CASCADE,
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (path, facet)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cache_file_access ON cache_file(last_access);
+"""
+
+FileKey = Tuple[int, int, int]
+
+
+class ContentCache:
+    """
+    Persistent per-file cache of derived content.
+
+    A cache created without a database path is disabled: every lookup
+    simply computes its value, so gates can hold a cache unconditionally.
+    """
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_DB,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache.
+
+        Args:
+            db_path: Path to the SQLite cache file, or None to disable caching
+            max_bytes: Upper bound on stored payload before LRU eviction
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._keys: Dict[str, FileKey] = {}
+        self._payload: Dict[str, int] = {}
+        self._touched: Dict[str, float] = {}
+
+        if db_path:
+            try:
+                self._open()
+            except sqlite3.Error as e:
+                print(f"Warning: Content cache unavailable ({db_path}): {e}",
+                      file=sys.stderr)
+                self._conn = None
+
+    @classmethod
+    def beside(cls, plc_db_path: str = "plc_ontology.db",
+               max_bytes: int = DEFAULT_MAX_BYTES) -> 'ContentCache':
+        """Open the cache sidecar next to a PLC ontology database."""
+        return cls(str(Path(plc_db_path).with_name(DEFAULT_CACHE_DB)), max_bytes)
+
+    @classmethod
+    def disabled(cls) -> 'ContentCache':
+        """Return a pass-through cache that stores nothing."""
+        return cls(None)
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def _open(self) -> None:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(CACHE_SCHEMA)
+        for path, size, mtime_ns, inode, payload in conn.execute(
+                "SELECT path, size, mtime_ns, inode, payload_bytes FROM cache_file"):
+            self._keys[path] = (size, mtime_ns, inode)
+            self._payload[path] = payload
+        self._conn = conn
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    @staticmethod
+    def _file_key(path: Path, entry: Any = None) -> Tuple[str, FileKey]:
+        """Return (cache path, key) from an index entry or a fresh stat."""
+        if entry is not None:
+            return str(entry.path), (entry.size, entry.mtime_ns, entry.inode)
+        key_path = os.path.abspath(path)
+        st = os.stat(key_path)
+        return key_path, (st.st_size, st.st_mtime_ns, st.st_ino)
+
+    def _validate(self, key_path: str, key: FileKey) -> bool:
+        """
+        Check a file's cached key, invalidating its facets on mismatch.
+
+        Returns True if the existing facets are still valid.
+        """
+        if self._keys.get(key_path) == key:
+            return True
+        size, mtime_ns, inode = key
+        self._conn.execute("DELETE FROM cache_facet WHERE path = ?", (key_path,))
+        self._conn.execute("""
+            INSERT INTO cache_file (path, size, mtime_ns, inode, payload_bytes, last_access)
+            VALUES (?, ?, ?, ?, 0, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size = excluded.size, mtime_ns = excluded.mtime_ns,
+                inode = excluded.inode, payload_bytes = 0,
+                last_access = excluded.last_access
+        """, (key_path, size, mtime_ns, inode, time.time()))
+        self._keys[key_path] = key
+        self._payload[key_path] = 0
+        return False
+
+    def get(self, path: Path, facet: str, compute: Callable[[Path], Any],
+            entry: Any = None, verify: bool = False) -> Any:
+        """
+        Return a cached facet for a file, computing and storing it on a miss.
+
+        Args:
+            path: File the facet is derived from
+            facet: Facet name (include a version/config tag if the
+                   computation depends on anything besides file content)
+            compute: Called with ``path`` on a miss; must return a
+                     JSON-serializable value. Exceptions propagate and
+                     nothing is cached.
+            entry: Optional RepoIndex entry, saves a stat() call
+            verify: Only cache values that survive a JSON round-trip
+                    unchanged (e.g. YAML mappings with non-string keys)
+
+        Returns:
+            The facet value
+        """
+        if self._conn is None:
+            return compute(path)
+
+        try:
+            key_path, key = self._file_key(path, entry)
+        except OSError:
+            return compute(path)
+
+        if self._validate(key_path, key):
+            row = self._conn.execute(
+                "SELECT value FROM cache_facet WHERE path = ? AND facet = ?",
+                (key_path, facet)).fetchone()
+            if row is not None:
+                self.hits += 1
+                self._touched[key_path] = time.time()
+                return json.loads(row[0])
+
+        self.misses += 1
+        value = compute(path)
+        try:
+            encoded = json.dumps(value, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return value  # Not JSON-representable (e.g. YAML dates); skip caching
+        if verify and json.loads(encoded) != value:
+            return value
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache_facet (path, facet, value) VALUES (?, ?, ?)",
+            (key_path, facet, encoded))
+        self._payload[key_path] = self._payload.get(key_path, 0) + len(encoded)
+        self._conn.execute(
+            "UPDATE cache_file SET payload_bytes = ? WHERE path = ?",
+            (self._payload[key_path], key_path))
+        self._touched[key_path] = time.time()
+        return value
+
+    # =========================================================================
+    # Common facets
+    # =========================================================================
+
+    def sha256(self, path: Path, entry: Any = None) -> str:
+        """SHA-256 hex digest of a file's content."""
+        def compute(p: Path) -> str:
+            sha256 = hashlib.sha256()
+            with open(p, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    sha256.update(chunk)
+            return sha256.hexdigest()
+        return self.get(path, 'sha256', compute, entry)
+
+    def load_json(self, path: Path, entry: Any = None) -> Any:
+        """
+        Parsed JSON content of a file (errors are raised, not cached).
+
+        Served from the process-wide JSON memo, which falls back to this
+        cache's 'json' facet, so the result is shared and read-only.
+        """
+        def compute(p: Path) -> Any:
+            with open(p, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return JSON_CACHE.load(
+            path, entry, parse=lambda p: self.get(p, 'json', compute, entry))
+
+    def load_yaml(self, path: Path, entry: Any = None) -> Any:
+        """Parsed YAML content of a file (errors are raised, not cached)."""
+        def compute(p: Path) -> Any:
+            with open(p, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        return self.get(path, 'yaml', compute, entry, verify=True)
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def flush(self) -> None:
+        """Persist access times, enforce the size bound and commit."""
+        if self._conn is None:
+            return
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE cache_file SET last_access = ? WHERE path = ?",
+                [(t, p) for p, t in self._touched.items()])
+            self._touched.clear()
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used files until under the size bound."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(payload_bytes), 0) FROM cache_file").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * EVICTION_TARGET)
+        victims: List[str] = []
+        for path, payload in self._conn.execute(
+                "SELECT path, payload_bytes FROM cache_file ORDER BY last_access"):
+            if total <= target:
+                break
+            victims.append(path)
+            total -= payload
+
+        self._conn.executemany("DELETE FROM cache_file WHERE path = ?",
+                               [(p,) for p in victims])
+        for path in victims:
+            self._keys.pop(path, None)
+            self._payload.pop(path, None)
+
+    def prune_missing(self) -> int:
+        """Remove entries for files that no longer exist. Returns count."""
+        if self._conn is None:
+            return 0
+        gone = [p for p in self._keys if not os.path.exists(p)]
+        self._conn.executemany("DELETE FROM cache_file WHERE path = ?",
+                               [(p,) for p in gone])
+        for path in gone:
+            self._keys.pop(path, None)
+            self._payload.pop(path, None)
+        return len(gone)
+
+    def close(self) -> None:
+        """Flush and close the cache."""
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'ContentCache':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def add_cache_arguments(parser) -> None:
+    """Add the common --cache-db / --no-cache options to a gate CLI."""
+    parser.add_argument(
+        '--cache-db',
+        metavar='PATH',
+        help=f'Content cache database (default: {DEFAULT_CACHE_DB} next to the PLC database)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the persistent content cache'
+    )
+
+
+def cache_from_args(args, plc_db_path: str = "plc_ontology.db") -> ContentCache:
+    """Open the content cache selected by add_cache_arguments() options."""
+    if getattr(args, 'no_cache', False):
+        return ContentCache.disabled()
+    if getattr(args, 'cache_db', None):
+        return ContentCache(args.cache_db)
+    return ContentCache.beside(plc_db_path)
@@ -36,7 +36,7 @@ import sys
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from collections import defaultdict
 
 
@@ -47,6 +47,12 @@ try:
 except ImportError:
     NomenclatureValidator = None
 
+try:
+    from repo_index import RepoIndex
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex
+
 
 @dataclass
 class DriftItem:
@@ -211,6 +217,7 @@ class DriftDetector:
         r'scaffold\.py',
         r'pre-commit',
         r'.*\.py[cod]$',
+        r'plc_.*\.db(-wal|-shm)?$',
     ]
 
     def __init__(
@@ -218,7 +225,8 @@ class DriftDetector:
         repo_root: Path = Path('.'),
         repository: str = "",
         branch: str = "main",
-        verbose: bool = False
+        verbose: bool = False,
+        index: Optional[RepoIndex] = None
     ):
         """
         Initialize drift detector.
@@ -228,8 +236,10 @@ class DriftDetector:
             repository: Repository name (owner/repo)
             branch: Current branch name
             verbose: Enable verbose output
+            index: Shared repository index (walked on first use if not given)
         """
         self.repo_root = repo_root
+        self._index = index
         self.repository = repository
         self.branch = branch
         self.verbose = verbose
@@ -257,6 +267,23 @@ class DriftDetector:
 
         return False
 
+    @property
+    def index(self) -> RepoIndex:
+        """Repository index shared by all detection passes."""
+        if self._index is None or not self._index.covers(self.repo_root):
+            self._index = RepoIndex(self.repo_root)
+        return self._index
+
+    def _scan_paths(self, suffixes: Optional[set] = None) -> List[Path]:
+        """Non-excluded files under the repository root, from the index."""
+        return self.index.paths(
+            under=self.repo_root,
+            suffixes=suffixes,
+            exclude_dirs=self.EXCLUDED_DIRS,
+            exclude_files=self.EXCLUDED_FILES,
+            exclude_patterns=self.EXCLUDED_PATTERNS
+        )
+
     def _log(self, message: str) -> None:
         """Print message if verbose mode is enabled."""
         if self.verbose:
@@ -289,12 +316,7 @@ class DriftDetector:
         identifiers: Dict[str, List[Path]] = defaultdict(list)
         invalid_files: List[tuple] = []
 
-        for path in self.repo_root.rglob('*'):
-            if not path.is_file():
-                continue
-            if self._is_excluded_path(path):
-                continue
-
+        for path in self._scan_paths():
             result = validator.validate_file_path(path)
 
             if not result.valid:
@@ -380,10 +402,7 @@ class DriftDetector:
         schema_hashes: Dict[str, Dict[str, str]] = defaultdict(dict)
 
         # Scan for JSON schema files
-        for path in self.repo_root.rglob('*.json'):
-            if self._is_excluded_path(path):
-                continue
-
+        for path in self._scan_paths({'.json'}):
             try:
                 with open(path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -458,10 +477,7 @@ class DriftDetector:
         link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
         broken_links: List[tuple] = []
 
-        for path in self.repo_root.rglob('*.md'):
-            if self._is_excluded_path(path):
-                continue
-
+        for path in self._scan_paths({'.md'}):
             try:
                 with open(path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -559,14 +575,7 @@ class DriftDetector:
 
         identifiers: Dict[str, List[Path]] = defaultdict(list)
 
-        for path in self.repo_root.rglob('*'):
-            if not path.is_file():
-                continue
-            if self._is_excluded_path(path):
-                continue
-            if path.suffix not in {'.md', '.json', '.yaml', '.yml', '.csv'}:
-                continue
-
+        for path in self._scan_paths({'.md', '.json', '.yaml', '.yml', '.csv'}):
             try:
                 with open(path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -610,12 +619,7 @@ class DriftDetector:
         """
         print("🔍 Checking file integrity...")
 
-        for path in self.repo_root.rglob('*'):
-            if not path.is_file():
-                continue
-            if self._is_excluded_path(path):
-                continue
-
+        for path in self._scan_paths():
             try:
                 stat = path.stat()
 
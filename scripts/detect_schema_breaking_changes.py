@@ -481,20 +481,20 @@ def run_gate_007(
     )
     
     # Record findings
-    for change in detector.breaking_changes:
-        detector.db.record_gate_finding(
-            run_id=run_id,
-            gate_code='GATE-007',
-            severity='ERROR',
-            message=f"Breaking change: {change.change_type.value} on {change.field_path}",
-            finding_code=change.change_type.value,
-            details={
+    detector.db.record_gate_findings(run_id, 'GATE-007', (
+        {
+            'severity': 'ERROR',
+            'message': f"Breaking change: {change.change_type.value} on {change.field_path}",
+            'finding_code': change.change_type.value,
+            'details': {
                 'field_path': change.field_path,
                 'old_value': str(change.old_value),
                 'new_value': str(change.new_value),
                 'severity': change.severity
             }
-        )
+        }
+        for change in detector.breaking_changes
+    ))
     
     return (passed, report)
 
@@ -34,13 +34,25 @@ Exit codes:
 
 import argparse
 import csv
+import hashlib
 import json
 import os
 import re
 import sys
 import yaml  # Requires PyYAML>=6.0 (declared in scripts/requirements.txt)
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+# Import shared repository index, content cache and change set
+try:
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 
 # Known official registries (whitelist)
 OFFICIAL_REGISTRIES = {
@@ -73,6 +85,14 @@ REGISTRY_COLUMN_PATTERNS = {
     'id_allocation': ['id', 'identifier', 'canonical_id', 'uuid'],
 }
 
+# Markdown table rows with registry-like headers
+REGISTRY_TABLE_PATTERN = r'\|[^\n]*(?:schema|namespace|identifier|registry)[^\n]*\|'
+
+# Cache facet of _scan_markdown_table, tagged with the pattern and whitelist it depends on
+SHADOW_TABLE_FACET = 'shadow_table:' + hashlib.sha256(
+    json.dumps([REGISTRY_TABLE_PATTERN, sorted(OFFICIAL_REGISTRIES)]).encode()
+).hexdigest()[:12]
+
 
 class ShadowRegistry:
     """Represents a detected shadow registry."""
@@ -93,11 +113,14 @@ class ShadowRegistry:
 class ShadowRegistryDetector:
     """Detects shadow registries in the repository."""
     
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None):
         self.repo_root = repo_root
         self.shadow_registries: List[ShadowRegistry] = []
         self.checked_files = 0
         self.excluded_dirs = {'.git', 'node_modules', '__pycache__', '.github', '.vscode', 'templates'}
+        self.index = index
+        self.cache = cache or ContentCache.disabled()
     
     def is_official_registry(self, file_path: Path) -> bool:
         """Check if file is an official registry."""
@@ -147,8 +170,7 @@ class ShadowRegistryDetector:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.cache.load_json(file_path)
             
             # Check for arrays of schemas or namespaces
             if isinstance(data, dict):
@@ -181,8 +203,7 @@ class ShadowRegistryDetector:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self.cache.load_yaml(file_path)
             
             if isinstance(data, dict):
                 for key in data.keys():
@@ -212,28 +233,35 @@ class ShadowRegistryDetector:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            row_count, references_official = self.cache.get(
+                file_path, SHADOW_TABLE_FACET, self._scan_markdown_table
+            )
             
-            # Look for tables with suspicious headers
-            table_pattern = r'\|[^\n]*(?:schema|namespace|identifier|registry)[^\n]*\|'
-            matches = re.findall(table_pattern, content, re.IGNORECASE)
-            
-            if len(matches) >= 3:  # At least a header and 2 rows
+            if row_count >= 3:  # At least a header and 2 rows
                 # Check if it's not just a reference to official registries
-                if not any(reg_name in content for reg_name in OFFICIAL_REGISTRIES):
+                if not references_official:
                     self.shadow_registries.append(
                         ShadowRegistry(
                             path=file_path.relative_to(self.repo_root),
                             reason="Markdown file contains table that may be a shadow registry",
                             severity="INFO",
-                            evidence=f"Found {len(matches)} table rows with registry-like headers"
+                            evidence=f"Found {row_count} table rows with registry-like headers"
                         )
                     )
         
         except (UnicodeDecodeError, OSError):
             pass
     
+    def _scan_markdown_table(self, file_path: Path) -> List:
+        """Count registry-like table rows (uncached): [row_count, references_official]."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Look for tables with suspicious headers
+        matches = re.findall(REGISTRY_TABLE_PATTERN, content, re.IGNORECASE)
+        references_official = any(reg_name in content for reg_name in OFFICIAL_REGISTRIES)
+        return [len(matches), references_official]
+    
     def check_filename_patterns(self, file_path: Path) -> None:
         """Check if filename suggests shadow registry."""
         if self.is_official_registry(file_path):
@@ -265,26 +293,23 @@ class ShadowRegistryDetector:
         print(f"   Root: {self.repo_root}")
         print(f"   Official registries: {len(OFFICIAL_REGISTRIES)}")
         
-        for root, dirs, files in os.walk(self.repo_root):
-            # Remove excluded directories from search
-            dirs[:] = [d for d in dirs if d not in self.excluded_dirs]
+        self.index = index_for(self.repo_root, self.index)
+        for file_path in self.index.paths(under=self.repo_root,
+                                          exclude_dirs=self.excluded_dirs):
+            self.checked_files += 1
             
-            for file in files:
-                file_path = Path(root) / file
-                self.checked_files += 1
-                
-                # Check based on file type
-                if file_path.suffix == '.csv':
-                    self.check_csv_file(file_path)
-                elif file_path.suffix == '.json':
-                    self.check_json_file(file_path)
-                elif file_path.suffix in ['.yaml', '.yml']:
-                    self.check_yaml_file(file_path)
-                elif file_path.suffix == '.md':
-                    self.check_markdown_table(file_path)
-                
-                # Check filename patterns
-                self.check_filename_patterns(file_path)
+            # Check based on file type
+            if file_path.suffix == '.csv':
+                self.check_csv_file(file_path)
+            elif file_path.suffix == '.json':
+                self.check_json_file(file_path)
+            elif file_path.suffix in ['.yaml', '.yml']:
+                self.check_yaml_file(file_path)
+            elif file_path.suffix == '.md':
+                self.check_markdown_table(file_path)
+            
+            # Check filename patterns
+            self.check_filename_patterns(file_path)
     
     def print_summary(self) -> None:
         """Print shadow registry detection summary."""
@@ -358,6 +383,8 @@ def main():
         default='.',
         help='Repository root path (default: current directory)'
     )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
@@ -367,7 +394,17 @@ def main():
         print(f"❌ Error: Repository root not found: {repo_root}", file=sys.stderr)
         return 2
     
-    detector = ShadowRegistryDetector(repo_root)
+    try:
+        # Restrict the scan to files changed since --since REF
+        changes = change_set_from_args(args, repo_root)
+    except ChangeSetError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    
+    cache = cache_from_args(args)
+    detector = ShadowRegistryDetector(repo_root,
+                                      index=changes.index() if changes else None,
+                                      cache=cache)
     
     try:
         detector.scan_repository()
@@ -382,6 +419,8 @@ def main():
         import traceback
         traceback.print_exc()
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == "__main__":
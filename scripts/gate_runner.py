@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Gate Runner
+============================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Runs the governance gates in-process and in parallel.
+
+The validators (NomenclatureValidator, PLCValidator, TraceLinkValidator,
+SchemaRegistryValidator, LinkIntegrityGate) are imported directly instead
+of being launched as `python <script>` subprocesses. The repository is
+walked once; the shared RepoIndex is handed to each worker of a process
+pool when the pool starts. Each gate returns a structured GateResult, so
+callers no longer scrape "Summary:" lines out of stdout. A gate's console
+output is captured and kept on its result.
+
+Usage:
+    python scripts/gate_runner.py
+    python scripts/gate_runner.py --gates nomenclature,schemas --jobs 2
+    python scripts/gate_runner.py --json
+
+    from gate_runner import GateRunner
+
+    results = GateRunner(Path('.')).run(['nomenclature', 'trace_links'])
+
+Exit codes:
+    0: All selected gates passed
+    1: One or more gates failed
+    2: Script error (or a gate raised)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Import shared repository index
+try:
+    from repo_index import RepoIndex
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex
+
+# Import validators from sibling modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from validate_nomenclature import NomenclatureValidator
+from plc_validate import PLCValidator
+from validate_trace_links import TraceLinkValidator
+from validate_schema_registry import SchemaRegistryValidator, find_registry_files
+from validate_internal_links import LinkIntegrityGate
+
+
+@dataclass
+class GateResult:
+    """Structured outcome of a single gate run."""
+    gate: str                       # Runner key, e.g. 'nomenclature'
+    gate_id: str                    # Governance gate code, e.g. 'GATE-001'
+    name: str
+    passed: bool
+    error_count: int = 0
+    warning_count: int = 0
+    summary: str = ''
+    details: Dict[str, Any] = field(default_factory=dict)
+    duration_ms: int = 0
+    output: str = ''                # Captured console output of the validator
+    exception: Optional[str] = None  # Traceback if the gate raised
+
+    @property
+    def status(self) -> str:
+        """PASS, FAIL or ERROR."""
+        if self.exception:
+            return 'ERROR'
+        return 'PASS' if self.passed else 'FAIL'
+
+
+# =============================================================================
+# Gates
+# =============================================================================
+# Each gate takes (repo_root, index) and returns the GateResult fields that
+# describe its outcome. They are module-level so worker processes can pickle
+# references to them.
+
+def _gate_nomenclature(repo_root: Path, index: RepoIndex) -> Dict[str, Any]:
+    validator = NomenclatureValidator(standard='v6.0', mode='block', strict=True)
+    results = validator.validate_directory(repo_root, recursive=True, index=index)
+    invalid = [r for r in results if not r.valid]
+    return {
+        'passed': not invalid,
+        'error_count': len(invalid),
+        'warning_count': sum(1 for r in results if r.warnings),
+        'summary': (f"Summary: {len(results) - len(invalid)} valid, "
+                    f"{len(invalid)} invalid (total: {len(results)})"),
+        'details': {
+            'total': len(results),
+            'invalid_files': [r.filename for r in invalid],
+        },
+    }
+
+
+def _gate_plc(repo_root: Path, index: RepoIndex) -> Dict[str, Any]:
+    validator = PLCValidator(mode='block')
+    results = validator.validate_directory(repo_root, recursive=True, index=index)
+    invalid = [r for r in results if not r.valid]
+    warned = [r for r in results if r.valid and r.consistency_warnings]
+    return {
+        'passed': not invalid,
+        'error_count': len(invalid),
+        'warning_count': len(warned),
+        'summary': (f"Total files scanned: {len(results)}, "
+                    f"{len(invalid)} invalid, {len(warned)} with warnings"),
+        'details': {
+            'total': len(results),
+            'invalid_files': [r.filename for r in invalid],
+        },
+    }
+
+
+def _gate_trace_links(repo_root: Path, index: RepoIndex) -> Dict[str, Any]:
+    validator = TraceLinkValidator(repo_root, index=index)
+    result = validator.validate_all()
+    return {
+        'passed': result.passed,
+        'error_count': len(result.broken_links) + len(result.errors),
+        'warning_count': len(result.warnings),
+        'summary': (f"{len(result.broken_links)} broken, "
+                    f"{result.valid_links} valid trace links"),
+        'details': {
+            'broken_links': [
+                {'source': str(link.source_file), 'line': link.line_number,
+                 'target': link.link_target}
+                for link in result.broken_links
+            ],
+        },
+    }
+
+
+def _gate_schemas(repo_root: Path, index: RepoIndex) -> Dict[str, Any]:
+    validator = SchemaRegistryValidator(repo_root, index=index)
+    registries = find_registry_files(repo_root, index)
+    registry_path = registries[0] if registries else None
+    result = validator.validate_all(registry_path)
+    return {
+        'passed': result.passed,
+        'error_count': len(result.errors),
+        'warning_count': len(result.warnings),
+        'summary': (f"{len(result.errors)} error(s), {len(result.warnings)} warning(s)"),
+        'details': {
+            'registry': str(registry_path) if registry_path else None,
+            'registry_missing': registry_path is None,
+            'errors': list(result.errors),
+        },
+    }
+
+
+def _gate_links(repo_root: Path, index: RepoIndex) -> Dict[str, Any]:
+    gate = LinkIntegrityGate(repo_root=repo_root, index=index)
+    broken = gate.scan(scope='repo')
+    fixable = sum(1 for b in broken if b['fixable'])
+    return {
+        'passed': not broken,
+        'error_count': len(broken),
+        'warning_count': 0,
+        'summary': (f"{len(broken)} broken internal link(s) in "
+                    f"{gate.files_scanned} files ({fixable} fixable)"),
+        'details': {
+            'files_scanned': gate.files_scanned,
+            'broken_links': broken,
+            'template_placeholders': len(gate.template_placeholders),
+        },
+    }
+
+
+# Runner key -> (gate code, display name, implementation)
+GATES: Dict[str, tuple] = {
+    'nomenclature': ('GATE-001', 'Nomenclature Validation', _gate_nomenclature),
+    'schemas': ('GATE-002', 'Schema Registration Check', _gate_schemas),
+    'trace_links': ('GATE-003', 'Trace Link Integrity Check', _gate_trace_links),
+    'plc': ('PLC', 'PLC Chained Consistency', _gate_plc),
+    'links': (LinkIntegrityGate.GATE_CODE, LinkIntegrityGate.GATE_NAME, _gate_links),
+}
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+# Index installed in each worker process by _init_worker
+_WORKER_INDEX: Optional[RepoIndex] = None
+
+
+def _init_worker(index: RepoIndex) -> None:
+    """Process pool initializer: receive the shared index once per worker."""
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _execute(gate: str, repo_root: Path, index: Optional[RepoIndex] = None) -> GateResult:
+    """Run one gate, capturing its console output and any exception."""
+    gate_id, name, run = GATES[gate]
+    index = index if index is not None else _WORKER_INDEX
+    output = io.StringIO()
+    start = time.time()
+    try:
+        with contextlib.redirect_stdout(output):
+            fields = run(repo_root, index)
+        result = GateResult(gate, gate_id, name, **fields)
+    except Exception:
+        result = GateResult(gate, gate_id, name, passed=False,
+                            exception=traceback.format_exc())
+    result.duration_ms = int((time.time() - start) * 1000)
+    result.output = output.getvalue()
+    return result
+
+
+class GateRunner:
+    """Runs governance gates in-process over one shared repository index."""
+
+    def __init__(self, repo_root: Path = Path('.'), jobs: Optional[int] = None,
+                 index: Optional[RepoIndex] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            repo_root: Repository root directory
+            jobs: Worker processes (default: one per gate, capped at CPU count);
+                  1 runs the gates sequentially in this process
+            index: Shared repository index (walked once on first run if not given)
+        """
+        self.repo_root = repo_root.resolve()
+        self.jobs = jobs
+        self.index = index
+
+    def run(self, gates: Optional[List[str]] = None) -> List[GateResult]:
+        """
+        Run the selected gates (default: all) and return results in order.
+
+        Raises:
+            ValueError: If an unknown gate key is given
+        """
+        gates = list(gates or GATES)
+        unknown = [g for g in gates if g not in GATES]
+        if unknown:
+            raise ValueError(f"Unknown gate(s): {', '.join(unknown)} "
+                             f"(available: {', '.join(GATES)})")
+
+        if self.index is None:
+            self.index = RepoIndex(self.repo_root)
+
+        jobs = self.jobs or min(len(gates), os.cpu_count() or 1)
+        if jobs <= 1 or len(gates) == 1:
+            return [_execute(g, self.repo_root, self.index) for g in gates]
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(self.index,)) as pool:
+            futures = [pool.submit(_execute, g, self.repo_root) for g in gates]
+            return [f.result() for f in futures]
+
+
+def print_results(results: List[GateResult]) -> None:
+    """Print a one-line-per-gate summary table."""
+    print(f"\n{'Gate':<15} {'Check':<30} {'Status':<8} {'Time':>8}  Summary")
+    print("-" * 90)
+    for r in results:
+        print(f"{r.gate_id:<15} {r.name:<30} {r.status:<8} {r.duration_ms:>6}ms  {r.summary}")
+    for r in results:
+        if r.exception:
+            print(f"\n❌ {r.gate_id} raised:\n{r.exception}", file=sys.stderr)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Run governance gates in-process and in parallel'
+    )
+    parser.add_argument(
+        '--gates',
+        metavar='LIST',
+        help=f"Comma-separated gates to run (default: all): {', '.join(GATES)}"
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        metavar='N',
+        help='Worker processes (default: one per gate; 1 = sequential)'
+    )
+    parser.add_argument(
+        '--repo-root',
+        metavar='DIR',
+        default='.',
+        help='Repository root directory (default: current directory)'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Output results in JSON format'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Also print each gate\'s captured output'
+    )
+
+    args = parser.parse_args()
+
+    repo_root = Path(args.repo_root)
+    if not repo_root.is_dir():
+        print(f"Error: '{args.repo_root}' is not a directory", file=sys.stderr)
+        return 2
+
+    gates = [g.strip() for g in args.gates.split(',')] if args.gates else None
+    try:
+        results = GateRunner(repo_root, jobs=args.jobs).run(gates)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps([dict(asdict(r), status=r.status) for r in results],
+                         indent=2, default=str))
+    else:
+        if args.verbose:
+            for r in results:
+                print(f"\n{'='*70}\n{r.gate_id}: {r.name}\n{'='*70}")
+                print(r.output)
+        print_results(results)
+
+    if any(r.exception for r in results):
+        return 2
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
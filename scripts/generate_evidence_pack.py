@@ -43,19 +43,15 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
-# Nomenclature pattern for 10-field format
-NOMENCLATURE_PATTERN = re.compile(
-    r'^(?P<root>\d{2,3})_'
-    r'(?P<bucket>00|10|20|30|40|50|60|70|80|90)_'
-    r'(?P<type>[A-Z0-9]{2,8})_'
-    r'(?P<subject>(LC(0[1-9]|1[0-4])|SB(1[5-9]|[2-9]\d)))_'
-    r'(?P<project>AMPEL360)_'
-    r'(?P<program>SPACET)_'
-    r'(?P<variant>[A-Z0-9]+(?:-[A-Z0-9]+)*)_'
-    r'(?P<desc>[a-z0-9]+(?:-[a-z0-9]+)*)_'
-    r'(?P<ver>v\d{2})'
-    r'\.(?P<ext>[a-z0-9]{1,6})$'
-)
+# Import shared filename parser
+try:
+    import nomenclature
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    import nomenclature
+
+# Nomenclature pattern for 10-field format (shared grammar, see nomenclature.py)
+NOMENCLATURE_PATTERN = nomenclature.PATTERN_V3
 
 # Artifact type to role mapping
 ARTIFACT_ROLE_MAP = {
@@ -151,20 +147,20 @@ def compute_sha256(filepath: Path) -> Optional[str]:
 
 def parse_nomenclature(filename: str) -> Optional[NomenclatureComponents]:
     """Parse filename into nomenclature components."""
-    match = NOMENCLATURE_PATTERN.match(filename)
-    if not match:
+    fields = nomenclature.parse(filename, 'v3.0')
+    if not fields:
         return None
     return NomenclatureComponents(
-        root=match.group('root'),
-        bucket=match.group('bucket'),
-        type=match.group('type'),
-        subject=match.group('subject'),
-        project=match.group('project'),
-        program=match.group('program'),
-        variant=match.group('variant'),
-        description=match.group('desc'),
-        version=match.group('ver'),
-        ext=match.group('ext'),
+        root=fields.ata_root,
+        bucket=fields.bucket,
+        type=fields.type,
+        subject=fields.phase,
+        project=fields.project,
+        program=fields.program,
+        variant=fields.variant,
+        description=fields.subject,
+        version=fields.version,
+        ext=fields.ext,
     )
 
 
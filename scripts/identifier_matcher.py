@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Identifier Matcher
+===================================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+One-pass search for known identifiers in text.
+
+An identifier occurrence only counts when it is not part of a longer
+identifier, i.e. the regex rule (?<![A-Z0-9-])ID(?![A-Z0-9-]). For
+identifiers made of those characters (DATUM-GLOBAL-001, REQ-SYS-042, ...)
+such an occurrence is exactly a maximal run of [A-Z0-9-]. The matcher
+therefore tokenizes the text into runs once and looks each run up in a set
+of known identifiers: one scan per file however many identifiers are
+known, and the boundary rule holds by construction instead of being
+compiled into a regex per identifier. Identifiers with other characters
+are located with str.find and the boundary checked on each hit.
+
+Usage:
+    from identifier_matcher import IdentifierMatcher, contains_identifier
+
+    matcher = IdentifierMatcher(['DATUM-GLOBAL-001', 'ZONE-PROP-001'])
+    for identifier, offset in matcher.finditer(text):
+        ...
+    present = matcher.search(text)      # set of identifiers found
+
+    if contains_identifier(text, 'REQ-SYS-042'):
+        ...
+"""
+
+import re
+from typing import Iterable, Iterator, List, Set, Tuple
+
+
+# Characters that may not touch an identifier occurrence
+BOUNDARY_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
+
+# Maximal runs of boundary characters
+IDENTIFIER_RUN_PATTERN = re.compile(r'[A-Z0-9-]+')
+
+
+def is_run_identifier(identifier: str) -> bool:
+    """Check whether an identifier consists of boundary characters only."""
+    return IDENTIFIER_RUN_PATTERN.fullmatch(identifier) is not None
+
+
+def _occurrences(text: str, identifier: str) -> Iterator[int]:
+    """Offsets where identifier occurs in text with boundaries on both sides."""
+    size = len(identifier)
+    start = text.find(identifier)
+    while start != -1:
+        end = start + size
+        if ((start == 0 or text[start - 1] not in BOUNDARY_CHARS)
+                and (end == len(text) or text[end] not in BOUNDARY_CHARS)):
+            yield start
+        start = text.find(identifier, start + 1)
+
+
+def contains_identifier(text: str, identifier: str) -> bool:
+    """
+    Check if identifier appears in text with identifier boundaries.
+
+    Equivalent to re.search(rf'(?<![A-Z0-9-]){re.escape(identifier)}(?![A-Z0-9-])',
+    text) without building a pattern: e.g. 'DATUM-GLOBAL-001' does not match
+    inside 'DATUM-GLOBAL-0012'.
+    """
+    return next(_occurrences(text, identifier), None) is not None
+
+
+class IdentifierMatcher:
+    """Reusable matcher over a fixed set of known identifiers."""
+
+    def __init__(self, identifiers: Iterable[str]):
+        """
+        Build the matcher.
+
+        Args:
+            identifiers: Known identifiers (duplicates and '' are ignored)
+        """
+        known = set(identifiers)
+        known.discard('')
+        self._runs: Set[str] = {i for i in known if is_run_identifier(i)}
+        self._others: List[str] = sorted(known - self._runs)
+
+    @property
+    def identifiers(self) -> Set[str]:
+        """The known identifiers."""
+        return self._runs.union(self._others)
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int]]:
+        """
+        Every occurrence of a known identifier.
+
+        Yields:
+            (identifier, offset) pairs in offset order
+        """
+        hits = [
+            (match.start(), match.group())
+            for match in IDENTIFIER_RUN_PATTERN.finditer(text)
+            if match.group() in self._runs
+        ]
+        if self._others:
+            hits.extend(
+                (offset, identifier)
+                for identifier in self._others
+                for offset in _occurrences(text, identifier)
+            )
+            hits.sort()
+        for offset, identifier in hits:
+            yield identifier, offset
+
+    def search(self, text: str) -> Set[str]:
+        """The known identifiers that occur in text."""
+        found = self._runs.intersection(IDENTIFIER_RUN_PATTERN.findall(text))
+        found.update(i for i in self._others if contains_identifier(text, i))
+        return found
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._runs or identifier in self._others
+
+    def __len__(self) -> int:
+        return len(self._runs) + len(self._others)
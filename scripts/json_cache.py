@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T JSON Cache
+===========================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Process-wide memo of parsed JSON documents.
+
+Gates and validators load the same schema, export and manifest files many
+times per run (e.g. once per identifier in the audit proof path chain).
+load_json() parses each file once per process and hands every caller the
+same object, keyed by (path, mtime_ns, size) so an edited file is parsed
+again. Because the parsed tree is shared, it is frozen on the way in:
+objects become FrozenDict and arrays FrozenList, which behave as dict and
+list for reading (isinstance checks, json.dumps, pickling) but raise
+TypeError on mutation. Callers that need to modify a document take a
+private copy with thaw().
+
+The memo is bounded by the total size of the cached source files and
+evicts least recently used documents first. Parse errors propagate and are
+not cached. It sits in front of the persistent ContentCache: a miss there
+is parsed (or read from the SQLite facet store) once, later hits never
+leave memory.
+
+Usage:
+    from json_cache import load_json, thaw
+
+    data = load_json(path)              # shared, read-only
+    editable = thaw(load_json(path))    # private mutable copy
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Default memory budget, counted in bytes of cached JSON source
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+MemoKey = Tuple[int, int]
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} from the shared JSON cache is read-only; "
+                    f"use json_cache.thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Read-only JSON object shared between callers."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only JSON array shared between callers."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of a parsed JSON value (frozen values are returned as is)."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a (frozen) JSON value as plain dicts and lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _parse(path: Path) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class JsonCache:
+    """In-memory LRU memo of frozen JSON documents."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Create an empty memo.
+
+        Args:
+            max_bytes: Budget for the summed source size of cached documents.
+                       A document larger than the budget is returned but not
+                       kept.
+        """
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, Tuple[MemoKey, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Path, entry: Any = None,
+             parse: Optional[Callable[[Path], Any]] = None) -> Any:
+        """
+        Return the frozen parsed content of a JSON file.
+
+        Args:
+            path: JSON file
+            entry: Optional RepoIndex entry, saves a stat() call
+            parse: Called with ``path`` on a miss (default: json.load).
+                   Exceptions propagate and nothing is cached.
+
+        Returns:
+            The shared read-only document
+        """
+        if entry is not None:
+            key_path, key = str(entry.path), (entry.mtime_ns, entry.size)
+        else:
+            key_path = os.path.abspath(path)
+            st = os.stat(key_path)
+            key = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._entries.get(key_path)
+            if cached is not None and cached[0] == key:
+                self._entries.move_to_end(key_path)
+                self.hits += 1
+                return cached[1]
+
+        value = freeze((parse or _parse)(path))
+
+        with self._lock:
+            self.misses += 1
+            self._discard(key_path)
+            size = key[1]
+            if size <= self.max_bytes:
+                self._entries[key_path] = (key, value)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (old_key, _) = self._entries.popitem(last=False)
+                    self.bytes -= old_key[1]
+                    self.evictions += 1
+        return value
+
+    def _discard(self, key_path: str) -> None:
+        cached = self._entries.pop(key_path, None)
+        if cached is not None:
+            self.bytes -= cached[0][1]
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop one file's document, or everything if no path is given."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self.bytes = 0
+            else:
+                self._discard(os.path.abspath(path))
+
+    def stats(self) -> Dict[str, int]:
+        """Memo counters (documents, bytes, hits, misses, evictions)."""
+        return {
+            'documents': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# The process-wide memo used by load_json()
+JSON_CACHE = JsonCache()
+
+
+def load_json(path: Path, entry: Any = None) -> Any:
+    """
+    Parsed content of a JSON file from the process-wide memo.
+
+    The result is shared and read-only (see FrozenDict/FrozenList).
+    json.JSONDecodeError, UnicodeDecodeError and OSError are raised, not
+    cached.
+    """
+    return JSON_CACHE.load(path, entry)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Link Extractor
+===============================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Single-pass extraction of the links in a Markdown file.
+
+The link gates used to run their own patterns over every file: one per
+line for inline links, another for reference links, another for HTML
+anchors, plus a whole-content pass for reference definitions. The
+extractor memory-maps the file and makes one scan over its bytes. It
+stops only at the characters that can start a link ('[' and '<'). At each
+stop an anchored matcher recognises the construct there. Line numbers are
+counted up to each link found rather than by splitting the file into lines.
+
+Records are typed:
+
+    inline      [text](target)         target as written between the parentheses
+    reference   [text][label]          target of the label's definition
+    definition  [label]: target        at the start of a line
+    html        <a href="target">text</a>
+
+A link never spans lines. Each kind is matched left to right without
+overlap, so the records of a kind are what the corresponding regular
+expression's finditer() would find line by line. Reference links whose
+label has no definition in the file are not reported; the last definition
+of a label wins. Columns are 1-based character positions of the opening
+'[' or '<'.
+
+Usage:
+    from link_extractor import read_links, scan_links, INLINE
+
+    for link in read_links(path):
+        if link.kind == INLINE:
+            print(link.line, link.column, link.target)
+
+    with mapped_file(path) as data:     # bytes-like view of the file
+        links = scan_links(data)
+"""
+
+import mmap
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+# Record kinds
+INLINE = 'inline'
+REFERENCE = 'reference'
+DEFINITION = 'definition'
+HTML = 'html'
+
+# Characters a link can start with
+TRIGGER_PATTERN = re.compile(rb'[\[<]')
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+# Anchored matchers, tried at a trigger position (never across a newline)
+INLINE_PATTERN = re.compile(rb'\[([^\]\n]+)\]\(([^)\n]+)\)')
+REFERENCE_PATTERN = re.compile(rb'\[([^\]\n]+)\]\[([^\]\n]+)\]')
+DEFINITION_PATTERN = re.compile(rb'\[([^\]\n]+)\]:([^\n]*)')
+HTML_PATTERN = re.compile(rb'<a[^\S\n]+href="([^"\n]+)"[^>\n]*>([^<\n]*)</a>')
+
+# Inline target made of a destination and an optional "title"
+DESTINATION_PATTERN = re.compile(r'([^)\s]+)(?:\s+"[^"]*")?')
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@dataclass(frozen=True)
+class LinkRecord:
+    """A link found in a Markdown file."""
+    kind: str                      # INLINE, REFERENCE, DEFINITION or HTML
+    text: str                      # Link text (the label, for definitions)
+    target: str                    # Link target as written
+    line: int                      # 1-based line number
+    column: int                    # 1-based column of the opening '[' / '<'
+    label: Optional[str] = None    # Reference label (reference links)
+
+    @property
+    def destination(self) -> Optional[str]:
+        """
+        Target without a "title" (inline links).
+
+        None if the target is not a single destination optionally
+        followed by a quoted title, e.g. a path containing spaces.
+        """
+        if self.kind != INLINE:
+            return self.target
+        match = DESTINATION_PATTERN.fullmatch(self.target)
+        return match.group(1) if match else None
+
+
+@contextmanager
+def mapped_file(path: Union[str, Path]) -> Iterator[Buffer]:
+    """Read-only memory map of a file (empty bytes for an empty file)."""
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            yield b''
+            return
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def scan_links(data: Buffer, errors: str = 'ignore') -> List[LinkRecord]:
+    """
+    Extract the links of Markdown content in one pass.
+
+    Args:
+        data: UTF-8 encoded content (bytes or a memory map)
+        errors: Decoding error handler for the link fields
+
+    Returns:
+        Link records in document order
+    """
+    def decode(raw: bytes) -> str:
+        return raw.decode('utf-8', errors)
+
+    records: List[Tuple[int, LinkRecord]] = []
+    references: List[Tuple[int, str, str, int, int]] = []
+    definitions: Dict[str, str] = {}
+    inline_end = reference_end = html_end = 0
+    position = [1, 0, 0]  # Line number, its start offset, offset counted up to
+
+    def locate(pos: int) -> Tuple[int, int]:
+        """Line and column of an offset (offsets only ever increase)."""
+        line, line_start, counted = position
+        newlines = len(NEWLINE_PATTERN.findall(data, counted, pos))
+        if newlines:
+            line += newlines
+            line_start = data.rfind(b'\n', counted, pos) + 1
+        position[:] = line, line_start, pos
+        return line, len(decode(data[line_start:pos])) + 1
+
+    for trigger in TRIGGER_PATTERN.finditer(data):
+        pos = trigger.start()
+
+        if data[pos] == 0x3C:  # '<'
+            if pos >= html_end:
+                match = HTML_PATTERN.match(data, pos)
+                if match:
+                    html_end = match.end()
+                    records.append((pos, LinkRecord(
+                        HTML, decode(match.group(2)), decode(match.group(1)), *locate(pos))))
+            continue
+
+        if pos >= inline_end:
+            match = INLINE_PATTERN.match(data, pos)
+            if match:
+                inline_end = match.end()
+                records.append((pos, LinkRecord(
+                    INLINE, decode(match.group(1)), decode(match.group(2)), *locate(pos))))
+                continue
+        if pos >= reference_end:
+            match = REFERENCE_PATTERN.match(data, pos)
+            if match:
+                reference_end = match.end()
+                references.append((pos, decode(match.group(1)), decode(match.group(2)),
+                                   *locate(pos)))
+                continue
+        if pos == 0 or data[pos - 1] == 0x0A:  # Definitions start a line
+            match = DEFINITION_PATTERN.match(data, pos)
+            if match and match.group(2).strip():
+                label = decode(match.group(1))
+                target = decode(match.group(2)).strip()
+                definitions[label.lower()] = target
+                records.append((pos, LinkRecord(DEFINITION, label, target, *locate(pos))))
+
+    for pos, text, label, ref_line, column in references:
+        target = definitions.get(label.lower())
+        if target is not None:
+            records.append((pos, LinkRecord(REFERENCE, text, target, ref_line, column, label)))
+    records.sort(key=lambda record: record[0])
+    return [record for _, record in records]
+
+
+def read_links(path: Union[str, Path], errors: str = 'ignore') -> List[LinkRecord]:
+    """Extract the links of a Markdown file (memory-mapped, one pass)."""
+    with mapped_file(path) as data:
+        return scan_links(data, errors)
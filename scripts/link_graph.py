@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Link Graph
+===========================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Repository-wide graph of internal Markdown references.
+
+The graph is built once per run from the link extraction of the trace link
+validator (TraceLinkValidator.extract_links, cached per file by the content
+cache). Each internal link becomes an edge from the linking file to the
+file it resolves to, marked broken if the target does not resolve under
+the trace link rules. Outgoing and incoming edges are indexed by
+repo-relative path, so a per-file cross-reference check (PLC rung 4) is an
+O(degree) lookup instead of a content read.
+
+Usage:
+    from link_graph import LinkGraph
+
+    graph = LinkGraph(Path('.'), index=index)
+    for edge in graph.outgoing('docs/README.md'):
+        if edge.broken:
+            ...
+    graph.record_to_db(PLCDatabase('plc_ontology.db'))
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Import shared repository index, content cache and trace link extraction
+try:
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache
+    from validate_trace_links import TraceLinkValidator
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache
+    from validate_trace_links import TraceLinkValidator
+
+
+# TraceLinkValidator link type -> link_integrity.link_type
+DB_LINK_TYPES = {
+    'absolute': 'INTERNAL',
+    'relative': 'RELATIVE',
+    'reference': 'RELATIVE',
+    'html': 'RELATIVE',
+}
+
+
+@dataclass(frozen=True)
+class LinkEdge:
+    """An internal link from one repository file to another."""
+    source: str                     # POSIX path of the linking file (repo-relative)
+    line_number: int
+    link_target: str                # Target as written in the source
+    link_type: str                  # 'relative', 'absolute', 'reference', 'html'
+    resolved: Optional[str]         # Repo-relative target path (None if outside the repo)
+    broken: bool
+
+
+class LinkGraph:
+    """Outgoing/incoming internal link index over the repository's Markdown files."""
+
+    def __init__(self, repo_root: Path = Path('.'), index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None, skip_templates: bool = True):
+        """
+        Build the graph.
+
+        Args:
+            repo_root: Repository root directory
+            index: Shared repository index (walked once if not given). With a
+                   partial index only the indexed files' links are extracted,
+                   so incoming edges from other files are not known.
+            cache: Persistent content cache for extracted links
+            skip_templates: Skip template files and placeholder targets, as
+                            the trace link gate does with --skip-templates
+        """
+        self.repo_root = Path(repo_root).resolve()
+        self._root_prefix = str(self.repo_root) + os.sep
+        self.index = index_for(self.repo_root, index)
+        self._validator = TraceLinkValidator(
+            self.repo_root, skip_templates=skip_templates,
+            index=self.index, cache=cache
+        )
+
+        self.sources: List[str] = []   # Scanned Markdown files (repo-relative)
+        self._outgoing: Dict[str, List[LinkEdge]] = {}
+        self._incoming: Dict[str, List[LinkEdge]] = {}
+        self._build(skip_templates)
+
+    def _build(self, skip_templates: bool) -> None:
+        """Extract and resolve the links of every indexed Markdown file."""
+        exclude_dirs = set(TraceLinkValidator.EXCLUDED_DIRS)
+        if skip_templates:
+            exclude_dirs.add('templates')
+
+        for entry in self.index.files(suffixes={'.md'}, exclude_dirs=exclude_dirs):
+            self.sources.append(entry.rel_path)
+            edges = []
+            for link in self._validator.extract_links(entry.path):
+                if link.link_type == 'external':
+                    continue
+                resolved = self._validator.resolve_link_target(link.source_file, link.link_target)
+                edge = LinkEdge(
+                    source=entry.rel_path,
+                    line_number=link.line_number,
+                    link_target=link.link_target,
+                    link_type=link.link_type,
+                    resolved=self.rel_path(resolved) if resolved is not None else None,
+                    broken=not self._validator.validate_link(link),
+                )
+                edges.append(edge)
+                if edge.resolved is not None and edge.resolved != entry.rel_path:
+                    self._incoming.setdefault(edge.resolved, []).append(edge)
+            if edges:
+                self._outgoing[entry.rel_path] = edges
+
+    def rel_path(self, path: Path) -> Optional[str]:
+        """Repo-relative POSIX path of a file (None if outside the repository)."""
+        path = str(path)
+        if not path.startswith(self._root_prefix):
+            path = os.path.realpath(path)
+            if not path.startswith(self._root_prefix):
+                return None
+        return path[len(self._root_prefix):].replace(os.sep, '/')
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def outgoing(self, rel_path: str) -> List[LinkEdge]:
+        """Internal links made by a file."""
+        return self._outgoing.get(rel_path, [])
+
+    def incoming(self, rel_path: str) -> List[LinkEdge]:
+        """Internal links from other files that resolve to this file."""
+        return self._incoming.get(rel_path, [])
+
+    def edges(self) -> List[LinkEdge]:
+        """All internal links, in source path order."""
+        return [edge for edges in self._outgoing.values() for edge in edges]
+
+    def broken_links(self) -> List[LinkEdge]:
+        """All internal links that do not resolve."""
+        return [edge for edge in self.edges() if edge.broken]
+
+    @property
+    def files_scanned(self) -> int:
+        """Number of Markdown files whose links were extracted."""
+        return len(self.sources)
+
+    def __len__(self) -> int:
+        return sum(len(edges) for edges in self._outgoing.values())
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def record_to_db(self, db) -> int:
+        """
+        Record every checked link in the link_integrity table.
+
+        Rows for the scanned source files are replaced; rows for other
+        sources (e.g. written by GATE-LINK-001 for files outside this
+        graph) are kept.
+
+        Args:
+            db: PLCDatabase instance
+
+        Returns:
+            Number of link records written
+        """
+        rows = [
+            (edge.source, edge.link_target, edge.resolved,
+             DB_LINK_TYPES.get(edge.link_type, 'INTERNAL'), edge.broken)
+            for edge in self.edges()
+        ]
+        return db.record_link_checks(rows, sources=self.sources)
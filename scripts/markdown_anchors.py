@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Markdown Anchors
+=================================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Heading anchors of a Markdown document, as GitHub renders them.
+
+Every ATX ('## Title') and setext ('Title' underlined with === or ---)
+heading gets a slug: the heading text without inline markup, lowercased,
+with punctuation other than '-' and '_' removed and each space turned into
+'-'. Repeated slugs get '-1', '-2', ... appended in document order. Explicit
+HTML anchors (<a name="...">, id="...") are anchors too. Headings inside
+fenced code blocks and YAML front matter are ignored.
+
+The anchor list is a plain list of strings, so it can be stored as a
+ContentCache facet (ANCHORS_FACET) and reused while the file is unchanged.
+The facet name carries SLUG_VERSION, which must be bumped whenever the
+heading or slug rules below change, so cached anchor sets computed by an
+older algorithm are not reused.
+
+Usage:
+    from markdown_anchors import heading_anchors, has_anchor
+
+    anchors = heading_anchors(content)
+    if not has_anchor(anchors, 'design-overview'):
+        ...
+"""
+
+import re
+from typing import Dict, Iterable, List
+from urllib.parse import unquote
+
+
+ATX_HEADING_PATTERN = re.compile(r'^ {0,3}#{1,6}(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+SETEXT_UNDERLINE_PATTERN = re.compile(r'^ {0,3}(?:=+|-+)[ \t]*$')
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+HTML_ANCHOR_PATTERN = re.compile(r'<[A-Za-z][^>]*?\s(?:id|name)\s*=\s*["\']([^"\']+)["\']')
+
+# Lines that cannot be the text of a setext heading
+NOT_PARAGRAPH_PATTERN = re.compile(r'^(?: {4}|\t| {0,3}(?:[-*+>|<]|\d+[.)]|#))')
+
+# Inline markup reduced to its text before slugging
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\([^)]*\)')
+LINK_PATTERN = re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Characters GitHub drops from slugs (anything but word characters, '-' and ' ')
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\- ]')
+
+# Fragments that always resolve (document top)
+IMPLICIT_ANCHORS = frozenset({'', 'top'})
+
+# Version of the anchor rules (bump on any change to heading_anchors/github_slug)
+SLUG_VERSION = 1
+
+# ContentCache facet holding heading_anchors() of a file
+ANCHORS_FACET = f'md_anchors:v{SLUG_VERSION}'
+
+
+def github_slug(text: str) -> str:
+    """GitHub-style slug of a heading's text (before de-duplication)."""
+    text = IMAGE_PATTERN.sub(r'\1', text)
+    text = LINK_PATTERN.sub(r'\1', text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    text = SLUG_STRIP_PATTERN.sub('', text.strip().lower())
+    return text.replace(' ', '-')
+
+
+def heading_anchors(content: str) -> List[str]:
+    """
+    Anchors defined by a Markdown document.
+
+    Returns:
+        Heading slugs (de-duplicated the way GitHub does) followed by
+        explicit HTML anchors, in document order
+    """
+    slugs: List[str] = []
+    explicit: List[str] = []
+    occurrences: Dict[str, int] = {}
+
+    def add_heading(text: str) -> None:
+        slug = base = github_slug(text)
+        while slug in occurrences:
+            occurrences[base] += 1
+            slug = f"{base}-{occurrences[base]}"
+        occurrences[slug] = 0
+        slugs.append(slug)
+
+    lines = content.split('\n')
+    start = 0
+    if lines and lines[0].strip() == '---':
+        for i in range(1, len(lines)):
+            if lines[i].strip() in ('---', '...'):
+                start = i + 1
+                break
+
+    fence = None
+    previous = ''
+    for line in lines[start:]:
+        line = line.rstrip('\r')
+        fence_match = FENCE_PATTERN.match(line)
+        if fence is not None:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            previous = ''
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            previous = ''
+            continue
+
+        explicit.extend(HTML_ANCHOR_PATTERN.findall(line))
+        heading = ATX_HEADING_PATTERN.match(line)
+        if heading:
+            add_heading(heading.group(1) or '')
+            previous = ''
+        elif (SETEXT_UNDERLINE_PATTERN.match(line) and previous.strip()
+              and not NOT_PARAGRAPH_PATTERN.match(previous)):
+            add_heading(previous)
+            previous = ''
+        else:
+            previous = line
+
+    return slugs + explicit
+
+
+def has_anchor(anchors: Iterable[str], fragment: str) -> bool:
+    """
+    Check whether a link fragment (without '#') names one of the anchors.
+
+    The fragment is percent-decoded; GitHub also resolves fragments that
+    differ from a heading slug only in letter case.
+    """
+    fragment = unquote(fragment)
+    if fragment.lower() in IMPLICIT_ANCHORS:
+        return True
+    anchors = anchors if isinstance(anchors, (set, frozenset)) else set(anchors)
+    return fragment in anchors or fragment.lower() in anchors
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Nomenclature Filename Parser
+=============================================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0 (Normative)
+
+Single home of the nomenclature filename grammars and a memoized parser
+shared by every tool that reads fields out of filenames (nomenclature and
+PLC validators, staleness, link integrity, evidence packs, RepoIndex).
+
+parse() returns an immutable NomenclatureFields record (or None if the
+name does not follow the grammar). Results are kept in an LRU memo keyed
+by (filename, standard), so each distinct filename is matched once per
+process no matter how many gates look at it.
+
+Grammars:
+    v6.0  [ATA_ROOT]_[PROJECT]_[PROGRAM]_[FAMILY]_[VARIANT]_[VERSION]_[MODEL]_
+          [BLOCK]_[PHASE]_[KNOT_TASK]_[AoR]__[SUBJECT]_[TYPE]_[ISSUE-REVISION]_
+          [STATUS].[EXT]
+    v5.0  [ATA_ROOT]_[PROJECT]_[PROGRAM]_[VARIANT]_[BLOCK]_[PHASE]_[KNOT_TASK]_
+          [AoR]__[SUBJECT]_[TYPE]_[VERSION]_[STATUS].[EXT]
+    v3.0  [ROOT]_[BUCKET]_[TYPE]_[LC|SB]_[PROJECT]_[PROGRAM]_[VARIANT]_
+          [DESC]_[VERSION].[EXT]   (legacy 10-field format)
+
+Usage:
+    from nomenclature import parse, parse_many
+
+    fields = parse(filename)
+    if fields:
+        print(fields.aor, fields.subject, fields.status)
+
+    for fields in parse_many(names, standard='v5.0'):
+        ...
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Pattern
+
+
+# Primary regex pattern (v6.0 format)
+# VERSION supports optional 2-digit iteration: (PLUS|PLUSULTRA)[0-9]{2}?
+PATTERN_V6 = re.compile(
+    r'^(?P<ata_root>(?:0[0-9]|[1-9][0-9]|10[0-9]|11[0-6]))_'
+    r'(?P<project>AMPEL360)_'
+    r'(?P<program>SPACET)_'
+    r'(?P<family>Q[0-9]{2,3})_'
+    r'(?P<variant>[A-Z0-9]+)_'
+    r'(?P<version>(?:PLUS|PLUSULTRA)(?:[0-9]{2})?)_'  # R1.0: optional 2-digit iteration
+    r'(?P<model>[A-Z]{2})_'
+    r'(?P<block>[A-Z0-9]+)_'
+    r'(?P<phase>(?:LC(?:0[1-9]|1[0-4])|SB(?:0[1-9]|[1-9][0-9])))_'
+    r'(?P<knot_task>K(?:0[1-9]|1[0-4])(?:-T[0-9]{3})?)_'
+    r'(?P<aor>[A-Z]+)__'
+    r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
+    r'(?P<type>[A-Z0-9]+)_'
+    r'(?P<issue_revision>I[0-9]{2}-R[0-9]{2})_'
+    r'(?P<status>[A-Z]+)'
+    r'\.(?P<ext>[a-z0-9]{1,6})$'
+)
+
+# Primary regex pattern (v5.0 format)
+PATTERN_V5 = re.compile(
+    r'^(?P<ata_root>(?:0[0-9]|[1-9][0-9]|10[0-9]|11[0-6]))_'
+    r'(?P<project>AMPEL360)_'
+    r'(?P<program>SPACET)_'
+    r'(?P<variant>[A-Z0-9]+(?:-[A-Z0-9]+)*)_'
+    r'(?P<block>[A-Z0-9]+)_'
+    r'(?P<phase>(?:LC(?:0[1-9]|1[0-4])|SB(?:0[1-9]|[1-9][0-9])))_'
+    r'(?P<knot_task>K(?:0[1-9]|1[0-4])(?:-T[0-9]{3})?)_'
+    r'(?P<aor>[A-Z]+)__'
+    r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
+    r'(?P<type>[A-Z0-9]+)_'
+    r'(?P<version>v[0-9]{2})_'
+    r'(?P<status>[A-Z]+)'
+    r'\.(?P<ext>[a-z0-9]{1,6})$'
+)
+
+# Legacy 10-field pattern (v3.0 format, used by evidence pack manifests).
+# Group names follow the v6.0 meaning: the LC/SB token is the phase and the
+# kebab-case description is the subject.
+PATTERN_V3 = re.compile(
+    r'^(?P<ata_root>\d{2,3})_'
+    r'(?P<bucket>00|10|20|30|40|50|60|70|80|90)_'
+    r'(?P<type>[A-Z0-9]{2,8})_'
+    r'(?P<phase>(LC(0[1-9]|1[0-4])|SB(1[5-9]|[2-9]\d)))_'
+    r'(?P<project>AMPEL360)_'
+    r'(?P<program>SPACET)_'
+    r'(?P<variant>[A-Z0-9]+(?:-[A-Z0-9]+)*)_'
+    r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
+    r'(?P<version>v\d{2})'
+    r'\.(?P<ext>[a-z0-9]{1,6})$'
+)
+
+PATTERNS: Dict[str, Pattern] = {
+    'v6.0': PATTERN_V6,
+    'v5.0': PATTERN_V5,
+    'v3.0': PATTERN_V3,
+}
+
+DEFAULT_STANDARD = 'v6.0'
+
+# Distinct filenames remembered per process
+PARSE_CACHE_SIZE = 65536
+
+
+class NomenclatureFields:
+    """
+    Immutable record of the fields parsed from a nomenclature filename.
+
+    Fields a standard does not define are None (e.g. ``family`` for v5.0).
+    """
+
+    __slots__ = ('standard', 'filename',
+                 'ata_root', 'bucket', 'project', 'program', 'family',
+                 'variant', 'version', 'model', 'block', 'phase', 'knot_task',
+                 'aor', 'subject', 'type', 'issue_revision', 'status', 'ext',
+                 '_groups')
+
+    FIELD_NAMES = __slots__[2:-1]
+
+    def __init__(self, standard: str, filename: str, groups: Dict[str, str]):
+        setter = object.__setattr__
+        setter(self, 'standard', standard)
+        setter(self, 'filename', filename)
+        for name in self.FIELD_NAMES:
+            setter(self, name, groups.get(name))
+        setter(self, '_groups', tuple(
+            (name, groups[name]) for name in self.FIELD_NAMES if name in groups
+        ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NomenclatureFields):
+            return NotImplemented
+        return (self.standard, self.filename) == (other.standard, other.filename)
+
+    def __hash__(self) -> int:
+        return hash((self.standard, self.filename))
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={value!r}' for name, value in self._groups)
+        return f"NomenclatureFields({self.standard!r}, {fields})"
+
+    def __reduce__(self):
+        return (NomenclatureFields, (self.standard, self.filename, dict(self._groups)))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Field value by name (mirrors Match.groupdict().get)."""
+        value = getattr(self, name, None) if name in self.FIELD_NAMES else None
+        return default if value is None else value
+
+    def as_dict(self) -> Dict[str, str]:
+        """The fields defined by this record's standard, in filename order."""
+        return dict(self._groups)
+
+
+def pattern(standard: str = DEFAULT_STANDARD) -> Pattern:
+    """Return the compiled filename grammar for a standard."""
+    try:
+        return PATTERNS[standard]
+    except KeyError:
+        raise ValueError(f"Unknown nomenclature standard: {standard} "
+                         f"(available: {', '.join(PATTERNS)})")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse(filename: str, standard: str = DEFAULT_STANDARD) -> Optional[NomenclatureFields]:
+    """
+    Parse a filename (not a path) against a nomenclature standard.
+
+    Args:
+        filename: Base filename, e.g. '27_AMPEL360_SPACET_..._ACTIVE.md'
+        standard: 'v6.0' (default), 'v5.0' or 'v3.0'
+
+    Returns:
+        NomenclatureFields, or None if the filename does not match
+    """
+    match = pattern(standard).match(filename)
+    if not match:
+        return None
+    return NomenclatureFields(standard, filename, match.groupdict())
+
+
+def parse_many(filenames: Iterable[str],
+               standard: str = DEFAULT_STANDARD) -> List[Optional[NomenclatureFields]]:
+    """Parse a batch of filenames; results are in input order."""
+    return [parse(name, standard) for name in filenames]
+
+
+def cache_info():
+    """LRU statistics of the parse() memo (hits, misses, maxsize, currsize)."""
+    return parse.cache_info()
@@ -8,20 +8,79 @@ Standard: Nomenclature Standard v6.0 R1.0
 
 Provides database operations for PLC gate tracking and ontology database.
 
+A PLCDatabase keeps one long-lived SQLite connection (WAL journal,
+synchronous=NORMAL, prepared statement cache). Each call commits on its
+own unless it runs inside ``with db.transaction():``, in which case the
+whole block commits once.
+
 Usage:
     from scripts.plc_db import PLCDatabase
     
     db = PLCDatabase()
     db.initialize_database()
     run_id = db.record_gate_run('GATE-001', passed=True, error_count=0)
+    
+    with db.transaction():
+        for match in matches:
+            db.record_identifier_instance(...)
+    
+    # Bulk counterparts stream rows (dicts of the single-row keyword
+    # arguments) into executemany() in chunks of BULK_CHUNK_SIZE
+    db.record_identifier_instances(dict(identifier_kind=k, ...) for k in kinds)
+    
+    # Optional background writer thread with the same write methods
+    with BackgroundWriter('plc_ontology.db') as writer:
+        writer.record_identifier_instances(rows)   # queued
+        run_id = writer.record_gate_run(...)       # waits for the result
+    print(writer.stats.summary())
+
+Command line:
+    python scripts/plc_db.py                      # Self-test on test_plc_ontology.db
+    python scripts/plc_db.py compact --db-path plc_ontology.db --keep-runs 50 --keep-days 30
+    python scripts/plc_db.py compact --dry-run    # Report what would be deleted
+    python scripts/plc_db.py sync-artifacts --db-path plc_ontology.db --repo-root .
+    python scripts/plc_db.py index-content --db-path plc_ontology.db --repo-root .
+    python scripts/plc_db.py search-content 'DATUM-GLOBAL-001' --suffix .md
 """
 
+import hashlib
 import json
+import os
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 from contextlib import contextmanager
+from itertools import islice
+
+
+# Prepared statements kept per connection (sqlite3 statement cache)
+CACHED_STATEMENTS = 256
+
+# Rows per executemany() batch in the bulk record_* methods
+BULK_CHUNK_SIZE = 5000
+
+# Gate runs kept per gate by `compact` (older runs live on in the rollups)
+DEFAULT_KEEP_RUNS = 50
+
+# File types held in the full-text content index
+CONTENT_INDEX_SUFFIXES = ('.md', '.csv', '.json')
+
+
+def _chunked(rows: Iterable, size: int = BULK_CHUNK_SIZE) -> Iterator[list]:
+    """Split an iterable (e.g. a generator) into lists of at most size items."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class PLCDatabase:
@@ -41,20 +100,96 @@ class PLCDatabase:
         """
         self.db_path = db_path
         self.schema_path = Path(__file__).parent.parent / "config" / "database" / "plc_ontology_schema.sql"
-        
+        self.history_schema_path = self.schema_path.with_name("plc_history_schema.sql")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._transaction_depth = 0
+        self._artifact_catalog_ready = False
+        self._content_index_ready = False
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Return the long-lived connection, opening it on first use."""
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        # First use, or inherited across fork(): open a fresh connection
+        conn = sqlite3.connect(self.db_path, cached_statements=CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn = conn
+        self._pid = os.getpid()
+        self._transaction_depth = 0
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager yielding the shared connection.
+        
+        Commits on success and rolls back on error, unless an explicit
+        transaction() is open, which then decides for the whole block.
+        """
+        conn = self._connect()
+        if self._transaction_depth:
+            yield conn
+            return
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group many calls into one commit.
+        
+        Nested transaction() blocks join the outermost one. An exception
+        rolls the whole block back.
+        """
+        conn = self._connect()
+        self._transaction_depth += 1
+        try:
+            yield conn
+        except Exception:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                conn.rollback()
+            raise
+        else:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                conn.commit()
+    
+    def close(self) -> None:
+        """Commit pending work and close the connection."""
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.commit()
+            self._conn.close()
+        self._conn = None
+        self._transaction_depth = 0
+    
+    def _insert_many(self, sql: str, rows: Iterable[tuple]) -> int:
+        """
+        Stream parameter tuples into executemany() in chunks.
+        
+        Runs in one transaction (joining an open one). Returns the number
+        of rows written.
+        """
+        count = 0
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(rows):
+                cursor.executemany(sql, chunk)
+                count += len(chunk)
+        return count
+    
+    def __enter__(self) -> 'PLCDatabase':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def initialize_database(self) -> None:
         """Initialize database schema from SQL file."""
@@ -65,6 +200,7 @@ class PLCDatabase:
             cursor = conn.cursor()
             schema_sql = self.schema_path.read_text()
             cursor.executescript(schema_sql)
+            cursor.executescript(self.history_schema_path.read_text())
         
         print(f"✓ Database initialized: {self.db_path}")
     
@@ -147,17 +283,50 @@ class PLCDatabase:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO gate_finding
-                (run_id, gate_code, severity, message, artifact_path, artifact_id,
-                 finding_code, details, line_number)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(self._INSERT_GATE_FINDING, self._gate_finding_row(
                 run_id, gate_code, severity, message, artifact_path, artifact_id,
-                finding_code, json.dumps(details) if details else None, line_number
+                finding_code, details, line_number
             ))
             return cursor.lastrowid
     
+    def record_gate_findings(
+        self,
+        run_id: int,
+        gate_code: str,
+        findings: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """
+        Record many findings of one gate run.
+        
+        Args:
+            run_id: Gate run the findings belong to
+            gate_code: Gate code
+            findings: Dicts of record_gate_finding() keyword arguments
+                      (severity, message, artifact_path, ...)
+        
+        Returns:
+            Number of findings recorded
+        """
+        return self._insert_many(self._INSERT_GATE_FINDING, (
+            self._gate_finding_row(run_id, gate_code, **finding) for finding in findings
+        ))
+    
+    _INSERT_GATE_FINDING = """
+        INSERT INTO gate_finding
+        (run_id, gate_code, severity, message, artifact_path, artifact_id,
+         finding_code, details, line_number)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _gate_finding_row(run_id, gate_code, severity, message, artifact_path=None,
+                          artifact_id=None, finding_code=None, details=None,
+                          line_number=None) -> tuple:
+        return (
+            run_id, gate_code, severity, message, artifact_path, artifact_id,
+            finding_code, json.dumps(details) if details else None, line_number
+        )
+    
     def get_gate_execution_summary(self) -> List[Dict[str, Any]]:
         """Get summary of all gate executions."""
         with self.get_connection() as conn:
@@ -178,6 +347,165 @@ class PLCDatabase:
                 cursor.execute("SELECT * FROM v_unresolved_findings")
             return [dict(row) for row in cursor.fetchall()]
     
+    # ========================================================================
+    # Gate History Retention and Rollups
+    # ========================================================================
+    
+    def ensure_history_schema(self) -> bool:
+        """
+        Apply the rollup tables, triggers and views to an existing database.
+        
+        When the rollup tables are created here, they are filled from the
+        gate_run / gate_finding history already present.
+        
+        Returns:
+            True if the rollup tables were created by this call
+        """
+        with self.transaction() as conn:
+            created = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'gate_run_summary'"
+            ).fetchone() is None
+        # executescript() commits first, so it runs outside transaction()
+        self._connect().executescript(self.history_schema_path.read_text())
+        if created:
+            self.rebuild_rollups()
+        return created
+    
+    def rebuild_rollups(self) -> None:
+        """
+        Recompute gate_run_summary and gate_run_daily from gate_run history.
+        
+        Runs removed by compact() are no longer in the history, so this is
+        only exact before the first compaction.
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM gate_run_summary")
+            conn.execute("""
+                INSERT INTO gate_run_summary
+                (gate_code, total_runs, passed_runs, failed_runs, total_execution_time_ms,
+                 timed_runs, last_run_id, last_run_timestamp, last_passed)
+                SELECT gr.gate_code, COUNT(*),
+                       SUM(CASE WHEN gr.passed THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN gr.passed THEN 0 ELSE 1 END),
+                       COALESCE(SUM(gr.execution_time_ms), 0),
+                       COUNT(gr.execution_time_ms),
+                       last.run_id, last.run_timestamp, last.passed
+                FROM gate_run gr
+                JOIN gate_run last ON last.run_id = (
+                    SELECT MAX(run_id) FROM gate_run WHERE gate_code = gr.gate_code
+                )
+                GROUP BY gr.gate_code
+            """)
+            conn.execute("DELETE FROM gate_run_daily")
+            conn.execute("""
+                INSERT INTO gate_run_daily
+                (gate_code, run_date, runs, passed_runs, failed_runs, error_count,
+                 warning_count, total_execution_time_ms, timed_runs,
+                 error_findings, warn_findings, info_findings)
+                SELECT gr.gate_code, date(gr.run_timestamp), COUNT(*),
+                       SUM(CASE WHEN gr.passed THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN gr.passed THEN 0 ELSE 1 END),
+                       COALESCE(SUM(gr.error_count), 0),
+                       COALESCE(SUM(gr.warning_count), 0),
+                       COALESCE(SUM(gr.execution_time_ms), 0),
+                       COUNT(gr.execution_time_ms),
+                       COALESCE(SUM(f.errors), 0), COALESCE(SUM(f.warns), 0),
+                       COALESCE(SUM(f.infos), 0)
+                FROM gate_run gr
+                LEFT JOIN (
+                    SELECT run_id, gate_code,
+                           SUM(severity = 'ERROR') AS errors,
+                           SUM(severity = 'WARN') AS warns,
+                           SUM(severity = 'INFO') AS infos
+                    FROM gate_finding
+                    GROUP BY run_id, gate_code
+                ) f ON f.run_id = gr.run_id AND f.gate_code = gr.gate_code
+                GROUP BY gr.gate_code, date(gr.run_timestamp)
+            """)
+    
+    def compact(self, keep_runs: int = DEFAULT_KEEP_RUNS, keep_days: int = 0,
+                dry_run: bool = False) -> Dict[str, int]:
+        """
+        Trim gate_run / gate_finding history to the retention policy.
+        
+        The newest keep_runs runs of every gate are kept, plus every run
+        from the last keep_days days. Older runs and their findings are
+        deleted; their totals remain in the gate_run_summary and
+        gate_run_daily rollups, which are never trimmed.
+        
+        Args:
+            keep_runs: Runs kept per gate (at least 1, so the latest run
+                       and its findings are always available)
+            keep_days: Also keep all runs newer than this many days
+            dry_run: Count what would be deleted without deleting
+        
+        Returns:
+            {'runs_deleted', 'findings_deleted', 'runs_kept'}
+        """
+        if keep_runs < 1:
+            raise ValueError("keep_runs must be at least 1")
+        
+        self.ensure_history_schema()
+        with self.transaction() as conn:
+            conn.execute("DROP TABLE IF EXISTS temp.compact_run")
+            conn.execute("""
+                CREATE TEMP TABLE compact_run AS
+                SELECT run_id FROM (
+                    SELECT run_id, run_timestamp,
+                           ROW_NUMBER() OVER (PARTITION BY gate_code ORDER BY run_id DESC) AS run_rank
+                    FROM gate_run
+                )
+                WHERE run_rank > ? AND (? <= 0 OR run_timestamp < datetime('now', ?))
+            """, (keep_runs, keep_days, f'-{keep_days} days'))
+            runs = conn.execute("SELECT COUNT(*) FROM temp.compact_run").fetchone()[0]
+            findings = conn.execute("""
+                SELECT COUNT(*) FROM gate_finding
+                WHERE run_id IN (SELECT run_id FROM temp.compact_run)
+            """).fetchone()[0]
+            total = conn.execute("SELECT COUNT(*) FROM gate_run").fetchone()[0]
+            
+            if not dry_run:
+                conn.execute("""
+                    DELETE FROM gate_finding
+                    WHERE run_id IN (SELECT run_id FROM temp.compact_run)
+                """)
+                conn.execute("""
+                    DELETE FROM gate_run
+                    WHERE run_id IN (SELECT run_id FROM temp.compact_run)
+                """)
+            conn.execute("DROP TABLE temp.compact_run")
+        
+        return {
+            'runs_deleted': runs,
+            'findings_deleted': findings,
+            'runs_kept': total - runs,
+        }
+    
+    def vacuum(self) -> None:
+        """Rebuild the database file to release space freed by compact()."""
+        conn = self._connect()
+        conn.commit()
+        conn.execute("VACUUM")
+    
+    def get_gate_daily_rollup(
+        self,
+        gate_code: Optional[str] = None,
+        days: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get per-day gate aggregates, newest first."""
+        query = "SELECT * FROM v_gate_daily_trend WHERE 1 = 1"
+        params: List[Any] = []
+        if gate_code:
+            query += " AND gate_code = ?"
+            params.append(gate_code)
+        if days is not None:
+            query += " AND run_date >= date('now', ?)"
+            params.append(f'-{days} days')
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+    
     # ========================================================================
     # Link Integrity (GATE-LINK-001 / KI-PR3-001)
     # ========================================================================
@@ -194,15 +522,71 @@ class PLCDatabase:
         """Record a broken link."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO link_integrity
-                (source_path, target_link, target_resolved_path, link_type,
-                 broken, fixable, suggested_fix)
-                VALUES (?, ?, ?, ?, TRUE, ?, ?)
-            """, (source_path, target_link, target_resolved_path, link_type,
-                  fixable, suggested_fix))
+            cursor.execute(self._INSERT_BROKEN_LINK, self._broken_link_row(
+                source_path, target_link, target_resolved_path, link_type,
+                fixable, suggested_fix
+            ))
             return cursor.lastrowid
     
+    def record_broken_links(self, links: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Record many broken links.
+        
+        Args:
+            links: Dicts of record_broken_link() keyword arguments
+        
+        Returns:
+            Number of links recorded
+        """
+        return self._insert_many(self._INSERT_BROKEN_LINK, (
+            self._broken_link_row(**link) for link in links
+        ))
+    
+    _INSERT_BROKEN_LINK = """
+        INSERT INTO link_integrity
+        (source_path, target_link, target_resolved_path, link_type,
+         broken, fixable, suggested_fix)
+        VALUES (?, ?, ?, ?, TRUE, ?, ?)
+    """
+    
+    @staticmethod
+    def _broken_link_row(source_path, target_link, target_resolved_path=None,
+                         link_type='INTERNAL', fixable=False, suggested_fix=None) -> tuple:
+        return (source_path, target_link, target_resolved_path, link_type,
+                fixable, suggested_fix)
+    
+    def record_link_checks(
+        self,
+        links: List[Tuple[str, str, Optional[str], str, bool]],
+        sources: Optional[List[str]] = None
+    ) -> int:
+        """
+        Record checked links, broken or not, in one transaction.
+        
+        Args:
+            links: (source_path, target_link, target_resolved_path,
+                    link_type, broken) tuples
+            sources: Source paths whose previous records are replaced
+                     (default: the sources appearing in links)
+        
+        Returns:
+            Number of records written
+        """
+        if sources is None:
+            sources = sorted({link[0] for link in links})
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "DELETE FROM link_integrity WHERE source_path = ?",
+                [(source,) for source in sources]
+            )
+            cursor.executemany("""
+                INSERT INTO link_integrity
+                (source_path, target_link, target_resolved_path, link_type, broken)
+                VALUES (?, ?, ?, ?, ?)
+            """, links)
+            return len(links)
+    
     def get_broken_links(self, fixable_only: bool = False) -> List[Dict[str, Any]]:
         """Get all broken links."""
         with self.get_connection() as conn:
@@ -249,13 +633,37 @@ class PLCDatabase:
         """Register a namespace identifier."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO namespace_registry
-                (namespace_id, namespace_type, scope, owner_aor, artifact_path,
-                 artifact_sha256, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (namespace_id, namespace_type, scope, owner_aor, artifact_path,
-                  artifact_sha256, description))
+            cursor.execute(self._INSERT_NAMESPACE, self._namespace_row(
+                namespace_id, namespace_type, owner_aor, artifact_path, scope,
+                artifact_sha256, description
+            ))
+    
+    def register_namespaces(self, entries: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Register many namespace identifiers.
+        
+        Args:
+            entries: Dicts of register_namespace() keyword arguments
+        
+        Returns:
+            Number of entries registered
+        """
+        return self._insert_many(self._INSERT_NAMESPACE, (
+            self._namespace_row(**entry) for entry in entries
+        ))
+    
+    _INSERT_NAMESPACE = """
+        INSERT OR REPLACE INTO namespace_registry
+        (namespace_id, namespace_type, scope, owner_aor, artifact_path,
+         artifact_sha256, description)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _namespace_row(namespace_id, namespace_type, owner_aor, artifact_path,
+                       scope=None, artifact_sha256=None, description=None) -> tuple:
+        return (namespace_id, namespace_type, scope, owner_aor, artifact_path,
+                artifact_sha256, description)
     
     def check_namespace_duplicates(self) -> List[Dict[str, Any]]:
         """Check for duplicate namespace IDs."""
@@ -315,18 +723,43 @@ class PLCDatabase:
         """Record an identifier instance."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO identifier_instance
-                (identifier_kind, identifier_value, artifact_path, artifact_line,
-                 context, valid, validation_errors)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                identifier_kind, identifier_value, artifact_path, artifact_line,
-                json.dumps(context) if context else None, valid,
-                json.dumps(validation_errors) if validation_errors else None
+            cursor.execute(self._INSERT_IDENTIFIER_INSTANCE, self._identifier_instance_row(
+                identifier_kind, identifier_value, artifact_path, valid,
+                artifact_line, context, validation_errors
             ))
             return cursor.lastrowid
     
+    def record_identifier_instances(self, instances: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Record many identifier instances.
+        
+        Args:
+            instances: Dicts of record_identifier_instance() keyword arguments
+        
+        Returns:
+            Number of instances recorded
+        """
+        return self._insert_many(self._INSERT_IDENTIFIER_INSTANCE, (
+            self._identifier_instance_row(**instance) for instance in instances
+        ))
+    
+    _INSERT_IDENTIFIER_INSTANCE = """
+        INSERT INTO identifier_instance
+        (identifier_kind, identifier_value, artifact_path, artifact_line,
+         context, valid, validation_errors)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _identifier_instance_row(identifier_kind, identifier_value, artifact_path, valid,
+                                 artifact_line=None, context=None,
+                                 validation_errors=None) -> tuple:
+        return (
+            identifier_kind, identifier_value, artifact_path, artifact_line,
+            json.dumps(context) if context else None, valid,
+            json.dumps(validation_errors) if validation_errors else None
+        )
+    
     def get_invalid_identifiers(
         self,
         identifier_kind: Optional[str] = None
@@ -423,17 +856,91 @@ class PLCDatabase:
         """Record an evidence reference."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO evidence_ref
-                (source_artifact_id, source_artifact_path, target_path,
-                 target_artifact_id, evidence_kind, required)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                source_artifact_id, source_artifact_path, target_path,
-                target_artifact_id, evidence_kind, required
-            ))
+            cursor.execute(self._INSERT_EVIDENCE_REF, (None,) + self._evidence_ref_row(
+                source_artifact_id, source_artifact_path, evidence_kind,
+                target_path, target_artifact_id, required
+            ) + (False,))
             return cursor.lastrowid
     
+    def record_evidence_refs(self, refs: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Record many evidence references together with their resolution.
+        
+        Each ref is a dict of record_evidence_ref() keyword arguments. If
+        it also carries ``resolved`` (and optionally ``resolved_path``,
+        ``hash_match``, ``commit_ref_match``, ``validation_errors``), the
+        resolution is recorded as update_evidence_resolution() would.
+        
+        Returns:
+            Number of references recorded
+        """
+        count = 0
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(refs):
+                split = [self._split_resolution(ref) for ref in chunk]
+                rows = [
+                    self._evidence_ref_row(**fields)
+                    + (bool(resolution and resolution['resolved']),)
+                    for fields, resolution in split
+                ]
+                # The first insert takes the write lock, so the chunk's ids
+                # can be assigned consecutively from it
+                cursor.execute(self._INSERT_EVIDENCE_REF, (None,) + rows[0])
+                first_id = cursor.lastrowid
+                ids = range(first_id, first_id + len(rows))
+                cursor.executemany(self._INSERT_EVIDENCE_REF, [
+                    (evidence_id,) + row for evidence_id, row in zip(ids[1:], rows[1:])
+                ])
+                cursor.executemany(self._INSERT_EVIDENCE_RESOLUTION, [
+                    self._evidence_resolution_row(evidence_id, **resolution)
+                    for evidence_id, (_, resolution) in zip(ids, split)
+                    if resolution is not None
+                ])
+                count += len(rows)
+        return count
+    
+    _INSERT_EVIDENCE_REF = """
+        INSERT INTO evidence_ref
+        (evidence_id, source_artifact_id, source_artifact_path, target_path,
+         target_artifact_id, evidence_kind, required, resolved)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    _INSERT_EVIDENCE_RESOLUTION = """
+        INSERT INTO evidence_resolution
+        (evidence_id, resolved_path, hash_match, commit_ref_match,
+         validation_errors)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    
+    _RESOLUTION_FIELDS = ('resolved', 'resolved_path', 'hash_match',
+                          'commit_ref_match', 'validation_errors')
+    
+    @staticmethod
+    def _evidence_ref_row(source_artifact_id, source_artifact_path, evidence_kind,
+                          target_path=None, target_artifact_id=None,
+                          required=False) -> tuple:
+        return (source_artifact_id, source_artifact_path, target_path,
+                target_artifact_id, evidence_kind, required)
+    
+    @staticmethod
+    def _evidence_resolution_row(evidence_id, resolved, resolved_path=None,
+                                 hash_match=None, commit_ref_match=None,
+                                 validation_errors=None) -> tuple:
+        return (
+            evidence_id, resolved_path, hash_match, commit_ref_match,
+            json.dumps(validation_errors) if validation_errors else None
+        )
+    
+    @classmethod
+    def _split_resolution(cls, ref: Mapping[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Split a bulk evidence dict into (ref fields, resolution fields or None)."""
+        fields = {k: v for k, v in ref.items() if k not in cls._RESOLUTION_FIELDS}
+        if 'resolved' not in ref:
+            return fields, None
+        return fields, {k: ref[k] for k in cls._RESOLUTION_FIELDS if k in ref}
+    
     def update_evidence_resolution(
         self,
         evidence_id: int,
@@ -455,14 +962,9 @@ class PLCDatabase:
             """, (resolved, evidence_id))
             
             # Insert resolution record
-            cursor.execute("""
-                INSERT INTO evidence_resolution
-                (evidence_id, resolved_path, hash_match, commit_ref_match,
-                 validation_errors)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                evidence_id, resolved_path, hash_match, commit_ref_match,
-                json.dumps(validation_errors) if validation_errors else None
+            cursor.execute(self._INSERT_EVIDENCE_RESOLUTION, self._evidence_resolution_row(
+                evidence_id, resolved, resolved_path, hash_match, commit_ref_match,
+                validation_errors
             ))
     
     def get_unresolved_evidence(self, required_only: bool = False) -> List[Dict[str, Any]]:
@@ -494,55 +996,206 @@ class PLCDatabase:
         parsed_fields: Dict[str, str],
         file_sha256: Optional[str] = None,
         parse_valid: bool = True,
-        parse_errors: Optional[List[str]] = None
+        parse_errors: Optional[List[str]] = None,
+        file_size: Optional[int] = None,
+        file_mtime_ns: Optional[int] = None
     ) -> None:
         """Cache parsed artifact metadata."""
+        self.ensure_artifact_catalog_schema()
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO artifact_metadata
-                (artifact_path, filename, ata_root, project, program, family,
-                 variant, version, model, block, phase, knot_task, aor, subject,
-                 type, issue_revision, status, extension, file_sha256,
-                 parse_valid, parse_errors, last_parsed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
-                artifact_path, filename,
-                parsed_fields.get('ata_root'),
-                parsed_fields.get('project'),
-                parsed_fields.get('program'),
-                parsed_fields.get('family'),
-                parsed_fields.get('variant'),
-                parsed_fields.get('version'),
-                parsed_fields.get('model'),
-                parsed_fields.get('block'),
-                parsed_fields.get('phase'),
-                parsed_fields.get('knot_task'),
-                parsed_fields.get('aor'),
-                parsed_fields.get('subject'),
-                parsed_fields.get('type'),
-                parsed_fields.get('issue_revision'),
-                parsed_fields.get('status'),
-                parsed_fields.get('ext'),
-                file_sha256,
-                parse_valid,
-                json.dumps(parse_errors) if parse_errors else None
+            cursor.execute(self._UPSERT_ARTIFACT_METADATA, self._artifact_metadata_row(
+                artifact_path, filename, parsed_fields, file_sha256, parse_valid,
+                parse_errors, file_size, file_mtime_ns
             ))
     
+    def cache_artifacts_metadata(self, artifacts: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Cache parsed metadata of many artifacts.
+        
+        Args:
+            artifacts: Dicts of cache_artifact_metadata() keyword arguments
+        
+        Returns:
+            Number of artifacts cached
+        """
+        self.ensure_artifact_catalog_schema()
+        return self._insert_many(self._UPSERT_ARTIFACT_METADATA, (
+            self._artifact_metadata_row(**artifact) for artifact in artifacts
+        ))
+    
+    # Upsert keeps artifact_id stable across re-syncs
+    _UPSERT_ARTIFACT_METADATA = """
+        INSERT INTO artifact_metadata
+        (artifact_path, filename, ata_root, project, program, family,
+         variant, version, model, block, phase, knot_task, aor, subject,
+         type, issue_revision, status, extension, file_sha256,
+         parse_valid, parse_errors, file_size, file_mtime_ns, last_parsed)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (artifact_path) DO UPDATE SET
+            filename = excluded.filename, ata_root = excluded.ata_root,
+            project = excluded.project, program = excluded.program,
+            family = excluded.family, variant = excluded.variant,
+            version = excluded.version, model = excluded.model,
+            block = excluded.block, phase = excluded.phase,
+            knot_task = excluded.knot_task, aor = excluded.aor,
+            subject = excluded.subject, type = excluded.type,
+            issue_revision = excluded.issue_revision, status = excluded.status,
+            extension = excluded.extension, file_sha256 = excluded.file_sha256,
+            parse_valid = excluded.parse_valid, parse_errors = excluded.parse_errors,
+            file_size = excluded.file_size, file_mtime_ns = excluded.file_mtime_ns,
+            last_parsed = CURRENT_TIMESTAMP
+    """
+    
+    # parsed_fields keys stored in artifact_metadata, in column order
+    _METADATA_FIELDS = ('ata_root', 'project', 'program', 'family', 'variant',
+                        'version', 'model', 'block', 'phase', 'knot_task', 'aor',
+                        'subject', 'type', 'issue_revision', 'status', 'ext')
+    
+    @classmethod
+    def _artifact_metadata_row(cls, artifact_path, filename, parsed_fields,
+                               file_sha256=None, parse_valid=True,
+                               parse_errors=None, file_size=None,
+                               file_mtime_ns=None) -> tuple:
+        return (
+            (artifact_path, filename)
+            + tuple(parsed_fields.get(name) for name in cls._METADATA_FIELDS)
+            + (file_sha256, parse_valid,
+               json.dumps(parse_errors) if parse_errors else None,
+               file_size, file_mtime_ns)
+        )
+    
+    # Columns and facet indexes added to artifact_metadata after schema 1.0
+    _ARTIFACT_CATALOG_COLUMNS = (
+        ('file_size', 'INTEGER'),
+        ('file_mtime_ns', 'INTEGER'),
+    )
+    _ARTIFACT_CATALOG_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS idx_artifact_aor_type_status "
+        "ON artifact_metadata(aor, type, status)",
+        "CREATE INDEX IF NOT EXISTS idx_artifact_ata_root_block "
+        "ON artifact_metadata(ata_root, block)",
+    )
+    
+    def ensure_artifact_catalog_schema(self) -> None:
+        """Add the catalog columns and facet indexes to an existing database."""
+        if self._artifact_catalog_ready:
+            return
+        with self.transaction() as conn:
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(artifact_metadata)")}
+            for name, sql_type in self._ARTIFACT_CATALOG_COLUMNS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE artifact_metadata ADD COLUMN {name} {sql_type}")
+            for statement in self._ARTIFACT_CATALOG_INDEXES:
+                conn.execute(statement)
+        self._artifact_catalog_ready = True
+    
+    def sync_artifacts(self, repo_root: Path = Path('.'), index=None) -> Dict[str, int]:
+        """
+        Bring artifact_metadata in line with the files on disk.
+        
+        The repository is walked once (or the given RepoIndex is used).
+        Files subject to nomenclature whose size and mtime match their row
+        are skipped without being read. Otherwise the file is hashed: if
+        only size/mtime changed, just those columns are updated; if the
+        SHA-256 changed (or the file is new), the row is upserted. Rows of
+        paths no longer in the repository are deleted.
+        
+        Returns:
+            Counts: scanned, unchanged, touched, upserted, deleted, hashed
+        """
+        try:
+            from repo_index import index_for
+            from content_cache import ContentCache
+        except ImportError:
+            import sys
+            sys.path.insert(0, str(Path(__file__).parent))
+            from repo_index import index_for
+            from content_cache import ContentCache
+        
+        self.ensure_artifact_catalog_schema()
+        index = index_for(Path(repo_root), index)
+        hasher = ContentCache.disabled()
+        stats = dict.fromkeys(('scanned', 'unchanged', 'touched', 'upserted',
+                               'deleted', 'hashed'), 0)
+        
+        with self.transaction() as conn:
+            known = {
+                row['artifact_path']: (row['file_size'], row['file_mtime_ns'], row['file_sha256'])
+                for row in conn.execute(
+                    "SELECT artifact_path, file_size, file_mtime_ns, file_sha256 "
+                    "FROM artifact_metadata"
+                )
+            }
+            
+            touched = []
+            upserts = []
+            for entry in index.nomenclature_files():
+                stats['scanned'] += 1
+                size, mtime_ns, sha256 = known.pop(entry.rel_path, (None, None, None))
+                if size == entry.size and mtime_ns == entry.mtime_ns:
+                    stats['unchanged'] += 1
+                    continue
+                
+                digest = hasher.sha256(entry.path, entry)
+                stats['hashed'] += 1
+                if digest == sha256:
+                    touched.append((entry.size, entry.mtime_ns, entry.rel_path))
+                    continue
+                
+                fields = entry.fields
+                upserts.append({
+                    'artifact_path': entry.rel_path,
+                    'filename': entry.name,
+                    'parsed_fields': fields.as_dict() if fields else {},
+                    'file_sha256': digest,
+                    'parse_valid': fields is not None,
+                    'parse_errors': None if fields else [
+                        'Filename does not match the v6.0 nomenclature pattern'
+                    ],
+                    'file_size': entry.size,
+                    'file_mtime_ns': entry.mtime_ns,
+                })
+            
+            conn.executemany(
+                "UPDATE artifact_metadata SET file_size = ?, file_mtime_ns = ? "
+                "WHERE artifact_path = ?", touched
+            )
+            stats['touched'] = len(touched)
+            stats['upserted'] = self.cache_artifacts_metadata(upserts)
+            
+            # Whatever is left in known no longer exists on disk
+            conn.executemany(
+                "DELETE FROM artifact_metadata WHERE artifact_path = ?",
+                [(path,) for path in known]
+            )
+            stats['deleted'] = len(known)
+        
+        return stats
+    
     def get_artifacts_by_criteria(
         self,
         aor: Optional[str] = None,
         block: Optional[str] = None,
         type_code: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        ata_root: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Query artifacts by criteria."""
+        """
+        Query artifacts by criteria.
+        
+        (aor, type, status) and (ata_root, block) lookups are served by
+        composite indexes.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM artifact_metadata WHERE 1=1"
             params = []
             
+            if ata_root:
+                query += " AND ata_root = ?"
+                params.append(ata_root)
             if aor:
                 query += " AND aor = ?"
                 params.append(aor)
@@ -561,11 +1214,601 @@ class PLCDatabase:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    
+    # ========================================================================
+    # Content Index (full-text)
+    # ========================================================================
+    
+    # The trigram tokenizer indexes every 3-character substring, so a quoted
+    # phrase matches any literal, case-sensitive occurrence of the text -
+    # the same answers as a substring grep, served from the index.
+    _CONTENT_INDEX_SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS content_file (
+            file_id INTEGER PRIMARY KEY,
+            path TEXT NOT NULL UNIQUE,
+            ext VARCHAR(10) NOT NULL,
+            file_size INTEGER NOT NULL,
+            file_mtime_ns INTEGER NOT NULL,
+            file_sha256 VARCHAR(64) NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_content_file_ext ON content_file(ext)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5("
+        "body, tokenize = 'trigram case_sensitive 1')",
+    )
+    
+    # Shortest text a trigram index can answer
+    MIN_CONTENT_QUERY_LENGTH = 3
+    
+    def ensure_content_index_schema(self) -> None:
+        """
+        Create the content index tables if they do not exist.
+        
+        Raises:
+            sqlite3.OperationalError: SQLite was built without FTS5 or the
+                                      trigram tokenizer (SQLite < 3.34)
+        """
+        if self._content_index_ready:
+            return
+        with self.transaction() as conn:
+            for statement in self._CONTENT_INDEX_SCHEMA:
+                conn.execute(statement)
+        self._content_index_ready = True
+    
+    def sync_content_index(self, repo_root: Path = Path('.'), index=None,
+                           suffixes: Iterable[str] = CONTENT_INDEX_SUFFIXES) -> Dict[str, int]:
+        """
+        Bring the full-text content index in line with the files on disk.
+        
+        Works like sync_artifacts(): files whose size and mtime match their
+        row are skipped without being read; otherwise the file is read and
+        hashed, and only a changed SHA-256 re-indexes its text. Rows of
+        files no longer in the repository are deleted. Paths are stored
+        relative to repo_root, so one database indexes one repository.
+        
+        Returns:
+            Counts: scanned, unchanged, touched, indexed, deleted
+        """
+        try:
+            from repo_index import index_for
+        except ImportError:
+            import sys
+            sys.path.insert(0, str(Path(__file__).parent))
+            from repo_index import index_for
+        
+        self.ensure_content_index_schema()
+        index = index_for(Path(repo_root), index)
+        stats = dict.fromkeys(('scanned', 'unchanged', 'touched', 'indexed', 'deleted'), 0)
+        
+        with self.transaction() as conn:
+            known = {
+                row['path']: (row['file_id'], row['file_size'], row['file_mtime_ns'],
+                              row['file_sha256'])
+                for row in conn.execute(
+                    "SELECT file_id, path, file_size, file_mtime_ns, file_sha256 "
+                    "FROM content_file"
+                )
+            }
+            
+            touched = []
+            for entry in index.files(suffixes=set(suffixes)):
+                stats['scanned'] += 1
+                file_id, size, mtime_ns, sha256 = known.pop(entry.rel_path, (None,) * 4)
+                if size == entry.size and mtime_ns == entry.mtime_ns:
+                    stats['unchanged'] += 1
+                    continue
+                
+                try:
+                    data = entry.path.read_bytes()
+                except OSError:
+                    if file_id is not None:
+                        known[entry.rel_path] = (file_id, size, mtime_ns, sha256)
+                    continue
+                digest = hashlib.sha256(data).hexdigest()
+                if digest == sha256:
+                    touched.append((entry.size, entry.mtime_ns, file_id))
+                    continue
+                
+                # Undecodable bytes are replaced: the index may then return
+                # a file the caller cannot read, never miss a readable one
+                body = data.decode('utf-8', errors='replace')
+                if file_id is None:
+                    cursor = conn.execute(
+                        "INSERT INTO content_file "
+                        "(path, ext, file_size, file_mtime_ns, file_sha256) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (entry.rel_path, entry.ext, entry.size, entry.mtime_ns, digest)
+                    )
+                    file_id = cursor.lastrowid
+                else:
+                    conn.execute(
+                        "UPDATE content_file SET file_size = ?, file_mtime_ns = ?, "
+                        "file_sha256 = ? WHERE file_id = ?",
+                        (entry.size, entry.mtime_ns, digest, file_id)
+                    )
+                    conn.execute("DELETE FROM content_fts WHERE rowid = ?", (file_id,))
+                conn.execute("INSERT INTO content_fts (rowid, body) VALUES (?, ?)",
+                             (file_id, body))
+                stats['indexed'] += 1
+            
+            conn.executemany(
+                "UPDATE content_file SET file_size = ?, file_mtime_ns = ? "
+                "WHERE file_id = ?", touched
+            )
+            stats['touched'] = len(touched)
+            
+            # Whatever is left in known no longer exists on disk
+            stale = [(file_id,) for file_id, _, _, _ in known.values()]
+            conn.executemany("DELETE FROM content_fts WHERE rowid = ?", stale)
+            conn.executemany("DELETE FROM content_file WHERE file_id = ?", stale)
+            stats['deleted'] = len(stale)
+            
+            # Merge the b-tree segments written above into one, so phrase
+            # probes read one posting list per trigram
+            if stats['indexed'] or stats['deleted']:
+                conn.execute("INSERT INTO content_fts (content_fts) VALUES ('optimize')")
+        
+        return stats
+    
+    def search_content(self, match: str, suffixes: Optional[Iterable[str]] = None,
+                       limit: Optional[int] = None) -> List[str]:
+        """
+        Run an FTS5 MATCH expression against the content index.
+        
+        Args:
+            match: FTS5 query, e.g. '"REQ-SYS-042" OR "REQ-SYS-043"'
+            suffixes: Only files with these extensions (e.g. {'.md'})
+            limit: Maximum number of paths returned
+        
+        Returns:
+            Repo-relative paths of matching files, sorted
+        """
+        self.ensure_content_index_schema()
+        query = (
+            "SELECT f.path FROM content_fts "
+            "JOIN content_file f ON f.file_id = content_fts.rowid "
+            "WHERE content_fts MATCH ?"
+        )
+        params: List[Any] = [match]
+        if suffixes is not None:
+            suffixes = sorted(set(suffixes))
+            query += f" AND f.ext IN ({', '.join('?' * len(suffixes))})"
+            params.extend(suffixes)
+        query += " ORDER BY f.path"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self.get_connection() as conn:
+            return [row['path'] for row in conn.execute(query, params)]
+    
+    def find_content(self, text: str, suffixes: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Files whose content contains text literally (case-sensitive).
+        
+        Callers that need token boundaries (e.g. 'REQ-SYS-042' but not
+        'REQ-SYS-0421') check them on the returned files only.
+        
+        Raises:
+            ValueError: text is shorter than MIN_CONTENT_QUERY_LENGTH
+        """
+        if len(text) < self.MIN_CONTENT_QUERY_LENGTH:
+            raise ValueError(
+                f"Content index queries need at least "
+                f"{self.MIN_CONTENT_QUERY_LENGTH} characters: {text!r}"
+            )
+        phrase = '"' + text.replace('"', '""') + '"'
+        return self.search_content(phrase, suffixes=suffixes)
+
+
+# ============================================================================
+# Background Writer
+# ============================================================================
+
+@dataclass
+class WriterStats:
+    """Counters of a BackgroundWriter, final once it is closed."""
+    submitted: int = 0              # Rows queued
+    written: int = 0                # Rows committed
+    batches: int = 0                # Transactions committed
+    blocked_puts: int = 0           # Writes that waited on a full queue
+    blocked_seconds: float = 0.0    # Total time spent waiting
+    max_queue_depth: int = 0
+    errors: int = 0                 # Rows of failed calls
+    error_messages: List[str] = field(default_factory=list)
+    
+    def summary(self) -> str:
+        """One-line report of throughput, back-pressure and errors."""
+        return (f"{self.written}/{self.submitted} rows written in {self.batches} "
+                f"batch(es), {self.blocked_puts} back-pressure wait(s) "
+                f"({self.blocked_seconds:.2f}s), {self.errors} error(s)")
+
+
+# Sentinel closing the writer queue
+_STOP = object()
+
+
+class BackgroundWriter:
+    """
+    Background thread that owns a database connection and drains a bounded
+    queue of writes in batched transactions.
+    
+    The PLCDatabase bulk writers (record_identifier_instances, ...) are
+    queued and return at once; the scanning thread only waits when the
+    queue is full (back-pressure). Any other PLCDatabase method, e.g.
+    record_gate_run, is queued behind them and its result awaited.
+    
+    Each call runs in its own savepoint, so a failing call is counted in
+    stats and dropped without losing the rest of its batch.
+    """
+    
+    # PLCDatabase methods queued without waiting for the result
+    QUEUED_METHODS = frozenset({
+        'record_gate_findings', 'record_identifier_instances', 'record_evidence_refs',
+        'register_namespaces', 'cache_artifacts_metadata', 'record_broken_links',
+    })
+    
+    # Distinct error messages kept in stats
+    MAX_ERROR_MESSAGES = 10
+    
+    def __init__(self, db_path: str = "plc_ontology.db", max_queue: int = 256,
+                 batch_size: int = BULK_CHUNK_SIZE):
+        """
+        Start the writer thread.
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_queue: Queued calls before submitters block
+            batch_size: Rows committed per transaction (at least one call)
+        """
+        self.db = PLCDatabase(db_path)     # Only used on the writer thread
+        self.batch_size = batch_size
+        self.stats = WriterStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='plc-db-writer', daemon=True)
+        self._thread.start()
+    
+    def __getattr__(self, name: str):
+        # Unknown names raise AttributeError from PLCDatabase
+        if name.startswith('_') or not callable(getattr(PLCDatabase, name)):
+            raise AttributeError(name)
+        if name in self.QUEUED_METHODS:
+            return partial(self.submit, name)
+        return partial(self.call, name)
+    
+    def submit(self, method: str, *args) -> None:
+        """
+        Queue a bulk write; the last argument is its iterable of rows.
+        
+        Blocks only while the queue is full.
+        """
+        if method not in self.QUEUED_METHODS:
+            raise ValueError(f"Not a bulk write method: {method}")
+        rows = list(args[-1])
+        if rows:
+            self.stats.submitted += len(rows)
+            self._put((method, args[:-1] + (rows,), len(rows), None))
+    
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """Run a PLCDatabase method after the queued writes and return its result."""
+        future: Future = Future()
+        self.stats.submitted += 1
+        self._put((method, (args, kwargs), 1, future))
+        return future.result()
+    
+    def _put(self, item: tuple) -> None:
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            start = time.monotonic()
+            self._queue.put(item)
+            self.stats.blocked_puts += 1
+            self.stats.blocked_seconds += time.monotonic() - start
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queue.qsize())
+    
+    def close(self) -> WriterStats:
+        """Flush the queue, stop the thread and return the final stats."""
+        if not self._closed:
+            self._queue.put(_STOP)
+            self._closed = True
+            self._thread.join()
+        return self.stats
+    
+    def __enter__(self) -> 'BackgroundWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    # ------------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------------
+    
+    def _run(self) -> None:
+        """Drain the queue, one transaction per batch, until closed."""
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, rows = [item], item[2]
+            # Take whatever else is already queued, up to batch_size rows
+            while rows < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                rows += item[2]
+            self._write_batch(batch)
+        try:
+            self.db.close()
+        except Exception as e:
+            self._record_error('close', e, 0)
+    
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """Run a batch of calls in one transaction, each in a savepoint."""
+        written = 0
+        futures = []
+        try:
+            with self.db.transaction() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                for method, args, size, future in batch:
+                    conn.execute("SAVEPOINT writer_call")
+                    try:
+                        if future is None:
+                            getattr(self.db, method)(*args)
+                        else:
+                            call_args, call_kwargs = args
+                            result = getattr(self.db, method)(*call_args, **call_kwargs)
+                            futures.append((future, result))
+                        conn.execute("RELEASE writer_call")
+                        written += size
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO writer_call")
+                        conn.execute("RELEASE writer_call")
+                        self._record_error(method, e, size)
+                        if future is not None:
+                            future.set_exception(e)
+        except Exception as e:
+            # Connection or commit failure: the whole batch is lost
+            self._record_error('commit', e, written)
+            for method, args, size, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        self.stats.written += written
+        self.stats.batches += 1
+        for future, result in futures:
+            future.set_result(result)
+    
+    def _record_error(self, method: str, error: Exception, rows: int) -> None:
+        self.stats.errors += rows
+        message = f"{method}: {error}"
+        if (message not in self.stats.error_messages
+                and len(self.stats.error_messages) < self.MAX_ERROR_MESSAGES):
+            self.stats.error_messages.append(message)
+
+
+def compact_database(args) -> int:
+    """Run `compact` from parsed command line arguments."""
+    import sys
+    
+    if not Path(args.db_path).exists():
+        print(f"❌ Database not found: {args.db_path}", file=sys.stderr)
+        return 2
+    
+    db = PLCDatabase(args.db_path)
+    try:
+        if db.ensure_history_schema():
+            print("✓ Rollup tables created and filled from existing history")
+        stats = db.compact(keep_runs=args.keep_runs, keep_days=args.keep_days,
+                           dry_run=args.dry_run)
+        prefix = "[DRY-RUN] Would delete" if args.dry_run else "Deleted"
+        print(f"{prefix} {stats['runs_deleted']} gate run(s) and "
+              f"{stats['findings_deleted']} finding(s); {stats['runs_kept']} run(s) kept")
+        if args.vacuum and not args.dry_run:
+            db.vacuum()
+            print("✓ Database vacuumed")
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+
+
+def sync_artifacts_command(args) -> int:
+    """Run `sync-artifacts` from parsed command line arguments."""
+    import sys
+    
+    repo_root = Path(args.repo_root)
+    if not repo_root.is_dir():
+        print(f"❌ Not a directory: {args.repo_root}", file=sys.stderr)
+        return 2
+    
+    db = PLCDatabase(args.db_path)
+    try:
+        if not Path(args.db_path).exists():
+            db.initialize_database()
+        stats = db.sync_artifacts(repo_root)
+        print(f"Artifacts scanned: {stats['scanned']} "
+              f"({stats['unchanged']} unchanged, {stats['hashed']} hashed)")
+        print(f"  Upserted: {stats['upserted']}")
+        print(f"  Size/mtime refreshed: {stats['touched']}")
+        print(f"  Deleted: {stats['deleted']}")
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+
+
+def index_content_command(args) -> int:
+    """Run `index-content` from parsed command line arguments."""
+    import sys
+    
+    repo_root = Path(args.repo_root)
+    if not repo_root.is_dir():
+        print(f"❌ Not a directory: {args.repo_root}", file=sys.stderr)
+        return 2
+    
+    db = PLCDatabase(args.db_path)
+    try:
+        if not Path(args.db_path).exists():
+            db.initialize_database()
+        stats = db.sync_content_index(repo_root)
+        print(f"Files scanned: {stats['scanned']} ({stats['unchanged']} unchanged)")
+        print(f"  Indexed: {stats['indexed']}")
+        print(f"  Size/mtime refreshed: {stats['touched']}")
+        print(f"  Deleted: {stats['deleted']}")
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+
+
+def search_content_command(args) -> int:
+    """Run `search-content` from parsed command line arguments."""
+    import sys
+    
+    if not Path(args.db_path).exists():
+        print(f"❌ Database not found: {args.db_path}", file=sys.stderr)
+        return 2
+    
+    db = PLCDatabase(args.db_path)
+    try:
+        suffixes = args.suffix or None
+        if args.match:
+            paths = db.search_content(args.text, suffixes=suffixes)
+        else:
+            paths = db.find_content(args.text, suffixes=suffixes)
+        for path in paths:
+            print(path)
+        return 0 if paths else 1
+    except (ValueError, sqlite3.Error) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+
 
 def main():
-    """Test database initialization."""
+    """Test database initialization, or run a maintenance command."""
+    import argparse
     import sys
     
+    parser = argparse.ArgumentParser(description='PLC ontology database utilities')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    compact = subparsers.add_parser(
+        'compact',
+        help='Trim gate run history to a retention policy (rollups are kept)'
+    )
+    compact.add_argument(
+        '--db-path',
+        default='plc_ontology.db',
+        help='Path to PLC database (default: plc_ontology.db)'
+    )
+    compact.add_argument(
+        '--keep-runs',
+        type=int,
+        default=DEFAULT_KEEP_RUNS,
+        metavar='N',
+        help=f'Runs kept per gate (default: {DEFAULT_KEEP_RUNS})'
+    )
+    compact.add_argument(
+        '--keep-days',
+        type=int,
+        default=0,
+        metavar='DAYS',
+        help='Also keep every run from the last DAYS days (default: 0)'
+    )
+    compact.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Report what would be deleted without deleting'
+    )
+    compact.add_argument(
+        '--vacuum',
+        action='store_true',
+        help='VACUUM the database file after compaction'
+    )
+    
+    sync = subparsers.add_parser(
+        'sync-artifacts',
+        help='Incrementally sync artifact_metadata with the repository'
+    )
+    sync.add_argument(
+        '--db-path',
+        default='plc_ontology.db',
+        help='Path to PLC database (default: plc_ontology.db)'
+    )
+    sync.add_argument(
+        '--repo-root',
+        default='.',
+        help='Repository root directory (default: current directory)'
+    )
+    
+    index_content = subparsers.add_parser(
+        'index-content',
+        help='Incrementally refresh the full-text index of .md/.csv/.json content'
+    )
+    index_content.add_argument(
+        '--db-path',
+        default='plc_ontology.db',
+        help='Path to PLC database (default: plc_ontology.db)'
+    )
+    index_content.add_argument(
+        '--repo-root',
+        default='.',
+        help='Repository root directory (default: current directory)'
+    )
+    
+    search = subparsers.add_parser(
+        'search-content',
+        help='List indexed files containing a text (exit 1 if none)'
+    )
+    search.add_argument(
+        'text',
+        help='Literal text to find (case-sensitive), or an FTS5 query with --match'
+    )
+    search.add_argument(
+        '--db-path',
+        default='plc_ontology.db',
+        help='Path to PLC database (default: plc_ontology.db)'
+    )
+    search.add_argument(
+        '--suffix',
+        action='append',
+        metavar='EXT',
+        help='Only files with this extension, e.g. .md (repeatable)'
+    )
+    search.add_argument(
+        '--match',
+        action='store_true',
+        help='Treat TEXT as a raw FTS5 MATCH expression'
+    )
+    
+    args = parser.parse_args()
+    if args.command == 'compact':
+        return compact_database(args)
+    if args.command == 'sync-artifacts':
+        return sync_artifacts_command(args)
+    if args.command == 'index-content':
+        return index_content_command(args)
+    if args.command == 'search-content':
+        return search_content_command(args)
+    
     db = PLCDatabase("test_plc_ontology.db")
     
     try:
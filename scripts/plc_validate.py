@@ -34,6 +34,12 @@ PLC RUNG STACK ARCHITECTURE:
            Exception register validation
 ===============================================================================
 
+Rungs 1-3 are compiled into decision tables when the validator is created
+(ATA_ROOT -> BLOCK array, frozenset membership tables). Violations are kept
+as integer ViolationCode values and rendered into messages only when printed.
+Rungs 1, 3 and 5 are memoized per field tuple (RUNG_KEY_FIELDS); --report
+shows the hit rates. Rungs 2 and 4 run for every file.
+
 Usage:
     python scripts/plc_validate.py <filename>
     python scripts/plc_validate.py --check-all
@@ -50,9 +56,154 @@ import argparse
 import re
 import sys
 import yaml
+from enum import IntEnum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from operator import itemgetter
+
+# Import shared filename parser, repository index, change set and link graph
+try:
+    import nomenclature
+    from repo_index import RepoIndex, index_for, compile_exclusion_pattern
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from link_graph import LinkGraph
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    import nomenclature
+    from repo_index import RepoIndex, index_for, compile_exclusion_pattern
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from link_graph import LinkGraph
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VIOLATION CODES
+# ═══════════════════════════════════════════════════════════════════════════════
+# Rungs 1-4 record violations as integer codes plus the values involved.
+# Messages are rendered from the templates below only when a violation is
+# printed (str()), so validating a file does no string formatting.
+
+class ViolationCode(IntEnum):
+    """Integer codes for rung 1-4 violations (hundreds digit = rung)."""
+    # RUNG 1 - Allowlist Enforcement
+    FAMILY_NOT_ALLOWED = 101
+    VARIANT_NOT_ALLOWED = 102
+    VERSION_BRAND_NOT_ALLOWED = 103
+    VERSION_MALFORMED = 104
+    MODEL_NOT_ALLOWED = 105
+    BLOCK_NOT_ALLOWED = 106
+    AOR_NOT_ALLOWED = 107
+    TYPE_NOT_ALLOWED = 108
+    STATUS_NOT_ALLOWED = 109
+    EXT_NOT_ALLOWED = 110
+    # RUNG 2 - Cross-field Semantics
+    VARIANT_SUBJECT_PREFIX = 201
+    TEKNIA_ISSUANCE_AOR = 202
+    # RUNG 3 - Context Constraints
+    ATA_BLOCK = 301
+    ATA_UNMAPPED = 302
+    PHASE_STATUS = 303
+    AOR_KNOT = 304
+    MODEL_TYPE = 305
+    BLOCK_AOR = 306
+    CERT_VARIANT = 307
+    FLIGHTTEST_VARIANT = 308
+    S_AXIS_BLOCK = 309
+    NEURAL_BLOCK = 310
+    # RUNG 4 - Cross-reference Integrity
+    BROKEN_LINK = 401
+
+
+# Message templates, formatted with the violation's positional arguments
+VIOLATION_MESSAGES: Dict[int, str] = {
+    ViolationCode.FAMILY_NOT_ALLOWED: "FAMILY '{0}' not in allowlist: {1}",
+    ViolationCode.VARIANT_NOT_ALLOWED: "VARIANT '{0}' not in allowlist: {1}",
+    ViolationCode.VERSION_BRAND_NOT_ALLOWED: "VERSION brand '{0}' not in allowlist: {1}",
+    ViolationCode.VERSION_MALFORMED: "VERSION '{0}' does not match expected pattern",
+    ViolationCode.MODEL_NOT_ALLOWED: "MODEL '{0}' not in allowlist: {1}",
+    ViolationCode.BLOCK_NOT_ALLOWED: "BLOCK '{0}' not in allowlist: {1}",
+    ViolationCode.AOR_NOT_ALLOWED: "AoR '{0}' not in allowlist: {1}",
+    ViolationCode.TYPE_NOT_ALLOWED: "TYPE '{0}' not in allowlist: {1}",
+    ViolationCode.STATUS_NOT_ALLOWED: "STATUS '{0}' not in allowlist: {1}",
+    ViolationCode.EXT_NOT_ALLOWED: "EXT '{0}' not in allowlist: {1}",
+    ViolationCode.VARIANT_SUBJECT_PREFIX: ("VARIANT '{0}' requires SUBJECT to match "
+                                           "pattern '{1}', got '{2}'"),
+    ViolationCode.TEKNIA_ISSUANCE_AOR: ("TEKNIA credential TYPE '{0}' can only be issued by "
+                                        "AoR in {1}, got '{2}'"),
+    ViolationCode.ATA_BLOCK: "ATA_ROOT↔BLOCK: ATA {0} typically in {1}, not '{2}'",
+    ViolationCode.ATA_UNMAPPED: ("ATA_ROOT↔BLOCK: ATA {0} has no explicit mapping; "
+                                 "GEN preferred for unmapped"),
+    ViolationCode.PHASE_STATUS: "PHASE↔STATUS: {0} typically uses STATUS in {1}, not '{2}'",
+    ViolationCode.AOR_KNOT: "AoR↔KNOT: AoR '{0}' typically participates in {1}, not '{2}'",
+    ViolationCode.MODEL_TYPE: "MODEL↔TYPE: MODEL '{0}' typically uses TYPE in {1}, not '{2}'",
+    ViolationCode.BLOCK_AOR: "BLOCK↔AoR: BLOCK '{0}' typically works with AoR in {1}, not '{2}'",
+    ViolationCode.CERT_VARIANT: ("VARIANT↔BLOCK/AoR: CERT variant should typically have "
+                                 "CERT/SAF BLOCK or AoR"),
+    ViolationCode.FLIGHTTEST_VARIANT: ("VARIANT↔BLOCK/AoR: FLIGHTTEST variant should typically "
+                                       "have TEST/OPS BLOCK or AoR"),
+    ViolationCode.S_AXIS_BLOCK: ("ATA_ROOT↔BLOCK: S-axis ATA {0} should typically use "
+                                 "TEST/SW/DATA/SYS BLOCK"),
+    ViolationCode.NEURAL_BLOCK: ("ATA_ROOT↔BLOCK/AoR: Neural ATA {0} should typically have "
+                                 "AI/DATA BLOCK or AoR"),
+    ViolationCode.BROKEN_LINK: "Broken internal link (line {0}): {1}",
+}
+
+# Chain violation (field1, field2) pairs and reason templates
+CHAIN_FIELDS: Dict[int, Tuple[str, str]] = {
+    ViolationCode.ATA_BLOCK: ('ATA_ROOT', 'BLOCK'),
+    ViolationCode.PHASE_STATUS: ('PHASE', 'STATUS'),
+    ViolationCode.AOR_KNOT: ('AoR', 'KNOT_TASK'),
+    ViolationCode.MODEL_TYPE: ('MODEL', 'TYPE'),
+    ViolationCode.BLOCK_AOR: ('BLOCK', 'AoR'),
+}
+
+CHAIN_REASONS: Dict[int, str] = {
+    ViolationCode.ATA_BLOCK: "ATA {0} typically uses BLOCK in {1}, not '{2}'",
+    ViolationCode.PHASE_STATUS: "{0} typically has STATUS in {1}, not '{2}'",
+    ViolationCode.AOR_KNOT: "AoR '{0}' typically works on KNOTs {1}, not '{2}'",
+    ViolationCode.MODEL_TYPE: "MODEL '{0}' typically uses TYPE in {1}, not '{2}'",
+    ViolationCode.BLOCK_AOR: "BLOCK '{0}' typically has AoR in {1}, not '{2}'",
+}
+
+
+class Violation:
+    """A rung violation: integer code and arguments, rendered on str()."""
+
+    __slots__ = ('code', 'args')
+    MESSAGES = VIOLATION_MESSAGES
+
+    def __init__(self, code: ViolationCode, *args: Any):
+        self.code = code
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.MESSAGES[self.code].format(*self.args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.code.name}, {self.args!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, str):
+            return str(self) == other
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return (type(self), self.code, self.args) == (type(other), other.code, other.args)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+class ChainReason(Violation):
+    """Reason text of a chain violation (field1, field2, reason)."""
+
+    __slots__ = ()
+    MESSAGES = CHAIN_REASONS
+
+
+# Highest ATA root accepted by the v6.0 grammar
+ATA_ROOT_MAX = 116
 
 
 @dataclass
@@ -61,8 +212,8 @@ class PLCRungResult:
     rung_id: int
     rung_name: str
     passed: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    errors: List[Union[str, Violation]] = field(default_factory=list)
+    warnings: List[Union[str, Violation]] = field(default_factory=list)
     data: Dict[str, Any] = field(default_factory=dict)  # Rung-specific output data
 
 
@@ -73,9 +224,9 @@ class PLCValidationResult:
     valid: bool
     parsed_fields: Dict[str, str]
     rung_results: List[PLCRungResult] = field(default_factory=list)
-    consistency_errors: List[str] = field(default_factory=list)
-    consistency_warnings: List[str] = field(default_factory=list)
-    chain_violations: List[Tuple[str, str, str]] = field(default_factory=list)  # (field1, field2, reason)
+    consistency_errors: List[Union[str, Violation]] = field(default_factory=list)
+    consistency_warnings: List[Union[str, Violation]] = field(default_factory=list)
+    chain_violations: List[Tuple[str, str, ChainReason]] = field(default_factory=list)  # (field1, field2, reason)
 
 
 class PLCValidator:
@@ -104,25 +255,8 @@ class PLCValidator:
         5: "Release Gating",
     }
     
-    # v6.0 pattern for parsing filenames
-    PATTERN_V6 = re.compile(
-        r'^(?P<ata_root>(?:0[0-9]|[1-9][0-9]|10[0-9]|11[0-6]))_'
-        r'(?P<project>AMPEL360)_'
-        r'(?P<program>SPACET)_'
-        r'(?P<family>Q[0-9]{2,3})_'
-        r'(?P<variant>[A-Z0-9]+)_'
-        r'(?P<version>(?:PLUS|PLUSULTRA)(?:[0-9]{2})?)_'
-        r'(?P<model>[A-Z]{2})_'
-        r'(?P<block>[A-Z0-9]+)_'
-        r'(?P<phase>(?:LC(?:0[1-9]|1[0-4])|SB(?:0[1-9]|[1-9][0-9])))_'
-        r'(?P<knot_task>K(?:0[1-9]|1[0-4])(?:-T[0-9]{3})?)_'
-        r'(?P<aor>[A-Z]+)__'
-        r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
-        r'(?P<type>[A-Z0-9]+)_'
-        r'(?P<issue_revision>I[0-9]{2}-R[0-9]{2})_'
-        r'(?P<status>[A-Z]+)'
-        r'\.(?P<ext>[a-z0-9]{1,6})$'
-    )
+    # v6.0 pattern for parsing filenames (shared grammar, see nomenclature.py)
+    PATTERN_V6 = nomenclature.PATTERN_V6
     
     # ATA chapter to primary BLOCK mapping (semantic coherence)
     ATA_BLOCK_MAP = {
@@ -221,8 +355,34 @@ class PLCValidator:
     TEKNIA_TYPES = {'BADGE', 'CERT', 'LIC'}
     TEKNIA_ISSUANCE_AORS = {'CM', 'CERT'}
     
+    # Special-variant and axis expectations (RUNG 3)
+    CERT_VARIANT_BLOCKS = frozenset({'CERT', 'SAF', 'GEN'})
+    CERT_VARIANT_AORS = frozenset({'CERT', 'SAF'})
+    FLIGHTTEST_VARIANT_BLOCKS = frozenset({'TEST', 'OPS', 'SYS'})
+    FLIGHTTEST_VARIANT_AORS = frozenset({'TEST', 'OPS'})
+    S_AXIS_BLOCKS = frozenset({'TEST', 'SW', 'DATA', 'SYS', 'GEN'})
+    NEURAL_BLOCKS = frozenset({'AI', 'DATA', 'SW', 'GEN'})
+    NEURAL_AORS = frozenset({'AI', 'DATA'})
+    
+    # VERSION brand root (RUNG 1)
+    VERSION_BRAND_PATTERN = re.compile(r'^(PLUS|PLUSULTRA)')
+    
+    # Fields each memoized rung depends on. Many files share these and differ
+    # only in SUBJECT, so rungs 1, 3 and 5 are evaluated once per distinct
+    # tuple; rungs 2 and 4 (SUBJECT, file content) always run per file.
+    RUNG_KEY_FIELDS = {
+        1: ('family', 'variant', 'version', 'model', 'block', 'aor', 'type', 'status', 'ext'),
+        3: ('ata_root', 'block', 'phase', 'knot_task', 'aor', 'model', 'type', 'status', 'variant'),
+        5: ('phase', 'status'),
+    }
+    
+    # Distinct field tuples remembered per rung before the memo is reset
+    RUNG_CACHE_SIZE = 65536
+    
     def __init__(self, config_path: Optional[str] = None, strict: bool = True, 
-                 mode: str = "warn", rungs: Optional[List[int]] = None):
+                 mode: str = "warn", rungs: Optional[List[int]] = None,
+                 link_graph: Optional[LinkGraph] = None,
+                 cache: Optional[ContentCache] = None):
         """
         Initialize PLC validator.
         
@@ -231,10 +391,16 @@ class PLCValidator:
             strict: If True, treat consistency warnings as errors
             mode: Validation mode ("warn", "report", "block")
             rungs: List of rung IDs to execute (default: all 0-5)
+            link_graph: Prebuilt link graph for RUNG 4 (built by
+                        validate_directory / build_link_graph if not given)
+            cache: Persistent content cache used when building the link graph
         """
         self.strict = strict
         self.mode = mode
         self.rungs_to_execute = rungs if rungs is not None else list(range(6))
+        self._rungs = frozenset(self.rungs_to_execute)
+        self.link_graph = link_graph
+        self.cache = cache
         self.config = self._load_config(config_path or "config/nomenclature/v6_0.yaml")
         
         # Extract exemptions
@@ -242,6 +408,7 @@ class PLCValidator:
         self.excluded_files = set(exemptions.get('files', []))
         self.excluded_dirs = set(exemptions.get('directories', []))
         self.excluded_patterns = exemptions.get('patterns', [])
+        self._excluded_regex = compile_exclusion_pattern(self.excluded_patterns)
         
         # Extract allowlists for Rung 1 enforcement
         allowlists = self.config.get('allowlists', {})
@@ -254,6 +421,67 @@ class PLCValidator:
         self.allowed_types = set(allowlists.get('types', []))
         self.allowed_statuses = set(allowlists.get('statuses', []))
         self.allowed_extensions = set(allowlists.get('extensions', []))
+        
+        self._compile_decision_tables()
+        
+        # Field-tuple memo for rungs 1, 3 and 5 (results are shared, read-only)
+        self._rung_keys = {rung: itemgetter(*names) for rung, names in self.RUNG_KEY_FIELDS.items()}
+        self._rung_cache: Dict[int, Dict[Tuple[str, ...], PLCRungResult]] = {
+            rung: {} for rung in self.RUNG_KEY_FIELDS
+        }
+        self._rung_cache_stats = {rung: {'hits': 0, 'misses': 0} for rung in self.RUNG_KEY_FIELDS}
+    
+    def _compile_decision_tables(self) -> None:
+        """
+        Compile the RUNG 1-3 rules into lookup tables.
+        
+        Built once per validator from the allowlists and ontology maps:
+        an ATA_ROOT -> allowed BLOCK array over 0..ATA_ROOT_MAX and
+        frozenset membership tables keyed by the governing field. Each
+        entry keeps the original list for rendering messages.
+        """
+        def membership(rules: Dict[str, List[str]]) -> Dict[str, Tuple[List[str], FrozenSet[str]]]:
+            return {key: (values, frozenset(values)) for key, values in rules.items()}
+        
+        # RUNG 1: (field, allowlist, sorted allowlist, code, is_error) in check order.
+        # Empty allowlists disable their check; the VERSION row always runs
+        # because a malformed VERSION is reported regardless.
+        rows = [
+            ('family', self.allowed_families, ViolationCode.FAMILY_NOT_ALLOWED, True),
+            ('variant', self.allowed_variants, ViolationCode.VARIANT_NOT_ALLOWED, True),
+            ('version', self.allowed_version_brands, ViolationCode.VERSION_BRAND_NOT_ALLOWED, True),
+            ('model', self.allowed_models, ViolationCode.MODEL_NOT_ALLOWED, True),
+            ('block', self.allowed_blocks, ViolationCode.BLOCK_NOT_ALLOWED, False),
+            ('aor', self.allowed_aors, ViolationCode.AOR_NOT_ALLOWED, True),
+            ('type', self.allowed_types, ViolationCode.TYPE_NOT_ALLOWED, False),
+            ('status', self.allowed_statuses, ViolationCode.STATUS_NOT_ALLOWED, True),
+            ('ext', self.allowed_extensions, ViolationCode.EXT_NOT_ALLOWED, False),
+        ]
+        self._allowlist_table = [
+            (name, frozenset(allowed), sorted(allowed), code, is_error)
+            for name, allowed, code, is_error in rows
+            if allowed or name == 'version'
+        ]
+        
+        # RUNG 2
+        self._variant_subject_prefix = {
+            variant: re.compile(pattern)
+            for variant, pattern in self.VARIANT_SUBJECT_PREFIX.items()
+        }
+        self._teknia_types = frozenset(self.TEKNIA_TYPES)
+        self._teknia_issuance_aors = frozenset(self.TEKNIA_ISSUANCE_AORS)
+        
+        # RUNG 3: first matching range wins, as in ATA_BLOCK_MAP order
+        self._ata_blocks: List[Optional[Tuple[List[str], FrozenSet[str]]]] = [None] * (ATA_ROOT_MAX + 1)
+        for (ata_min, ata_max), valid_blocks in self.ATA_BLOCK_MAP.items():
+            entry = (valid_blocks, frozenset(valid_blocks))
+            for ata in range(ata_min, min(ata_max, ATA_ROOT_MAX) + 1):
+                if self._ata_blocks[ata] is None:
+                    self._ata_blocks[ata] = entry
+        self._phase_status = membership(self.PHASE_STATUS_RULES)
+        self._aor_knots = membership(self.AOR_KNOT_MAP)
+        self._model_types = membership(self.MODEL_TYPE_MAP)
+        self._block_aors = membership(self.BLOCK_AOR_MAP)
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
@@ -277,11 +505,39 @@ class PLCValidator:
         Returns:
             Dictionary of parsed fields, or None if parsing fails
         """
-        match = self.PATTERN_V6.match(filename)
-        if match:
-            return match.groupdict()
+        fields = nomenclature.parse(filename)
+        if fields:
+            return fields.as_dict()
         return None
     
+    def _memoized_rung(self, rung_id: int, execute, fields: Dict[str, str]) -> PLCRungResult:
+        """Run a rung through the field-tuple memo."""
+        key = self._rung_keys[rung_id](fields)
+        cache = self._rung_cache[rung_id]
+        stats = self._rung_cache_stats[rung_id]
+        result = cache.get(key)
+        if result is not None:
+            stats['hits'] += 1
+            return result
+        stats['misses'] += 1
+        if len(cache) >= self.RUNG_CACHE_SIZE:
+            cache.clear()
+        result = cache[key] = execute(fields)
+        return result
+    
+    def cache_info(self) -> Dict[int, Dict[str, Any]]:
+        """Per-rung memo statistics: hits, misses, size and hit_rate (0-1)."""
+        info = {}
+        for rung, stats in self._rung_cache_stats.items():
+            lookups = stats['hits'] + stats['misses']
+            info[rung] = {
+                'hits': stats['hits'],
+                'misses': stats['misses'],
+                'size': len(self._rung_cache[rung]),
+                'hit_rate': stats['hits'] / lookups if lookups else 0.0,
+            }
+        return info
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # PLC RUNG METHODS
     # ═══════════════════════════════════════════════════════════════════════════
@@ -315,55 +571,19 @@ class PLCValidator:
         errors = []
         warnings = []
         
-        # Check FAMILY
-        family = fields.get('family', '')
-        if self.allowed_families and family not in self.allowed_families:
-            errors.append(f"FAMILY '{family}' not in allowlist: {sorted(self.allowed_families)}")
-        
-        # Check VARIANT
-        variant = fields.get('variant', '')
-        if self.allowed_variants and variant not in self.allowed_variants:
-            errors.append(f"VARIANT '{variant}' not in allowlist: {sorted(self.allowed_variants)}")
-        
-        # Check VERSION (brand root)
-        version = fields.get('version', '')
-        version_brand = re.match(r'^(PLUS|PLUSULTRA)', version)
-        if version_brand:
-            brand = version_brand.group(1)
-            if self.allowed_version_brands and brand not in self.allowed_version_brands:
-                errors.append(f"VERSION brand '{brand}' not in allowlist: {sorted(self.allowed_version_brands)}")
-        else:
-            errors.append(f"VERSION '{version}' does not match expected pattern")
-        
-        # Check MODEL
-        model = fields.get('model', '')
-        if self.allowed_models and model not in self.allowed_models:
-            errors.append(f"MODEL '{model}' not in allowlist: {sorted(self.allowed_models)}")
-        
-        # Check BLOCK
-        block = fields.get('block', '')
-        if self.allowed_blocks and block not in self.allowed_blocks:
-            warnings.append(f"BLOCK '{block}' not in allowlist: {sorted(self.allowed_blocks)}")
-        
-        # Check AoR
-        aor = fields.get('aor', '')
-        if self.allowed_aors and aor not in self.allowed_aors:
-            errors.append(f"AoR '{aor}' not in allowlist: {sorted(self.allowed_aors)}")
-        
-        # Check TYPE
-        type_code = fields.get('type', '')
-        if self.allowed_types and type_code not in self.allowed_types:
-            warnings.append(f"TYPE '{type_code}' not in allowlist: {sorted(self.allowed_types)}")
-        
-        # Check STATUS
-        status = fields.get('status', '')
-        if self.allowed_statuses and status not in self.allowed_statuses:
-            errors.append(f"STATUS '{status}' not in allowlist: {sorted(self.allowed_statuses)}")
-        
-        # Check EXT
-        ext = fields.get('ext', '')
-        if self.allowed_extensions and ext not in self.allowed_extensions:
-            warnings.append(f"EXT '{ext}' not in allowlist: {sorted(self.allowed_extensions)}")
+        for name, allowed, listing, code, is_error in self._allowlist_table:
+            value = fields.get(name, '')
+            if name == 'version':
+                # Check VERSION (brand root)
+                version_brand = self.VERSION_BRAND_PATTERN.match(value)
+                if not version_brand:
+                    errors.append(Violation(ViolationCode.VERSION_MALFORMED, value))
+                    continue
+                value = version_brand.group(1)
+                if not allowed:
+                    continue
+            if value not in allowed:
+                (errors if is_error else warnings).append(Violation(code, value, listing))
         
         return PLCRungResult(
             rung_id=1,
@@ -390,21 +610,15 @@ class PLCValidator:
         aor = fields.get('aor', '')
         
         # Check VARIANT ↔ SUBJECT prefix requirements
-        if variant in self.VARIANT_SUBJECT_PREFIX:
-            pattern = self.VARIANT_SUBJECT_PREFIX[variant]
-            if not re.match(pattern, subject):
-                errors.append(
-                    f"VARIANT '{variant}' requires SUBJECT to match pattern '{pattern}', "
-                    f"got '{subject}'"
-                )
+        prefix = self._variant_subject_prefix.get(variant)
+        if prefix is not None and not prefix.match(subject):
+            errors.append(Violation(ViolationCode.VARIANT_SUBJECT_PREFIX,
+                                    variant, prefix.pattern, subject))
         
         # Check TEKNIA credential issuance constraints
-        if type_code in self.TEKNIA_TYPES:
-            if aor not in self.TEKNIA_ISSUANCE_AORS:
-                errors.append(
-                    f"TEKNIA credential TYPE '{type_code}' can only be issued by "
-                    f"AoR in {self.TEKNIA_ISSUANCE_AORS}, got '{aor}'"
-                )
+        if type_code in self._teknia_types and aor not in self._teknia_issuance_aors:
+            errors.append(Violation(ViolationCode.TEKNIA_ISSUANCE_AOR,
+                                    type_code, self.TEKNIA_ISSUANCE_AORS, aor))
         
         return PLCRungResult(
             rung_id=2,
@@ -425,6 +639,11 @@ class PLCValidator:
         warnings = []
         chain_violations = []
         
+        def chain(code: ViolationCode, key: str, expected: List[str], actual: str) -> None:
+            field1, field2 = CHAIN_FIELDS[code]
+            chain_violations.append((field1, field2, ChainReason(code, key, expected, actual)))
+            warnings.append(Violation(code, key, expected, actual))
+        
         ata_root = int(fields.get('ata_root', '0'))
         block = fields.get('block', '')
         phase = fields.get('phase', '')
@@ -438,66 +657,50 @@ class PLCValidator:
         knot_id = knot_task.split('-')[0]  # K01, K02, etc.
         
         # ATA_ROOT ↔ BLOCK coherence
-        ata_mapped = False
-        for (ata_min, ata_max), valid_blocks in self.ATA_BLOCK_MAP.items():
-            if ata_min <= ata_root <= ata_max:
-                ata_mapped = True
-                if block not in valid_blocks and block != 'GEN':
-                    chain_violations.append(('ATA_ROOT', 'BLOCK',
-                        f"ATA {ata_root} typically uses BLOCK in {valid_blocks}, not '{block}'"))
-                    warnings.append(f"ATA_ROOT↔BLOCK: ATA {ata_root} typically in {valid_blocks}, not '{block}'")
-                break
-        
-        if not ata_mapped and block != 'GEN':
-            warnings.append(f"ATA_ROOT↔BLOCK: ATA {ata_root} has no explicit mapping; GEN preferred for unmapped")
+        ata_rule = self._ata_blocks[ata_root] if 0 <= ata_root <= ATA_ROOT_MAX else None
+        if ata_rule is not None:
+            if block not in ata_rule[1] and block != 'GEN':
+                chain(ViolationCode.ATA_BLOCK, ata_root, ata_rule[0], block)
+        elif block != 'GEN':
+            warnings.append(Violation(ViolationCode.ATA_UNMAPPED, ata_root))
         
         # PHASE ↔ STATUS lifecycle alignment
-        if phase.startswith('LC') and phase in self.PHASE_STATUS_RULES:
-            valid_statuses = self.PHASE_STATUS_RULES[phase]
-            if status not in valid_statuses:
-                chain_violations.append(('PHASE', 'STATUS',
-                    f"{phase} typically has STATUS in {valid_statuses}, not '{status}'"))
-                warnings.append(f"PHASE↔STATUS: {phase} typically uses STATUS in {valid_statuses}, not '{status}'")
+        rule = self._phase_status.get(phase)
+        if rule is not None and status not in rule[1]:
+            chain(ViolationCode.PHASE_STATUS, phase, rule[0], status)
         
         # AoR ↔ KNOT governance mapping
-        if aor in self.AOR_KNOT_MAP:
-            expected_knots = self.AOR_KNOT_MAP[aor]
-            if knot_id not in expected_knots:
-                chain_violations.append(('AoR', 'KNOT_TASK',
-                    f"AoR '{aor}' typically works on KNOTs {expected_knots}, not '{knot_id}'"))
-                warnings.append(f"AoR↔KNOT: AoR '{aor}' typically participates in {expected_knots}, not '{knot_id}'")
+        rule = self._aor_knots.get(aor)
+        if rule is not None and knot_id not in rule[1]:
+            chain(ViolationCode.AOR_KNOT, aor, rule[0], knot_id)
         
         # MODEL ↔ TYPE alignment
-        if model in self.MODEL_TYPE_MAP:
-            valid_types = self.MODEL_TYPE_MAP[model]
-            if type_code not in valid_types:
-                chain_violations.append(('MODEL', 'TYPE',
-                    f"MODEL '{model}' typically uses TYPE in {valid_types}, not '{type_code}'"))
-                warnings.append(f"MODEL↔TYPE: MODEL '{model}' typically uses TYPE in {valid_types}, not '{type_code}'")
+        rule = self._model_types.get(model)
+        if rule is not None and type_code not in rule[1]:
+            chain(ViolationCode.MODEL_TYPE, model, rule[0], type_code)
         
         # BLOCK ↔ AoR coherence
-        if block in self.BLOCK_AOR_MAP:
-            expected_aors = self.BLOCK_AOR_MAP[block]
-            if aor not in expected_aors:
-                chain_violations.append(('BLOCK', 'AoR',
-                    f"BLOCK '{block}' typically has AoR in {expected_aors}, not '{aor}'"))
-                warnings.append(f"BLOCK↔AoR: BLOCK '{block}' typically works with AoR in {expected_aors}, not '{aor}'")
+        rule = self._block_aors.get(block)
+        if rule is not None and aor not in rule[1]:
+            chain(ViolationCode.BLOCK_AOR, block, rule[0], aor)
         
         # Cross-field semantic validation for special variants
-        if variant == 'CERT' and block not in ['CERT', 'SAF', 'GEN'] and aor not in ['CERT', 'SAF']:
-            warnings.append("VARIANT↔BLOCK/AoR: CERT variant should typically have CERT/SAF BLOCK or AoR")
+        if (variant == 'CERT' and block not in self.CERT_VARIANT_BLOCKS
+                and aor not in self.CERT_VARIANT_AORS):
+            warnings.append(Violation(ViolationCode.CERT_VARIANT))
         
-        if variant == 'FLIGHTTEST' and block not in ['TEST', 'OPS', 'SYS'] and aor not in ['TEST', 'OPS']:
-            warnings.append("VARIANT↔BLOCK/AoR: FLIGHTTEST variant should typically have TEST/OPS BLOCK or AoR")
+        if (variant == 'FLIGHTTEST' and block not in self.FLIGHTTEST_VARIANT_BLOCKS
+                and aor not in self.FLIGHTTEST_VARIANT_AORS):
+            warnings.append(Violation(ViolationCode.FLIGHTTEST_VARIANT))
         
         # S-axis (ATA 100-114) should have TEST-related content
-        if 100 <= ata_root <= 114 and block not in ['TEST', 'SW', 'DATA', 'SYS', 'GEN']:
-            warnings.append(f"ATA_ROOT↔BLOCK: S-axis ATA {ata_root} should typically use TEST/SW/DATA/SYS BLOCK")
+        if 100 <= ata_root <= 114 and block not in self.S_AXIS_BLOCKS:
+            warnings.append(Violation(ViolationCode.S_AXIS_BLOCK, ata_root))
         
         # Neural chapters (95-98) should have AI/DATA content
         if 95 <= ata_root <= 98:
-            if block not in ['AI', 'DATA', 'SW', 'GEN'] and aor not in ['AI', 'DATA']:
-                warnings.append(f"ATA_ROOT↔BLOCK/AoR: Neural ATA {ata_root} should typically have AI/DATA BLOCK or AoR")
+            if block not in self.NEURAL_BLOCKS and aor not in self.NEURAL_AORS:
+                warnings.append(Violation(ViolationCode.NEURAL_BLOCK, ata_root))
         
         return PLCRungResult(
             rung_id=3,
@@ -508,28 +711,57 @@ class PLCValidator:
             data={'chain_violations': chain_violations, 'ontology_checks': True}
         )
     
-    def _execute_rung_4(self, fields: Dict[str, str], filename: str) -> PLCRungResult:
+    def build_link_graph(self, repo_root: Path = Path('.'),
+                         index: Optional[RepoIndex] = None) -> Optional[LinkGraph]:
+        """
+        Build the RUNG 4 link graph once (no-op if RUNG 4 is not selected
+        or a graph is already set).
+        """
+        if self.link_graph is None and 4 in self._rungs:
+            self.link_graph = LinkGraph(repo_root, index=index, cache=self.cache)
+        return self.link_graph
+    
+    def _execute_rung_4(self, fields: Dict[str, str], filename: str,
+                        path: Optional[Path] = None) -> PLCRungResult:
         """
         RUNG 4 — Cross-reference Integrity
-        Internal links and index references resolve correctly.
-        (Placeholder - full implementation requires file system access)
+        Internal links made by the file resolve correctly.
+        
+        Looks the file up in the prebuilt link graph (outgoing and incoming
+        references), so the check is O(degree) rather than a content read.
+        Skipped when no graph or no file path is available.
         """
-        warnings = []
+        graph = self.link_graph
+        rel_path = graph.rel_path(path) if graph is not None and path is not None else None
+        if rel_path is None:
+            return PLCRungResult(
+                rung_id=4,
+                rung_name=self.RUNG_NAMES[4],
+                passed=True,
+                data={'cross_reference_checks': 'skipped'}
+            )
         
-        # This rung would check:
-        # 1. If file contains links, verify they resolve
-        # 2. If file is referenced in an index, verify index entry exists
-        # 3. Verify canonical path matches expected location
+        errors = []
+        warnings = []
         
-        # Placeholder: In production, this would scan file content for links
-        warnings.append("RUNG 4: Cross-reference integrity check not fully implemented (placeholder)")
+        outgoing = graph.outgoing(rel_path)
+        for edge in outgoing:
+            if edge.broken:
+                warnings.append(Violation(ViolationCode.BROKEN_LINK,
+                                          edge.line_number, edge.link_target))
         
         return PLCRungResult(
             rung_id=4,
             rung_name=self.RUNG_NAMES[4],
-            passed=True,  # Pass by default until fully implemented
+            passed=len(errors) == 0,
+            errors=errors,
             warnings=warnings,
-            data={'cross_reference_checks': 'placeholder'}
+            data={
+                'cross_reference_checks': True,
+                'outgoing_links': len(outgoing),
+                'incoming_links': len(graph.incoming(rel_path)),
+                'broken_links': len(warnings),
+            }
         )
     
     def _execute_rung_5(self, fields: Dict[str, str]) -> PLCRungResult:
@@ -571,12 +803,13 @@ class PLCValidator:
             data={'release_gating_checks': True}
         )
     
-    def execute_plc_rungs(self, filename: str) -> PLCValidationResult:
+    def execute_plc_rungs(self, filename: str, path: Optional[Path] = None) -> PLCValidationResult:
         """
         Execute all PLC rungs on a filename.
         
         Args:
             filename: The filename to validate
+            path: Path of the file on disk (needed for RUNG 4)
             
         Returns:
             PLCValidationResult with all rung results
@@ -585,9 +818,8 @@ class PLCValidator:
         if filename in self.excluded_files:
             return PLCValidationResult(filename, True, {})
         
-        for pattern in self.excluded_patterns:
-            if re.match(pattern, filename):
-                return PLCValidationResult(filename, True, {})
+        if self._excluded_regex is not None and self._excluded_regex.match(filename):
+            return PLCValidationResult(filename, True, {})
         
         rung_results = []
         all_errors = []
@@ -596,7 +828,7 @@ class PLCValidator:
         fields = {}
         
         # RUNG 0: Parse & Tokenize
-        if 0 in self.rungs_to_execute:
+        if 0 in self._rungs:
             rung0 = self._execute_rung_0(filename)
             rung_results.append(rung0)
             all_errors.extend(rung0.errors)
@@ -625,37 +857,37 @@ class PLCValidator:
                 )
         
         # RUNG 1: Allowlist Enforcement
-        if 1 in self.rungs_to_execute:
-            rung1 = self._execute_rung_1(fields)
+        if 1 in self._rungs:
+            rung1 = self._memoized_rung(1, self._execute_rung_1, fields)
             rung_results.append(rung1)
             all_errors.extend(rung1.errors)
             all_warnings.extend(rung1.warnings)
         
         # RUNG 2: Cross-field Semantics
-        if 2 in self.rungs_to_execute:
+        if 2 in self._rungs:
             rung2 = self._execute_rung_2(fields)
             rung_results.append(rung2)
             all_errors.extend(rung2.errors)
             all_warnings.extend(rung2.warnings)
         
         # RUNG 3: Context Constraints
-        if 3 in self.rungs_to_execute:
-            rung3 = self._execute_rung_3(fields)
+        if 3 in self._rungs:
+            rung3 = self._memoized_rung(3, self._execute_rung_3, fields)
             rung_results.append(rung3)
             all_errors.extend(rung3.errors)
             all_warnings.extend(rung3.warnings)
             all_chain_violations.extend(rung3.data.get('chain_violations', []))
         
         # RUNG 4: Cross-reference Integrity
-        if 4 in self.rungs_to_execute:
-            rung4 = self._execute_rung_4(fields, filename)
+        if 4 in self._rungs:
+            rung4 = self._execute_rung_4(fields, filename, path)
             rung_results.append(rung4)
             all_errors.extend(rung4.errors)
             all_warnings.extend(rung4.warnings)
         
         # RUNG 5: Release Gating
-        if 5 in self.rungs_to_execute:
-            rung5 = self._execute_rung_5(fields)
+        if 5 in self._rungs:
+            rung5 = self._memoized_rung(5, self._execute_rung_5, fields)
             rung_results.append(rung5)
             all_errors.extend(rung5.errors)
             all_warnings.extend(rung5.warnings)
@@ -678,7 +910,8 @@ class PLCValidator:
             chain_violations=all_chain_violations
         )
     
-    def validate_chained_consistency(self, filename: str) -> PLCValidationResult:
+    def validate_chained_consistency(self, filename: str,
+                                     path: Optional[Path] = None) -> PLCValidationResult:
         """
         Validate chained consistency between nomenclature fields.
         
@@ -686,24 +919,42 @@ class PLCValidator:
         
         Args:
             filename: The filename to validate
+            path: Path of the file on disk (needed for RUNG 4)
             
         Returns:
             PLCValidationResult with consistency validation results
         """
-        return self.execute_plc_rungs(filename)
+        return self.execute_plc_rungs(filename, path)
     
-    def validate_directory(self, directory: Path, recursive: bool = True) -> List[PLCValidationResult]:
-        """Validate all files in a directory."""
+    def validate_directory(self, directory: Path, recursive: bool = True,
+                           index: Optional[RepoIndex] = None,
+                           repo_root: Path = Path('.')) -> List[PLCValidationResult]:
+        """
+        Validate all files in a directory (using the shared index if given).
+        
+        The RUNG 4 link graph is always built on the repository root, so
+        repo-absolute links resolve (and are recorded) the same way whichever
+        directory is checked; only the files under ``directory`` are validated.
+        """
         results = []
         
         if recursive:
-            for path in directory.rglob('*'):
-                if path.is_file() and not self._is_excluded_path(path):
-                    results.append(self.validate_chained_consistency(path.name))
+            index = index_for(repo_root, index)
+            if not index.covers(directory):
+                index = index_for(directory)  # Directory outside the repository
+            self.build_link_graph(index.repo_root, index)
+            for entry in index.files(
+                under=directory,
+                exclude_dirs=self.excluded_dirs,
+                exclude_files=self.excluded_files,
+                exclude_patterns=self.excluded_patterns
+            ):
+                results.append(self.validate_chained_consistency(entry.name, entry.path))
         else:
+            self.build_link_graph(repo_root, index)
             for path in directory.iterdir():
                 if path.is_file() and path.name not in self.excluded_files:
-                    results.append(self.validate_chained_consistency(path.name))
+                    results.append(self.validate_chained_consistency(path.name, path))
         
         return results
     
@@ -754,8 +1005,14 @@ def print_result(result: PLCValidationResult, verbose: bool = False, show_rungs:
                 print(f"    • {field1}↔{field2}: {reason}")
 
 
-def generate_plc_report(results: List[PLCValidationResult]) -> Dict[str, Any]:
-    """Generate a summary report of PLC validation results."""
+def generate_plc_report(results: List[PLCValidationResult],
+                        validator: Optional[PLCValidator] = None) -> Dict[str, Any]:
+    """
+    Generate a summary report of PLC validation results.
+    
+    If the validator that produced the results is given, its per-rung
+    field-tuple cache statistics are included under 'rung_cache'.
+    """
     total = len(results)
     valid = sum(1 for r in results if r.valid)
     invalid = total - valid
@@ -787,9 +1044,28 @@ def generate_plc_report(results: List[PLCValidationResult]) -> Dict[str, Any]:
         'files_with_warnings': sum(1 for r in results if r.consistency_warnings),
         'files_with_errors': sum(1 for r in results if r.consistency_errors),
         'rung_statistics': rung_stats,
+        'rung_cache': validator.cache_info() if validator is not None else {},
     }
 
 
+def record_link_checks(graph: LinkGraph, db_path: str) -> int:
+    """Record the RUNG 4 link graph in the link_integrity table of a PLC database."""
+    try:
+        from plc_db import PLCDatabase
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from plc_db import PLCDatabase
+    
+    db = PLCDatabase(db_path)
+    if not Path(db_path).exists():
+        db.initialize_database()
+    count = graph.record_to_db(db)
+    broken = sum(1 for edge in graph.edges() if edge.broken)
+    print(f"🗄  Recorded {count} link checks ({broken} broken) from "
+          f"{graph.files_scanned} files in {db_path}")
+    return count
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -802,7 +1078,7 @@ PLC RUNG STACK ARCHITECTURE:
   RUNG 1: Allowlist Enforcement - FAMILY/VARIANT/VERSION/MODEL/AoR/TYPE/STATUS
   RUNG 2: Cross-field Semantics - VARIANT↔SUBJECT prefix, TEKNIA issuance
   RUNG 3: Context Constraints   - ATA↔BLOCK, PHASE↔STATUS, MODEL↔TYPE
-  RUNG 4: Cross-reference       - Internal link integrity (placeholder)
+  RUNG 4: Cross-reference       - Internal link integrity (link graph)
   RUNG 5: Release Gating        - PR^3 aware, lifecycle STATUS checks
 ═══════════════════════════════════════════════════════════════════════════════
 
@@ -867,6 +1143,13 @@ Examples:
         action='store_true',
         help='Show individual rung results in output'
     )
+    parser.add_argument(
+        '--db',
+        metavar='PATH',
+        help='Record RUNG 4 link checks in the link_integrity table of this PLC database'
+    )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
@@ -884,26 +1167,41 @@ Examples:
         except ValueError:
             parser.error('--rung must be comma-separated integers (e.g., 0,1,2)')
     
+    try:
+        # Restrict directory scans to files changed since --since REF
+        changes = change_set_from_args(args, Path('.'))
+        index = changes.index(args.config) if changes else None
+    except ChangeSetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    cache = cache_from_args(args, args.db or "plc_ontology.db")
     validator = PLCValidator(
         config_path=args.config,
         strict=args.strict,
         mode=args.mode,
-        rungs=rungs
+        rungs=rungs,
+        cache=cache
     )
     results = []
     
     try:
         if args.filename:
-            result = validator.validate_chained_consistency(args.filename)
+            file_path = Path(args.filename)
+            if file_path.is_file():
+                validator.build_link_graph(Path('.'), index)
+                result = validator.validate_chained_consistency(file_path.name, file_path)
+            else:
+                result = validator.validate_chained_consistency(args.filename)
             results = [result]
         elif args.check_dir:
             dir_path = Path(args.check_dir)
             if not dir_path.is_dir():
                 print(f"Error: '{args.check_dir}' is not a directory", file=sys.stderr)
                 return 2
-            results = validator.validate_directory(dir_path, recursive=True)
+            results = validator.validate_directory(dir_path, recursive=True, index=index)
         elif args.check_all:
-            results = validator.validate_directory(Path('.'), recursive=True)
+            results = validator.validate_directory(Path('.'), recursive=True, index=index)
         
         # Print results
         valid_count = 0
@@ -933,7 +1231,7 @@ Examples:
             print(f"  ⚠ With warnings: {warning_count}")
             
             if args.report:
-                report = generate_plc_report(results)
+                report = generate_plc_report(results, validator)
                 print(f"\nPass rate: {report['pass_rate']}")
                 
                 # Print rung statistics
@@ -948,6 +1246,12 @@ Examples:
                         print(f"  RUNG {rung_id}: {stats['name']}")
                         print(f"    Passed: {passed}, Failed: {failed} ({rate:.1f}%)")
                 
+                if report['rung_cache']:
+                    print("\nRung cache (field-tuple memo):")
+                    for rung_id, stats in sorted(report['rung_cache'].items()):
+                        print(f"  RUNG {rung_id}: {stats['hits']} hits, {stats['misses']} misses "
+                              f"({stats['hit_rate']*100:.1f}% hit rate)")
+                
                 if report['chain_violation_summary']:
                     print("\nChain violation breakdown:")
                     for chain, count in sorted(report['chain_violation_summary'].items(), 
@@ -956,6 +1260,9 @@ Examples:
             
             print(f"{'═'*70}")
         
+        if args.db and validator.link_graph is not None:
+            record_link_checks(validator.link_graph, args.db)
+        
         return 0 if invalid_count == 0 else 1
         
     except Exception as e:
@@ -963,6 +1270,8 @@ Examples:
         import traceback
         traceback.print_exc()
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
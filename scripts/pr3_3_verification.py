@@ -6,22 +6,31 @@ AMPEL360 Space-T PR^3-3 Final Verification Suite
 Comprehensive validation for predicted release freeze.
 Runs all validation checks and generates a final report.
 
+Gates run in-process and in parallel via scripts/gate_runner.py.
+
 Usage:
     python scripts/pr3_3_verification.py --all
     python scripts/pr3_3_verification.py --report-only
 """
 
 import argparse
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Import in-process gate runner
+try:
+    from gate_runner import GateRunner
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from gate_runner import GateRunner
+
 
 class PR3Verification:
     """PR^3-3 Release Verification Suite."""
     
-    def __init__(self):
+    def __init__(self, jobs=None):
+        self.jobs = jobs
         self.results = {
             'nomenclature': None,
             'links': None,
@@ -33,131 +42,94 @@ class PR3Verification:
         self.failed = 0
         self.warnings = 0
         
-    def run_nomenclature_validation(self):
-        """Run nomenclature validation (GATE-001)."""
+    @staticmethod
+    def _print_output_tail(gate_result):
+        """Show the end of a gate's captured output (or its traceback)."""
+        text = gate_result.exception or gate_result.output
+        print(text[-500:] if len(text) > 500 else text)
+        
+    def run_nomenclature_validation(self, gate_result):
+        """Report nomenclature validation (GATE-001)."""
         print("\n" + "="*70)
         print("GATE-001: Nomenclature Validation (v6.0 R1.0)")
         print("="*70)
         
-        try:
-            result = subprocess.run(
-                ['python', 'validate_nomenclature.py', '--standard', 'v6.0', 
-                 '--check-all', '--mode', 'block', '--strict'],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode == 0:
-                print("✅ PASS - All files comply with v6.0 R1.0")
-                self.results['nomenclature'] = 'PASS'
-                self.passed += 1
-                
-                # Extract statistics
-                for line in result.stdout.split('\n'):
-                    if 'Summary:' in line:
-                        print(f"   {line.strip()}")
-            else:
-                print("❌ FAIL - Nomenclature violations found")
-                print(result.stdout[-500:] if len(result.stdout) > 500 else result.stdout)
-                self.results['nomenclature'] = 'FAIL'
-                self.failed += 1
-                
-        except Exception as e:
-            print(f"❌ ERROR - {str(e)}")
+        if gate_result.exception:
+            print("❌ ERROR - Nomenclature gate raised")
+            self._print_output_tail(gate_result)
             self.results['nomenclature'] = 'ERROR'
             self.failed += 1
+        elif gate_result.passed:
+            print("✅ PASS - All files comply with v6.0 R1.0")
+            print(f"   {gate_result.summary}")
+            self.results['nomenclature'] = 'PASS'
+            self.passed += 1
+        else:
+            print("❌ FAIL - Nomenclature violations found")
+            invalid_files = gate_result.details.get('invalid_files', [])
+            for filename in invalid_files[:10]:
+                print(f"   ✗ {filename}")
+            if len(invalid_files) > 10:
+                print(f"   ... and {len(invalid_files) - 10} more")
+            print(f"   {gate_result.summary}")
+            self.results['nomenclature'] = 'FAIL'
+            self.failed += 1
             
-    def run_link_checking(self):
-        """Run link checking."""
+    def run_link_checking(self, gate_result):
+        """Report link checking (GATE-LINK-001)."""
         print("\n" + "="*70)
         print("Link Checking (Internal Links)")
         print("="*70)
         
-        try:
-            result = subprocess.run(
-                ['python', 'scripts/check_and_update_links.py', '--check-only'],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            # Parse output for broken links
-            broken_count = 0
-            for line in result.stdout.split('\n'):
-                if 'Found' in line and 'broken link' in line:
-                    broken_count = int(line.split()[1])
-                    
-            if broken_count == 0:
-                print("✅ PASS - No broken internal links")
-                self.results['links'] = 'PASS'
-                self.passed += 1
-            else:
-                print(f"⚠️  WARNING - {broken_count} broken links found")
-                print("   Note: Deferred to post-release hotfix (KI-PR3-001)")
-                self.results['links'] = f'WARNING ({broken_count} broken)'
-                self.warnings += 1
-                
-        except Exception as e:
-            print(f"❌ ERROR - {str(e)}")
+        if gate_result.exception:
+            print("❌ ERROR - Link integrity gate raised")
+            self._print_output_tail(gate_result)
             self.results['links'] = 'ERROR'
             self.failed += 1
+            return
+        
+        broken_count = gate_result.error_count
+        if broken_count == 0:
+            print("✅ PASS - No broken internal links")
+            self.results['links'] = 'PASS'
+            self.passed += 1
+        else:
+            print(f"⚠️  WARNING - {broken_count} broken links found")
+            print("   Note: Deferred to post-release hotfix (KI-PR3-001)")
+            self.results['links'] = f'WARNING ({broken_count} broken)'
+            self.warnings += 1
             
-    def run_schema_validation(self):
-        """Run schema registry validation (GATE-002)."""
+    def run_schema_validation(self, gate_result):
+        """Report schema registry validation (GATE-002)."""
         print("\n" + "="*70)
         print("GATE-002: Schema Registration Check")
         print("="*70)
         
-        try:
-            result = subprocess.run(
-                ['python', 'scripts/validate_schema_registry.py', '--check-all'],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            if 'REGISTRY_MISSING' not in result.stdout and result.returncode == 0:
-                print("✅ PASS - Schema registries valid")
-                self.results['schemas'] = 'PASS'
-                self.passed += 1
-            else:
-                print("⚠️  WARNING - Schema registry issues")
-                print(result.stdout[-500:] if len(result.stdout) > 500 else result.stdout)
-                self.results['schemas'] = 'WARNING'
-                self.warnings += 1
-                
-        except Exception as e:
-            print(f"⚠️  WARNING - {str(e)}")
+        if gate_result.passed and not gate_result.details.get('registry_missing'):
+            print("✅ PASS - Schema registries valid")
+            self.results['schemas'] = 'PASS'
+            self.passed += 1
+        else:
+            print("⚠️  WARNING - Schema registry issues")
+            if gate_result.details.get('registry_missing'):
+                print("   REGISTRY_MISSING: No ATA 91 schema registry found in repository")
+            self._print_output_tail(gate_result)
             self.results['schemas'] = 'WARNING'
             self.warnings += 1
             
-    def run_trace_link_validation(self):
-        """Run trace link validation (GATE-003)."""
+    def run_trace_link_validation(self, gate_result):
+        """Report trace link validation (GATE-003)."""
         print("\n" + "="*70)
         print("GATE-003: Trace Link Integrity Check")
         print("="*70)
         
-        try:
-            result = subprocess.run(
-                ['python', 'scripts/validate_trace_links.py', '--check-all'],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            if 'VALIDATION FAILED' not in result.stdout and result.returncode == 0:
-                print("✅ PASS - Trace link integrity maintained")
-                self.results['trace_links'] = 'PASS'
-                self.passed += 1
-            else:
-                print("⚠️  WARNING - Trace link issues")
-                print(result.stdout[-500:] if len(result.stdout) > 500 else result.stdout)
-                self.results['trace_links'] = 'WARNING'
-                self.warnings += 1
-                
-        except Exception as e:
-            print(f"⚠️  WARNING - {str(e)}")
+        if gate_result.passed:
+            print("✅ PASS - Trace link integrity maintained")
+            self.results['trace_links'] = 'PASS'
+            self.passed += 1
+        else:
+            print("⚠️  WARNING - Trace link issues")
+            self._print_output_tail(gate_result)
             self.results['trace_links'] = 'WARNING'
             self.warnings += 1
             
@@ -252,10 +224,16 @@ class PR3Verification:
         print("\nRunning comprehensive validation suite...")
         print("This may take several minutes...\n")
         
-        self.run_nomenclature_validation()
-        self.run_link_checking()
-        self.run_schema_validation()
-        self.run_trace_link_validation()
+        # All gates run in parallel over one repository walk
+        gate_results = {
+            r.gate: r for r in GateRunner(Path('.'), jobs=self.jobs).run(
+                ['nomenclature', 'links', 'schemas', 'trace_links'])
+        }
+        
+        self.run_nomenclature_validation(gate_results['nomenclature'])
+        self.run_link_checking(gate_results['links'])
+        self.run_schema_validation(gate_results['schemas'])
+        self.run_trace_link_validation(gate_results['trace_links'])
         self.check_ci_gates_status()
         
         return self.generate_report()
@@ -276,10 +254,16 @@ def main():
         action='store_true',
         help='Generate report from previous run'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        metavar='N',
+        help='Gate worker processes (default: one per gate; 1 = sequential)'
+    )
     
     args = parser.parse_args()
     
-    verifier = PR3Verification()
+    verifier = PR3Verification(jobs=args.jobs)
     
     if args.all or (not args.report_only):
         exit_code = verifier.run_all()
@@ -6,29 +6,32 @@ Quick Link Updater for v5.0 Retrofit
 Quickly updates the most common broken links in key files.
 """
 
-import csv
 import re
+import sys
 from pathlib import Path
 
+# Import shared rename map
+try:
+    from rename_map import RenameMap, markdown_link_targets
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rename_map import RenameMap, markdown_link_targets
+
 
 def load_rename_map():
     """Load rename map."""
-    old_to_new = {}
-    with open('rename_map_v5.csv', 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            old_to_new[row['old_path']] = row['new_path']
-    return old_to_new
+    return RenameMap.from_csv(['rename_map_v5.csv'])
 
 
-def update_file(filepath, old_to_new):
+def update_file(filepath, renames):
     """Update a single file."""
     try:
         content = Path(filepath).read_text(encoding='utf-8', errors='ignore')
         original = content
         
-        # Update direct filename references
-        for old_path, new_path in old_to_new.items():
+        # Update direct filename references (only renames the links refer to)
+        targets = markdown_link_targets(content)
+        for old_path, new_path in renames.referenced_by(targets, by_name=True):
             old_name = Path(old_path).name
             new_name = Path(new_path).name
             
@@ -55,7 +58,7 @@ def update_file(filepath, old_to_new):
 def main():
     """Update key files."""
     print("Loading rename map...")
-    old_to_new = load_rename_map()
+    renames = load_rename_map()
     
     # Key files to update
     key_files = [
@@ -69,7 +72,7 @@ def main():
     updated = 0
     for filepath in key_files:
         if Path(filepath).exists():
-            if update_file(filepath, old_to_new):
+            if update_file(filepath, renames):
                 print(f"✓ Updated: {filepath}")
                 updated += 1
         else:
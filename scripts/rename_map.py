@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Rename Map
+===========================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Rename map (old_path -> new_path) loaded from the migration CSVs
+(rename_map_v5.csv, rename_map_v6.csv, ...) with path suffix lookups.
+
+Link fixers need to find the rename entries whose old path and a link
+target end in the same path components - either may be the longer one,
+e.g. '../K06/a.md' against 'STK_X/KNOTS/K06/a.md'. Instead of testing
+endswith() against every entry, the map is indexed by component suffix:
+the full component tuple of every old path, and every suffix tuple of
+it. A lookup is one probe per component of the link target (O(path
+depth)) whatever the size of the map. Results keep the map's entry order.
+
+Usage:
+    from rename_map import RenameMap
+
+    renames = RenameMap.from_csv(['rename_map_v6.csv', 'rename_map_v5.csv'])
+    for old_path, new_path in renames.matches('../K06/a.md'):
+        ...
+    new_path = renames.get(old_path)
+
+    # Only the entries a Markdown file can be rewritten with
+    for old_path, new_path in renames.referenced_by(markdown_link_targets(content)):
+        ...
+"""
+
+import csv
+import re
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+PathParts = Tuple[str, ...]
+
+# Target of every '](...)' (zero-width, so nested/overlapping links are all seen)
+LINK_TARGET_PATTERN = re.compile(r'(?=\]\(([^)]*)\))')
+
+
+def path_parts(path: str) -> PathParts:
+    """POSIX path components of a path string (empty components dropped)."""
+    return tuple(part for part in path.split('/') if part)
+
+
+def link_target_variants(targets: Iterable[str]) -> Set[str]:
+    """Link targets as written and also without a leading './' or '../'."""
+    variants = set()
+    for target in targets:
+        variants.add(target)
+        for prefix in ('./', '../'):
+            if target.startswith(prefix):
+                variants.add(target[len(prefix):])
+    return variants
+
+
+def markdown_link_targets(content: str) -> Set[str]:
+    """Targets of the Markdown links in content, also without a leading './' or '../'."""
+    return link_target_variants(match.group(1) for match in LINK_TARGET_PATTERN.finditer(content))
+
+
+class RenameMap:
+    """Ordered old_path -> new_path map with component suffix lookups."""
+
+    def __init__(self):
+        self.rows: List[Dict[str, str]] = []       # CSV rows as read
+        self.old_to_new: Dict[str, str] = {}       # Entry order = first insertion
+        self._order: Dict[str, int] = {}
+        self._by_path: Dict[PathParts, List[str]] = {}
+        self._by_suffix: Dict[PathParts, List[str]] = {}
+        self._by_name: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_csv(cls, csv_paths: Iterable[str], skip_unchanged: bool = False) -> 'RenameMap':
+        """Load one or more rename map CSVs, in order."""
+        renames = cls()
+        for csv_path in csv_paths:
+            renames.read_csv(csv_path, skip_unchanged=skip_unchanged)
+        return renames
+
+    def read_csv(self, csv_path: str, skip_unchanged: bool = False) -> int:
+        """
+        Add the entries of a rename map CSV (old_path, new_path columns).
+
+        Args:
+            csv_path: CSV file to read
+            skip_unchanged: Ignore rows whose old and new path are equal
+
+        Returns:
+            Number of rows read
+        """
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.rows.extend(rows)
+        for row in rows:
+            old_path = row.get('old_path', '')
+            new_path = row.get('new_path', '')
+            if not old_path or not new_path:
+                continue
+            if skip_unchanged and old_path == new_path:
+                continue
+            self.add(old_path, new_path)
+        return len(rows)
+
+    def add(self, old_path: str, new_path: str) -> None:
+        """Add an entry; re-adding an old path updates it in place."""
+        if old_path in self.old_to_new:
+            self.old_to_new[old_path] = new_path
+            return
+        self.old_to_new[old_path] = new_path
+        self._order[old_path] = len(self._order)
+
+        parts = path_parts(old_path)
+        self._by_path.setdefault(parts, []).append(old_path)
+        for i in range(len(parts)):
+            self._by_suffix.setdefault(parts[i:], []).append(old_path)
+        if parts:
+            self._by_name.setdefault(parts[-1], []).append(old_path)
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def get(self, old_path: str) -> Optional[str]:
+        """New path of an exact old path."""
+        return self.old_to_new.get(old_path)
+
+    def matches(self, path: str) -> List[Tuple[str, str]]:
+        """
+        Entries whose old path and ``path`` end in the same components.
+
+        Either one may be a component suffix of the other; the leading
+        './' and '../' of a relative link simply do not match anything.
+
+        Returns:
+            (old_path, new_path) pairs in entry order
+        """
+        parts = path_parts(path)
+        if not parts:
+            return []
+        found = set(self._by_suffix.get(parts, ()))
+        for i in range(1, len(parts)):
+            found.update(self._by_path.get(parts[i:], ()))
+        return [(old, self.old_to_new[old]) for old in sorted(found, key=self._order.__getitem__)]
+
+    def renamed_by_name(self, name: str) -> List[Tuple[str, str]]:
+        """
+        Entries with basename ``name`` whose basename changes.
+
+        Returns:
+            (old_path, new_path) pairs in entry order
+        """
+        return [
+            (old, self.old_to_new[old]) for old in self._by_name.get(name, ())
+            if PurePosixPath(self.old_to_new[old]).name != name
+        ]
+
+    def referenced_by(self, targets: Iterable[str],
+                      by_name: bool = False) -> List[Tuple[str, str]]:
+        """
+        Entries a set of link targets refers to, closed under chained renames.
+
+        An entry is included if its old path (or, with by_name, its old
+        basename) is one of the targets, or is the new path/name of an
+        included entry - so applying just these entries in order rewrites
+        content exactly as applying the whole map would.
+
+        Returns:
+            (old_path, new_path) pairs in entry order
+        """
+        pending = list(targets)
+        seen: Set[str] = set()
+        selected: Set[str] = set()
+        while pending:
+            target = pending.pop()
+            if target in seen:
+                continue
+            seen.add(target)
+            olds = [target] if target in self.old_to_new else []
+            if by_name:
+                olds.extend(self._by_name.get(target, ()))
+            for old in olds:
+                if old in selected:
+                    continue
+                selected.add(old)
+                new = self.old_to_new[old]
+                pending.append(new)
+                if by_name:
+                    pending.append(PurePosixPath(new).name)
+        return [(old, self.old_to_new[old]) for old in sorted(selected, key=self._order.__getitem__)]
+
+    def items(self):
+        return self.old_to_new.items()
+
+    def __contains__(self, old_path: str) -> bool:
+        return old_path in self.old_to_new
+
+    def __len__(self) -> int:
+        return len(self.old_to_new)
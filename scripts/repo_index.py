@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+AMPEL360 Space-T Repository Index
+=================================
+Version: 1.0
+Date: 2026-10-17
+Standard: Nomenclature Standard v6.0 R1.0
+
+Shared single-walk file index for the governance gates.
+
+The repository tree is walked exactly once. Every regular file is recorded
+with its path, size, mtime, extension, nomenclature exemption flag (from
+config/nomenclature/v6_0.yaml) and parsed nomenclature fields. Gates then
+take filtered views of the index instead of each running its own rglob /
+os.walk over the tree.
+
+The index also serves as an existence oracle for link checkers: exists(),
+is_file(), is_dir() and resolve() answer from the recorded file and
+directory sets, with '.' and '..' segments resolved in memory, and only
+touch the filesystem for paths the walk did not cover.
+
+Usage:
+    from repo_index import RepoIndex
+
+    index = RepoIndex(Path('.'))
+    for path in index.paths(suffixes={'.md'}, exclude_dirs={'templates'}):
+        ...
+
+    if index.exists(source.parent / link_target):
+        ...
+
+    # Share one index between gates
+    validator = NomenclatureValidator(standard="v6.0")
+    results = validator.validate_directory(Path('.'), index=index)
+    detector = DriftDetector(Path('.'), index=index)
+"""
+
+import os
+import re
+import stat
+import sys
+import yaml
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
+
+# Import shared filename parser
+try:
+    import nomenclature
+    from nomenclature import NomenclatureFields
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    import nomenclature
+    from nomenclature import NomenclatureFields
+
+
+# Directories never worth indexing for any gate
+PRUNED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+
+DEFAULT_CONFIG_PATH = "config/nomenclature/v6_0.yaml"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """A single regular file recorded by the index."""
+    path: Path                      # Absolute path
+    rel_path: str                   # POSIX path relative to the index root
+    name: str
+    dir_parts: Tuple[str, ...]      # Directory components of rel_path
+    size: int
+    mtime_ns: int
+    inode: int
+    ext: str                        # Suffix including the dot, as on disk
+    exempt: bool                    # Exempt from nomenclature validation (v6.0)
+    fields: Optional[NomenclatureFields] = None  # Parsed nomenclature fields
+
+    @property
+    def mtime(self) -> float:
+        """Modification time in seconds."""
+        return self.mtime_ns / 1e9
+
+
+def compile_exclusion_pattern(patterns: Iterable[str]) -> Optional[Pattern]:
+    """
+    Combine exemption patterns into a single precompiled regex.
+
+    Patterns keep ``re.match`` semantics (anchored at the start of the name).
+    Returns None when there are no patterns.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+def _parse_fields(name: str) -> Optional[NomenclatureFields]:
+    """Parse v6.0 nomenclature fields from a filename (memoized)."""
+    return nomenclature.parse(name, 'v6.0')
+
+
+class RepoIndex:
+    """
+    Single-walk index over a repository tree.
+
+    Only the directories in PRUNED_DIRS are skipped during the walk; all
+    gate-specific exclusions are applied as filters on the recorded entries,
+    so every gate keeps its own scan semantics.
+    """
+
+    def __init__(self, repo_root: Path = Path('.'),
+                 config_path: Optional[str] = None,
+                 parse_fields: bool = True,
+                 paths: Optional[Iterable[str]] = None):
+        """
+        Build the index.
+
+        Args:
+            repo_root: Root directory to walk
+            config_path: Nomenclature config providing exemptions
+                         (default: config/nomenclature/v6_0.yaml)
+            parse_fields: If True, parse nomenclature fields for each file
+            paths: If given, index only these POSIX paths (relative to
+                   repo_root) instead of walking the tree; missing files
+                   are skipped
+        """
+        self.repo_root = Path(repo_root)
+        self.root = self.repo_root.resolve()
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        self._parse = parse_fields
+
+        exemptions = self._load_exemptions(self.config_path)
+        self.exempt_files = set(exemptions.get('files', []))
+        self.exempt_dirs = set(exemptions.get('directories', []))
+        self.exempt_patterns = list(exemptions.get('patterns', []))
+        self._exempt_regex = compile_exclusion_pattern(self.exempt_patterns)
+
+        self.entries: List[IndexEntry] = []
+        self._by_rel: Dict[str, IndexEntry] = {}
+        self._dirs: Set[str] = set()        # Walked directories ('' = root)
+        self._has_symlinks = False          # Lexical '..' is only safe without them
+        self._root_prefix = str(self.root) + os.sep
+        self.partial = paths is not None
+        if paths is None:
+            self._walk()
+        else:
+            self._stat_paths(paths)
+
+    def _load_exemptions(self, config_path: str) -> Dict[str, List[str]]:
+        """Load nomenclature exemptions from the config file."""
+        path = Path(config_path)
+        if not path.is_absolute() and not path.exists():
+            path = self.root / config_path
+        if not path.exists():
+            path = Path(__file__).parent.parent / config_path
+        if not path.exists():
+            print(f"Warning: Config file not found at {config_path}, "
+                  f"indexing without exemptions", file=sys.stderr)
+            return {}
+        try:
+            with open(path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"Warning: Failed to load config from {config_path}: {e}",
+                  file=sys.stderr)
+            return {}
+        return config.get('exemptions', {}) or {}
+
+    def _is_exempt(self, name: str, dir_parts: Tuple[str, ...]) -> bool:
+        """Apply the nomenclature exemptions to a file."""
+        if name in self.exempt_files:
+            return True
+        if any(part in self.exempt_dirs for part in dir_parts):
+            return True
+        return bool(self._exempt_regex and self._exempt_regex.match(name))
+
+    def _make_entry(self, path: str, dir_parts: Tuple[str, ...], name: str,
+                    st: os.stat_result) -> IndexEntry:
+        """Build an entry from a stat result."""
+        return IndexEntry(
+            path=Path(path),
+            rel_path='/'.join(dir_parts + (name,)),
+            name=name,
+            dir_parts=dir_parts,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            inode=st.st_ino,
+            ext=os.path.splitext(name)[1],
+            exempt=self._is_exempt(name, dir_parts),
+            fields=_parse_fields(name) if self._parse else None,
+        )
+
+    def _finish(self, entries: List[IndexEntry]) -> None:
+        """Sort entries into path order and build the lookup table."""
+        entries.sort(key=lambda e: e.rel_path)
+        self.entries = entries
+        self._by_rel = {e.rel_path: e for e in entries}
+
+    def _stat_paths(self, rel_paths: Iterable[str]) -> None:
+        """Record only the given files (partial index)."""
+        entries = []
+        for rel_path in sorted(set(rel_paths)):
+            parts = tuple(p for p in rel_path.split('/') if p and p != '.')
+            if not parts or any(p in PRUNED_DIRS for p in parts[:-1]):
+                continue
+            path = os.path.join(str(self.root), *parts)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            entries.append(self._make_entry(path, parts[:-1], parts[-1], st))
+        self._finish(entries)
+
+    def _walk(self) -> None:
+        """Walk the tree once, recording every regular file (without following directory symlinks)."""
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(str(self.root), ())]
+        entries = []
+
+        while stack:
+            dir_path, dir_parts = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError:
+                continue
+            self._dirs.add('/'.join(dir_parts))
+            with it:
+                for de in it:
+                    try:
+                        if de.is_symlink():
+                            self._has_symlinks = True
+                        # Directory symlinks are not followed (as rglob/os.walk),
+                        # which also rules out cycles such as 'd/up -> ..'
+                        if de.is_dir(follow_symlinks=False):
+                            if de.name not in PRUNED_DIRS:
+                                stack.append((de.path, dir_parts + (de.name,)))
+                            continue
+                        if not de.is_file():
+                            continue
+                        st = de.stat()
+                    except OSError:
+                        continue
+
+                    entries.append(self._make_entry(de.path, dir_parts, de.name, st))
+
+        self._finish(entries)
+
+    # =========================================================================
+    # Views
+    # =========================================================================
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self._by_rel
+
+    def get(self, rel_path: str) -> Optional[IndexEntry]:
+        """Look up an entry by its POSIX path relative to the index root."""
+        return self._by_rel.get(rel_path)
+
+    def relative_prefix(self, directory: Path) -> Optional[str]:
+        """
+        Return the POSIX prefix of a directory relative to the index root.
+
+        Returns '' for the root itself and None if the directory lies
+        outside the indexed tree (or inside a pruned directory).
+        """
+        rel = os.path.relpath(os.path.realpath(directory), str(self.root))
+        if rel == '.':
+            return ''
+        if rel == '..' or rel.startswith('..' + os.sep):
+            return None
+        rel = rel.replace(os.sep, '/')
+        if any(part in PRUNED_DIRS for part in rel.split('/')):
+            return None
+        return rel + '/'
+
+    def covers(self, directory: Path) -> bool:
+        """
+        Check whether a directory lies inside the indexed tree.
+
+        A partial index (built from explicit paths) covers its whole root:
+        callers handed one deliberately restrict themselves to those files.
+        """
+        return self.relative_prefix(directory) is not None
+
+    def files(self,
+              under: Optional[Path] = None,
+              suffixes: Optional[Iterable[str]] = None,
+              exclude_dirs: Iterable[str] = (),
+              exclude_files: Iterable[str] = (),
+              exclude_patterns: Iterable[str] = (),
+              exempt: Optional[bool] = None) -> List[IndexEntry]:
+        """
+        Filtered view of the index.
+
+        Args:
+            under: Restrict to files below this directory (default: root)
+            suffixes: Keep only these suffixes (case-sensitive, e.g. '.md')
+            exclude_dirs: Drop files with any of these directory names
+                          in their path
+            exclude_files: Drop files with these exact names
+            exclude_patterns: Drop files whose name re.match()es a pattern
+            exempt: If set, keep only entries whose nomenclature exemption
+                    flag equals this value
+
+        Returns:
+            Matching entries in path order
+        """
+        prefix = '' if under is None else self.relative_prefix(under)
+        if prefix is None:
+            return []
+
+        suffixes = set(suffixes) if suffixes is not None else None
+        exclude_dirs = set(exclude_dirs)
+        exclude_files = set(exclude_files)
+        exclude_regex = compile_exclusion_pattern(exclude_patterns)
+
+        result = []
+        for entry in self.entries:
+            if prefix and not entry.rel_path.startswith(prefix):
+                continue
+            if suffixes is not None and entry.ext not in suffixes:
+                continue
+            if exempt is not None and entry.exempt != exempt:
+                continue
+            if entry.name in exclude_files:
+                continue
+            if exclude_dirs and any(p in exclude_dirs for p in entry.dir_parts):
+                continue
+            if exclude_regex and exclude_regex.match(entry.name):
+                continue
+            result.append(entry)
+        return result
+
+    def paths(self, under: Optional[Path] = None, **filters) -> List[Path]:
+        """
+        Filtered view returned as paths joined onto ``under``.
+
+        Paths are built the same way ``under.rglob(...)`` would yield them,
+        so callers keep their existing relative/absolute path handling.
+        """
+        base = self.repo_root if under is None else Path(under)
+        prefix = '' if under is None else self.relative_prefix(base)
+        if prefix is None:
+            return []
+        cut = len(prefix)
+        return [base / e.rel_path[cut:]
+                for e in self.files(under=under, **filters)]
+
+    def glob(self, pattern: str, under: Optional[Path] = None) -> List[Path]:
+        """
+        Match a glob pattern against indexed files.
+
+        Supports the '**/<name-glob>' form used by the registry scanners
+        as well as plain relative patterns.
+        """
+        base = self.repo_root if under is None else Path(under)
+        prefix = '' if under is None else self.relative_prefix(base)
+        if prefix is None:
+            return []
+        cut = len(prefix)
+        matches = []
+        for entry in self.files(under=under):
+            rel = entry.rel_path[cut:]
+            if pattern.startswith('**/'):
+                if fnmatchcase(entry.name, pattern[3:]):
+                    matches.append(base / rel)
+            elif fnmatchcase(rel, pattern) and rel.count('/') == pattern.count('/'):
+                matches.append(base / rel)
+        return matches
+
+    def nomenclature_files(self, under: Optional[Path] = None) -> List[IndexEntry]:
+        """Files subject to nomenclature validation (not exempt)."""
+        return self.files(under=under, exempt=False)
+
+    # =========================================================================
+    # Existence oracle
+    # =========================================================================
+
+    def _indexed_rel(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        Normalized POSIX path relative to the root, if the walk can answer for it.
+
+        Relative paths are taken from the current directory, as pathlib
+        does. Returns None for a partial index, a tree containing symlinks
+        (where '..' must be resolved on disk), paths outside the root and
+        paths inside pruned directories.
+        """
+        if self.partial or self._has_symlinks:
+            return None
+        full = os.path.abspath(path)
+        if not full.startswith(self._root_prefix):
+            return '' if full == str(self.root) else None
+        rel = full[len(self._root_prefix):].replace(os.sep, '/')
+        if any(part in PRUNED_DIRS for part in rel.split('/')):
+            return None
+        return rel
+
+    def _parents_exist(self, path: Union[str, Path]) -> bool:
+        """
+        Check that every directory a '..' segment steps out of exists.
+
+        The OS rejects 'missing/../file' even though it normalizes to an
+        existing file, so lookups of unnormalized paths check this too.
+        """
+        raw = os.path.join(os.getcwd(), path).replace(os.sep, '/')
+        if '/../' not in raw + '/':
+            return True
+        parts = raw.split('/')
+        for i, part in enumerate(parts):
+            if part == '..' and not self.is_dir('/'.join(parts[:i]) or '/'):
+                return False
+        return True
+
+    def resolve(self, path: Union[str, Path]) -> Path:
+        """Path.resolve() equivalent, computed in memory for indexed paths."""
+        if self._indexed_rel(path) is not None:
+            return Path(os.path.abspath(path))
+        return Path(path).resolve()
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """Check whether a file or directory exists (Path.exists())."""
+        rel = self._indexed_rel(path)
+        if rel is None:
+            return os.path.exists(path)
+        return (rel in self._by_rel or rel in self._dirs) and self._parents_exist(path)
+
+    def is_file(self, path: Union[str, Path]) -> bool:
+        """Check whether a path is a regular file (Path.is_file())."""
+        rel = self._indexed_rel(path)
+        if rel is None:
+            return os.path.isfile(path)
+        return rel in self._by_rel and self._parents_exist(path)
+
+    def is_dir(self, path: Union[str, Path]) -> bool:
+        """Check whether a path is a directory (Path.is_dir())."""
+        rel = self._indexed_rel(path)
+        if rel is None:
+            return os.path.isdir(path)
+        return rel in self._dirs and self._parents_exist(path)
+
+
+def index_for(directory: Path, index: Optional[RepoIndex] = None) -> RepoIndex:
+    """
+    Return an index covering ``directory``.
+
+    Reuses the given index when the directory lies inside it; otherwise
+    walks the directory once.
+    """
+    if index is not None and index.covers(directory):
+        return index
+    return RepoIndex(directory)
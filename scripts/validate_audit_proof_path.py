@@ -14,8 +14,24 @@ Usage:
     python scripts/validate_audit_proof_path.py --id <identifier>
     python scripts/validate_audit_proof_path.py --validate-chain <identifier>
     python scripts/validate_audit_proof_path.py --check-all
+    python scripts/validate_audit_proof_path.py -c <identifier> --db-path plc_ontology.db
+    python scripts/validate_audit_proof_path.py -c <id> <id> ... --jobs 4
+    python scripts/validate_audit_proof_path.py --chain-all --jobs 4
     python scripts/validate_audit_proof_path.py --help
 
+Identifier lookups are served by an IdentifierIndex built in one pass over
+all Markdown/JSON files on first use, so each chain step is a dictionary
+lookup rather than a repository scan. With --db-path they probe the
+full-text content index kept in the PLC database (refreshed incrementally
+at startup) instead, which avoids reading files that do not mention the
+identifier. Schema, export and manifest JSON is parsed once per process
+through the shared JSON memo (json_cache.load_json).
+
+Several identifiers (or --chain-all) are validated as a batch: the indexes
+are built once, identifiers are fanned out over --jobs worker processes
+that inherit them read-only (fork), and the compact per-identifier results
+are merged into one summary with per-step timing.
+
 Exit codes:
     0: Validation passed
     1: Validation errors found
@@ -23,13 +39,29 @@ Exit codes:
 """
 
 import argparse
+import fnmatch
 import json
+import multiprocessing
 import re
+import sqlite3
 import sys
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Import PLC database (full-text content index), identifier matcher and JSON memo
+try:
+    from plc_db import PLCDatabase
+    from identifier_matcher import IDENTIFIER_RUN_PATTERN, contains_identifier, is_run_identifier
+    from json_cache import load_json
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from plc_db import PLCDatabase
+    from identifier_matcher import IDENTIFIER_RUN_PATTERN, contains_identifier, is_run_identifier
+    from json_cache import load_json
 
 
 # =============================================================================
@@ -186,6 +218,203 @@ class IdentifierInfo:
     evidence_refs: List[str] = field(default_factory=list)
 
 
+@dataclass
+class ChainResult:
+    """Compact outcome of one identifier's chain validation (batch mode)."""
+    identifier: str
+    passed: bool
+    errors: List[str]
+    warnings: List[str]
+    steps: List[Tuple[str, str]]      # (step name, status) in chain order
+    timings: Dict[str, float]         # step name -> seconds
+
+
+@dataclass(frozen=True)
+class IdentifierOccurrence:
+    """One place an identifier appears."""
+    path: Path
+    kind: str                         # 'text', 'identifier', 'related_identifier',
+                                      # 'trace_source' or 'trace_target'
+    line: Optional[int] = None        # 1-based line ('text' occurrences)
+    json_path: Optional[str] = None   # e.g. $.data.datums[0].identifier (JSON fields)
+
+
+# =============================================================================
+# Identifier Index
+# =============================================================================
+
+class IdentifierIndex:
+    """
+    Occurrences of every identifier in the scanned Markdown and JSON files.
+    
+    Built in one pass: each file is read once, every run of identifier
+    characters containing a hyphen is recorded with its line (a run is
+    exactly an occurrence that passes the identifier boundary check, see
+    identifier_matcher), and each JSON
+    file is parsed once to record identifier fields (with their JSON path)
+    and the trace links _extract_trace_links_from_json would report. Chain
+    steps then look identifiers up instead of rescanning the repository.
+    """
+
+    def __init__(self):
+        self._occurrences: Dict[str, List[IdentifierOccurrence]] = {}
+        self._files: Dict[str, List[Path]] = {}
+        self._trace_links: Dict[str, List[Dict[str, str]]] = {}
+        self.files_scanned = 0
+
+    @staticmethod
+    def indexable(identifier: str) -> bool:
+        """Whether lookups of this identifier can be answered by the index."""
+        return '-' in identifier and is_run_identifier(identifier)
+
+    @classmethod
+    def build(cls, paths: Iterable[Path],
+              load_json: Callable[[Path], Optional[Any]]) -> 'IdentifierIndex':
+        """
+        Index files in the given order.
+        
+        Args:
+            paths: Markdown and JSON files to scan (already filtered)
+            load_json: JSON loader returning None for unreadable files
+        """
+        index = cls()
+        for path in paths:
+            index._scan_text(path)
+            if path.suffix == '.json':
+                data = load_json(path)
+                if data:
+                    index._scan_json(path, data)
+        return index
+
+    def _scan_text(self, path: Path) -> None:
+        """Record identifier runs in a file's text with their line numbers."""
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return
+        self.files_scanned += 1
+        
+        line = 1
+        position = 0
+        seen: Set[str] = set()
+        for match in IDENTIFIER_RUN_PATTERN.finditer(content):
+            identifier = match.group()
+            if '-' not in identifier:
+                continue
+            line += content.count('\n', position, match.start())
+            position = match.start()
+            self._occurrences.setdefault(identifier, []).append(
+                IdentifierOccurrence(path, 'text', line=line)
+            )
+            if identifier not in seen:
+                seen.add(identifier)
+                self._files.setdefault(identifier, []).append(path)
+
+    def _scan_json(self, path: Path, data: Any) -> None:
+        """Record identifier fields and trace links of a parsed JSON file."""
+        try:
+            self._walk_json(data, path, str(path), '$')
+        except (TypeError, KeyError):
+            # Malformed structure: like the per-identifier scan, keep the
+            # links found so far and skip the rest of the file
+            pass
+
+    def _walk_json(self, data: Any, path: Path, source_file: str, json_path: str) -> None:
+        """Mirror _extract_trace_links_from_json for every identifier at once."""
+        if isinstance(data, dict):
+            related = data.get('related_identifiers', [])
+            if isinstance(related, (list, dict)):
+                members = list(related)
+            elif isinstance(related, str):
+                members = []
+            else:
+                raise TypeError(f"related_identifiers is {type(related).__name__}")
+            
+            matched = list(dict.fromkeys(m for m in members if isinstance(m, str)))
+            for position, member in enumerate(members):
+                if isinstance(member, str):
+                    suffix = f"[{position}]" if isinstance(related, list) else f".{member}"
+                    self._add_field(member, path, 'related_identifier',
+                                    f"{json_path}.related_identifiers{suffix}")
+            own = data.get('identifier')
+            if isinstance(own, str):
+                self._add_field(own, path, 'identifier', f"{json_path}.identifier")
+                if own not in matched:
+                    matched.append(own)
+            for identifier in matched:
+                for related_id in members:
+                    if related_id != identifier:
+                        self._trace_links.setdefault(identifier, []).append({
+                            'file': source_file,
+                            'type': 'related_identifier',
+                            'target': related_id,
+                            'status': 'found'
+                        })
+            
+            traces = data.get('trace_links', [])
+            if traces is None or isinstance(traces, (bool, int, float)):
+                raise TypeError(f"trace_links is {type(traces).__name__}")
+            for position, trace in enumerate(traces):
+                if not isinstance(trace, dict):
+                    continue
+                trace_path = f"{json_path}.trace_links[{position}]"
+                ends = []
+                for key, kind in (('source', 'trace_source'), ('target', 'trace_target')):
+                    value = trace.get(key)
+                    if isinstance(value, str):
+                        self._add_field(value, path, kind, f"{trace_path}.{key}")
+                        if value not in ends:
+                            ends.append(value)
+                for identifier in ends:
+                    self._trace_links.setdefault(identifier, []).append({
+                        'file': source_file,
+                        'type': trace.get('type', 'unknown'),
+                        'target': trace.get('target', ''),
+                        'source': trace.get('source', ''),
+                        'status': trace.get('status', 'unknown')
+                    })
+            
+            for key, value in data.items():
+                self._walk_json(value, path, source_file, f"{json_path}.{key}")
+        
+        elif isinstance(data, list):
+            for position, item in enumerate(data):
+                self._walk_json(item, path, source_file, f"{json_path}[{position}]")
+
+    def _add_field(self, identifier: str, path: Path, kind: str, json_path: str) -> None:
+        """Record a JSON field holding an identifier."""
+        if self.indexable(identifier):
+            self._occurrences.setdefault(identifier, []).append(
+                IdentifierOccurrence(path, kind, json_path=json_path)
+            )
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def occurrences(self, identifier: str) -> List[IdentifierOccurrence]:
+        """Every recorded occurrence of an identifier, in scan order."""
+        return list(self._occurrences.get(identifier, []))
+
+    def files(self, identifier: str) -> List[Path]:
+        """Files whose text contains the identifier, in scan order."""
+        return list(self._files.get(identifier, []))
+
+    def trace_links(self, identifier: str) -> List[Dict[str, str]]:
+        """JSON trace links of an identifier (related identifiers, trace_links)."""
+        return [dict(link) for link in self._trace_links.get(identifier, [])]
+
+    def identifiers(self) -> List[str]:
+        """All indexed identifiers, sorted."""
+        return sorted(self._occurrences)
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._occurrences
+
+    def __len__(self) -> int:
+        return len(self._occurrences)
+
+
 # =============================================================================
 # Audit Path Validator Class
 # =============================================================================
@@ -205,19 +434,126 @@ class AuditProofPathValidator:
     8. Approval Confirmation (Export)
     """
 
-    def __init__(self, repo_root: Path = Path('.'), verbose: bool = False):
+    def __init__(self, repo_root: Path = Path('.'), verbose: bool = False,
+                 db_path: Optional[str] = None):
         """
         Initialize the validator.
         
         Args:
             repo_root: Path to the repository root
             verbose: Enable verbose output
+            db_path: PLC database whose content index serves identifier
+                     lookups (files are scanned if None or unavailable)
         """
         self.repo_root = repo_root
         self.verbose = verbose
         self.identifier_cache: Dict[str, IdentifierInfo] = {}
         self.schema_cache: Dict[str, Dict] = {}
         self.export_cache: Dict[str, Dict] = {}
+        self.content_db: Optional[PLCDatabase] = None
+        if db_path:
+            self.content_db = self._open_content_index(db_path)
+        self.db_path = db_path
+        self.quiet = False
+        self._identifier_index: Optional[IdentifierIndex] = None
+        self._schema_files: Optional[List[Tuple[Path, str]]] = None
+
+    @property
+    def identifier_index(self) -> IdentifierIndex:
+        """Occurrence index over all Markdown and JSON files (built on first use)."""
+        if self._identifier_index is None:
+            paths = [
+                path
+                for pattern in ('*.md', '*.json')
+                for path in self.repo_root.rglob(pattern)
+                if not self._is_excluded_path(path)
+            ]
+            self._identifier_index = IdentifierIndex.build(paths, self._load_json_file)
+            if self.verbose:
+                print(f"Identifier index: {len(self._identifier_index)} identifiers "
+                      f"in {self._identifier_index.files_scanned} files")
+        return self._identifier_index
+
+    def _open_content_index(self, db_path: str) -> Optional[PLCDatabase]:
+        """Open the PLC database and bring its content index up to date."""
+        db = PLCDatabase(db_path)
+        try:
+            if not Path(db_path).exists():
+                db.initialize_database()
+            stats = db.sync_content_index(self.repo_root)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Content index unavailable, scanning files instead: {e}",
+                  file=sys.stderr)
+            db.close()
+            return None
+        if self.verbose:
+            print(f"Content index: {stats['scanned']} files, "
+                  f"{stats['indexed']} re-indexed, {stats['deleted']} removed")
+        return db
+
+    def _candidate_files(self, identifier: str, pattern: str) -> List[Path]:
+        """
+        Files matching a filename glob that may contain the identifier.
+        
+        With a content index these are only the files whose text contains
+        the identifier; without one, every file matching the glob. Callers
+        still check identifier boundaries on the content.
+        
+        Args:
+            identifier: The identifier being looked up
+            pattern: Filename glob, e.g. '*_TRC_*.md'
+            
+        Returns:
+            Non-excluded candidate paths
+        """
+        if (self.content_db is None
+                or len(identifier) < PLCDatabase.MIN_CONTENT_QUERY_LENGTH):
+            paths = self.repo_root.rglob(pattern)
+        else:
+            suffix = PurePosixPath(pattern).suffix
+            paths = (
+                self.repo_root / rel_path
+                for rel_path in self.content_db.find_content(identifier, suffixes={suffix})
+                if fnmatch.fnmatchcase(PurePosixPath(rel_path).name, pattern)
+            )
+        return [path for path in paths if not self._is_excluded_path(path)]
+
+    def _file_contains(self, path: Path, identifier: str) -> bool:
+        """Check whether a file's text contains the identifier (with boundaries)."""
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+        return self._identifier_in_content(identifier, content)
+
+    def _files_containing(self, identifier: str, pattern: str) -> List[Path]:
+        """
+        Files matching a filename glob whose text contains the identifier.
+        
+        Answered by the content index (--db-path) or else by the identifier
+        index; identifiers the latter cannot hold are looked up by scanning.
+        
+        Args:
+            identifier: The identifier to search for
+            pattern: Filename glob, e.g. '*_TRC_*.md'
+            
+        Returns:
+            Matching paths
+        """
+        if self.content_db is None and IdentifierIndex.indexable(identifier):
+            return [
+                path for path in self.identifier_index.files(identifier)
+                if fnmatch.fnmatchcase(path.name, pattern)
+            ]
+        return [
+            path for path in self._candidate_files(identifier, pattern)
+            if self._file_contains(path, identifier)
+        ]
+
+    def _progress(self, step_name: str) -> None:
+        """Announce a chain step (silent in batch workers)."""
+        if not self.quiet:
+            print(f"🔍 {step_name}...")
 
     def _is_excluded_path(self, path: Path) -> bool:
         """Check if path should be excluded from scanning."""
@@ -293,7 +629,9 @@ class AuditProofPathValidator:
         Check if identifier appears in content with word boundaries.
         
         Uses precise matching to avoid false positives like 
-        'DATUM-GLOBAL-001' matching 'DATUM-GLOBAL-0012'.
+        'DATUM-GLOBAL-001' matching 'DATUM-GLOBAL-0012'. The boundary is
+        checked around each substring hit, so no pattern is compiled per
+        identifier.
         
         Args:
             identifier: The identifier to search for
@@ -302,11 +640,7 @@ class AuditProofPathValidator:
         Returns:
             True if identifier found with word boundaries
         """
-        # Escape special regex characters in identifier
-        escaped_id = re.escape(identifier)
-        # Use word boundary or non-alphanumeric boundary for precise matching
-        pattern = rf'(?<![A-Z0-9-]){escaped_id}(?![A-Z0-9-])'
-        return bool(re.search(pattern, content))
+        return contains_identifier(content, identifier)
 
     def _find_identifier_in_files(self, identifier: str) -> List[Path]:
         """
@@ -318,36 +652,18 @@ class AuditProofPathValidator:
         Returns:
             List of file paths containing the identifier
         """
-        found_files = []
-        
-        # Search in markdown files
-        for path in self.repo_root.rglob('*.md'):
-            if self._is_excluded_path(path):
-                continue
-            try:
-                content = path.read_text(encoding='utf-8')
-                if self._identifier_in_content(identifier, content):
-                    found_files.append(path)
-            except (OSError, UnicodeDecodeError):
-                continue
-        
-        # Search in JSON files
-        for path in self.repo_root.rglob('*.json'):
-            if self._is_excluded_path(path):
-                continue
-            try:
-                content = path.read_text(encoding='utf-8')
-                if self._identifier_in_content(identifier, content):
-                    found_files.append(path)
-            except (OSError, UnicodeDecodeError):
-                continue
-        
-        return found_files
+        # Markdown files first, then JSON files
+        return (self._files_containing(identifier, '*.md')
+                + self._files_containing(identifier, '*.json'))
 
     def _load_json_file(self, path: Path) -> Optional[Dict]:
         """
         Load and parse a JSON file.
         
+        Documents come from the process-wide JSON memo, so the schema and
+        export files consulted for every identifier are parsed once. The
+        result is shared and read-only.
+        
         Args:
             path: Path to the JSON file
             
@@ -355,8 +671,7 @@ class AuditProofPathValidator:
             Parsed JSON content or None if error
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(path)
         except (json.JSONDecodeError, OSError, UnicodeDecodeError):
             return None
 
@@ -386,18 +701,25 @@ class AuditProofPathValidator:
                     elif info:
                         schemas.append((schema_path, schema_id))
         
-        # Also search for any JSON schema that might reference this identifier
-        for path in self.repo_root.rglob('*_SCH_*.json'):
-            if self._is_excluded_path(path):
-                continue
+        # Also add every JSON schema in the repository (discovered once)
+        for path, schema_id in self._repository_schemas():
             if path not in [s[0] for s in schemas]:
-                content = self._load_json_file(path)
-                if content and '$schema' in content:
-                    schema_id = content.get('$id', str(path))
-                    schemas.append((path, schema_id))
+                schemas.append((path, schema_id))
         
         return schemas
 
+    def _repository_schemas(self) -> List[Tuple[Path, str]]:
+        """(path, schema_id) of every *_SCH_*.json JSON Schema, found on first use."""
+        if self._schema_files is None:
+            self._schema_files = []
+            for path in self.repo_root.rglob('*_SCH_*.json'):
+                if self._is_excluded_path(path):
+                    continue
+                content = self._load_json_file(path)
+                if content and '$schema' in content:
+                    self._schema_files.append((path, content.get('$id', str(path))))
+        return self._schema_files
+
     def _find_identifier_in_exports(self, identifier: str) -> List[Tuple[Path, Dict]]:
         """
         Find export files that contain the identifier.
@@ -424,16 +746,10 @@ class AuditProofPathValidator:
                                 exports.append((export_path, item))
         
         # Also search for any TAB export files
-        for path in self.repo_root.rglob('*_TAB_*.json'):
-            if self._is_excluded_path(path):
-                continue
-            try:
-                content = path.read_text(encoding='utf-8')
-                if self._identifier_in_content(identifier, content):
-                    data = json.loads(content)
-                    exports.append((path, data))
-            except (json.JSONDecodeError, OSError, UnicodeDecodeError):
-                continue
+        for path in self._files_containing(identifier, '*_TAB_*.json'):
+            data = self._load_json_file(path)
+            if data is not None:
+                exports.append((path, data))
         
         return exports
 
@@ -464,24 +780,22 @@ class AuditProofPathValidator:
                     continue
         
         # Search for trace links in markdown files
-        for path in self.repo_root.rglob('*_TRC_*.md'):
-            if self._is_excluded_path(path):
-                continue
-            try:
-                content = path.read_text(encoding='utf-8')
-                if self._identifier_in_content(identifier, content):
-                    trace_links.append({
-                        'file': str(path),
-                        'type': 'trace_document',
-                        'status': 'found'
-                    })
-            except (OSError, UnicodeDecodeError):
-                continue
+        for path in self._files_containing(identifier, '*_TRC_*.md'):
+            trace_links.append({
+                'file': str(path),
+                'type': 'trace_document',
+                'status': 'found'
+            })
         
-        # Search for related_identifiers in JSON exports
-        for path in self.repo_root.rglob('*.json'):
-            if self._is_excluded_path(path):
-                continue
+        # Related identifiers and trace_links in JSON files were collected
+        # when the identifier index was built
+        if self.content_db is None and IdentifierIndex.indexable(identifier):
+            trace_links.extend(self.identifier_index.trace_links(identifier))
+            return trace_links
+        
+        # Search for related_identifiers in JSON exports (a match needs the
+        # identifier verbatim in the file, so index candidates suffice)
+        for path in self._candidate_files(identifier, '*.json'):
             try:
                 content = self._load_json_file(path)
                 if content:
@@ -560,7 +874,7 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Step 1: Identifier Validation"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         info = self._parse_identifier(identifier)
         
@@ -609,7 +923,7 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Step 2: Schema Validation"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         schemas = self._find_schema_for_identifier(identifier)
         
@@ -665,7 +979,7 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Steps 3-5: Trace Link Validation"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         trace_links = self._find_trace_links(identifier)
         
@@ -724,7 +1038,7 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Step 6: Export/Evidence Validation"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         exports = self._find_identifier_in_exports(identifier)
         
@@ -780,7 +1094,7 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Step 7: Baseline Verification"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         # Check for baseline references in export files
         baseline_info = []
@@ -835,23 +1149,16 @@ class AuditProofPathValidator:
             True if valid, False otherwise
         """
         step_name = "Step 8: Approval Verification"
-        print(f"🔍 {step_name}...")
+        self._progress(step_name)
         
         # Check approval logs
         approval_info = []
         
-        for path in self.repo_root.rglob('*_LOG_*approvals*.md'):
-            if self._is_excluded_path(path):
-                continue
-            try:
-                content = path.read_text(encoding='utf-8')
-                if self._identifier_in_content(identifier, content):
-                    approval_info.append({
-                        "file": str(path),
-                        "status": "referenced"
-                    })
-            except (OSError, UnicodeDecodeError):
-                continue
+        for path in self._files_containing(identifier, '*_LOG_*approvals*.md'):
+            approval_info.append({
+                "file": str(path),
+                "status": "referenced"
+            })
         
         # Also check for approval status in exports
         for export_file in EXPORT_LOCATIONS:
@@ -913,29 +1220,162 @@ class AuditProofPathValidator:
         print("Chain: ID → Schema → Trace → Export")
         print("=" * 70 + "\n")
         
-        # Step 1: Identifier Validation
-        if not self._validate_identifier_format(identifier, result):
-            result.print_summary()
-            return result
+        self._run_chain(identifier, result)
+        
+        result.print_summary()
+        return result
+
+    def _run_chain(self, identifier: str, result: ValidationResult,
+                   timings: Optional[Dict[str, float]] = None) -> None:
+        """
+        Run the chain steps in order, stopping if the identifier is invalid.
+        
+        Args:
+            identifier: The identifier to validate
+            result: ValidationResult to update
+            timings: If given, filled with seconds per step name
+        """
+        steps = (
+            self._validate_identifier_format,   # Step 1: Identifier Validation
+            self._validate_schema,              # Step 2: Schema Validation
+            self._validate_trace_links,         # Steps 3-5: Trace Link Validation
+            self._validate_exports,             # Step 6: Export Validation
+            self._validate_baseline,            # Step 7: Baseline Verification
+            self._validate_approvals,           # Step 8: Approval Verification
+        )
+        for position, step in enumerate(steps):
+            started = time.perf_counter()
+            passed = step(identifier, result)
+            if timings is not None and result.steps:
+                timings[result.steps[-1]['step']] = time.perf_counter() - started
+            if position == 0 and not passed:
+                return
+
+    def chain_result(self, identifier: str) -> ChainResult:
+        """Validate one identifier's chain silently and return the compact result."""
+        result = ValidationResult()
+        timings: Dict[str, float] = {}
+        self._run_chain(identifier, result, timings)
+        return ChainResult(
+            identifier=identifier,
+            passed=result.passed,
+            errors=result.errors,
+            warnings=result.warnings,
+            steps=[(step['step'], step['status']) for step in result.steps],
+            timings=timings,
+        )
+
+    def discover_identifiers(self) -> List[str]:
+        """All well-formed identifiers occurring in the repository, sorted."""
+        return [
+            identifier for identifier in self.identifier_index.identifiers()
+            if self._parse_identifier(identifier)
+        ]
+
+    def validate_chains(self, identifiers: List[str], jobs: int = 1) -> ValidationResult:
+        """
+        Validate the complete chain for many identifiers.
         
-        # Step 2: Schema Validation
-        self._validate_schema(identifier, result)
+        The identifier index and schema list are built first; with jobs > 1
+        the identifiers are then fanned out over a process pool whose
+        workers inherit them read-only (fork; on spawn-only platforms each
+        worker builds its own). Results are merged in input order into one
+        ValidationResult with a summary step per chain step.
         
-        # Steps 3-5: Trace Link Validation
-        self._validate_trace_links(identifier, result)
+        Args:
+            identifiers: Identifiers to validate (duplicates are ignored)
+            jobs: Number of worker processes
+            
+        Returns:
+            Merged ValidationResult
+        """
+        global _CHAIN_VALIDATOR
+        identifiers = list(dict.fromkeys(identifiers))
+        jobs = max(1, min(jobs, len(identifiers)))
+        result = ValidationResult()
         
-        # Step 6: Export Validation
-        self._validate_exports(identifier, result)
+        print("\n" + "=" * 70)
+        print("AUDITABILITY PROOF PATH VALIDATION (BATCH)")
+        print(f"Identifiers: {len(identifiers)}  Jobs: {jobs}")
+        print("Chain: ID → Schema → Trace → Export")
+        print("=" * 70 + "\n")
         
-        # Step 7: Baseline Verification
-        self._validate_baseline(identifier, result)
+        if not identifiers:
+            result.add_warning("No identifiers to validate")
+            result.print_summary()
+            return result
         
-        # Step 8: Approval Verification
-        self._validate_approvals(identifier, result)
+        # Shared read-only state, built once before any worker starts
+        if self.content_db is None:
+            self.identifier_index
+        self._repository_schemas()
+        
+        started = time.perf_counter()
+        quiet, self.quiet = self.quiet, True
+        try:
+            if jobs > 1:
+                _CHAIN_VALIDATOR = self
+                context = (multiprocessing.get_context('fork')
+                           if 'fork' in multiprocessing.get_all_start_methods() else None)
+                with ProcessPoolExecutor(
+                    max_workers=jobs, mp_context=context,
+                    initializer=_init_chain_worker,
+                    initargs=(self.repo_root, self.db_path)
+                ) as pool:
+                    chunksize = max(1, len(identifiers) // (jobs * 4))
+                    self._merge_chain_results(
+                        pool.map(_validate_chain_worker, identifiers, chunksize=chunksize),
+                        result
+                    )
+            else:
+                self._merge_chain_results(map(self.chain_result, identifiers), result)
+        finally:
+            self.quiet = quiet
+            _CHAIN_VALIDATOR = None
+        elapsed = time.perf_counter() - started
+        
+        result.add_step("Batch", "complete", {
+            "identifiers": len(identifiers),
+            "jobs": jobs,
+            "wall_time_s": round(elapsed, 3),
+        })
+        result.add_info(
+            f"Validated {len(identifiers)} identifier chain(s) with {jobs} job(s) "
+            f"in {elapsed:.2f}s"
+        )
         
         result.print_summary()
         return result
 
+    def _merge_chain_results(self, chains: Iterable[ChainResult],
+                             result: ValidationResult) -> None:
+        """Fold per-identifier results into result, adding one step summary per chain step."""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for chain in chains:
+            status_icon = "✅" if chain.passed else "❌"
+            print(f"  {status_icon} {chain.identifier} "
+                  f"({len(chain.steps)} steps, {sum(chain.timings.values()):.3f}s)")
+            for error in chain.errors:
+                result.add_error(error)
+            result.warnings.extend(chain.warnings)
+            for step_name, status in chain.steps:
+                totals = summary.setdefault(step_name, {
+                    'identifiers': 0, 'passed': 0, 'warning': 0, 'failed': 0,
+                    'time_s': 0.0, 'max_time_s': 0.0,
+                })
+                totals['identifiers'] += 1
+                totals[status if status in ('passed', 'warning') else 'failed'] += 1
+                seconds = chain.timings.get(step_name, 0.0)
+                totals['time_s'] += seconds
+                totals['max_time_s'] = max(totals['max_time_s'], seconds)
+        
+        for step_name, totals in summary.items():
+            status = ("failed" if totals['failed']
+                      else "warning" if totals['warning'] else "passed")
+            totals['time_s'] = round(totals['time_s'], 3)
+            totals['max_time_s'] = round(totals['max_time_s'], 3)
+            result.add_step(step_name, status, totals)
+
     def validate_identifier(self, identifier: str) -> ValidationResult:
         """
         Validate just the identifier format and location.
@@ -1020,6 +1460,28 @@ class AuditProofPathValidator:
         return result
 
 
+# =============================================================================
+# Batch Workers
+# =============================================================================
+
+# Validator used by batch worker processes: inherited from the parent on
+# fork, built by _init_chain_worker on spawn-only platforms
+_CHAIN_VALIDATOR: Optional[AuditProofPathValidator] = None
+
+
+def _init_chain_worker(repo_root: Path, db_path: Optional[str]) -> None:
+    """Process pool initializer for validate_chains()."""
+    global _CHAIN_VALIDATOR
+    if _CHAIN_VALIDATOR is None:
+        _CHAIN_VALIDATOR = AuditProofPathValidator(repo_root, db_path=db_path)
+    _CHAIN_VALIDATOR.quiet = True
+
+
+def _validate_chain_worker(identifier: str) -> ChainResult:
+    """Validate one identifier in a worker process."""
+    return _CHAIN_VALIDATOR.chain_result(identifier)
+
+
 # =============================================================================
 # CLI Interface
 # =============================================================================
@@ -1035,6 +1497,9 @@ Examples:
   %(prog)s --validate-chain ZONE-PROP-001
   %(prog)s --check-all
   %(prog)s --id REQ-SYS-042 --verbose
+  %(prog)s --validate-chain DATUM-GLOBAL-001 --db-path plc_ontology.db
+  %(prog)s --validate-chain DATUM-GLOBAL-001 ZONE-PROP-001 --jobs 2
+  %(prog)s --chain-all --jobs 8
 
 Exit codes:
   0: Validation passed
@@ -1051,19 +1516,39 @@ Exit codes:
     parser.add_argument(
         '--validate-chain', '-c',
         metavar='IDENTIFIER',
-        help='Validate complete audit chain for identifier (ID → Schema → Trace → Export)'
+        nargs='+',
+        help='Validate complete audit chain for identifier(s) (ID → Schema → Trace → Export); '
+             'several identifiers are validated as a batch'
     )
     parser.add_argument(
         '--check-all',
         action='store_true',
         help='Discover and validate all identifiers in the repository'
     )
+    parser.add_argument(
+        '--chain-all',
+        action='store_true',
+        help='Validate the complete chain for every identifier found in the repository (batch)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Worker processes for batch chain validation (default: 1)'
+    )
     parser.add_argument(
         '--repo-root',
         metavar='DIR',
         default='.',
         help='Repository root directory (default: current directory)'
     )
+    parser.add_argument(
+        '--db-path',
+        metavar='DB',
+        help='Look identifiers up in the content index of this PLC database '
+             '(refreshed incrementally; created if missing)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -1073,8 +1558,10 @@ Exit codes:
     args = parser.parse_args()
 
     # Validate arguments
-    if not any([args.id, args.validate_chain, args.check_all]):
-        parser.error('Must specify --id, --validate-chain, or --check-all')
+    if not any([args.id, args.validate_chain, args.check_all, args.chain_all]):
+        parser.error('Must specify --id, --validate-chain, --check-all, or --chain-all')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
 
     repo_root = Path(args.repo_root)
     if not repo_root.is_dir():
@@ -1082,14 +1569,19 @@ Exit codes:
         return 2
 
     try:
-        validator = AuditProofPathValidator(repo_root, verbose=args.verbose)
+        validator = AuditProofPathValidator(repo_root, verbose=args.verbose,
+                                            db_path=args.db_path)
 
         if args.id:
             result = validator.validate_identifier(args.id)
+        elif args.validate_chain and len(args.validate_chain) == 1:
+            result = validator.validate_chain(args.validate_chain[0])
         elif args.validate_chain:
-            result = validator.validate_chain(args.validate_chain)
+            result = validator.validate_chains(args.validate_chain, jobs=args.jobs)
         elif args.check_all:
             result = validator.check_all_identifiers()
+        elif args.chain_all:
+            result = validator.validate_chains(validator.discover_identifiers(), jobs=args.jobs)
         else:
             parser.print_help()
             return 2
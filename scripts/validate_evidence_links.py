@@ -15,6 +15,7 @@ Usage:
     python scripts/validate_evidence_links.py --all
     python scripts/validate_evidence_links.py --file <path>
     python scripts/validate_evidence_links.py --required-only
+    python scripts/validate_evidence_links.py --all --async-db
 
 Exit codes:
     0: All evidence links valid
@@ -25,17 +26,24 @@ Exit codes:
 import argparse
 import json
 import re
+import sqlite3
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
-# Import PLC database module
+# Import PLC database, repository index, content cache and change set modules
 try:
-    from plc_db import PLCDatabase
+    from plc_db import BackgroundWriter, PLCDatabase, WriterStats
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
-    from plc_db import PLCDatabase
+    from plc_db import BackgroundWriter, PLCDatabase, WriterStats
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 
 
 @dataclass
@@ -72,11 +80,23 @@ class EvidenceValidator:
     # TYPEs that require evidence
     EVIDENCE_REQUIRED_TYPES = {'FHA', 'PSSA', 'SSA', 'FTA', 'CERT', 'PLAN'}
     
-    def __init__(self, db_path: str = "plc_ontology.db"):
-        """Initialize with database connection."""
+    def __init__(self, db_path: str = "plc_ontology.db",
+                 index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None,
+                 writer: Optional[BackgroundWriter] = None):
+        """
+        Initialize with database connection and optional shared index/cache.
+        
+        With a background writer, evidence references are queued to it
+        instead of being written from the scan loop.
+        """
         self.db = PLCDatabase(db_path)
+        self.writer = writer
+        self.index = index
+        self.cache = cache or ContentCache.disabled()
         self.evidence_links: List[EvidenceLink] = []
         self.unresolved_links: List[EvidenceLink] = []
+        self.db_errors: List[str] = []  # Failed database writes (fail the gate)
     
     def scan_file(self, file_path: Path, base_dir: Path = Path('.')) -> List[EvidenceLink]:
         """
@@ -88,7 +108,6 @@ class EvidenceValidator:
         links = []
         
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
             relative_path = str(file_path.relative_to(base_dir))
             
             # Extract artifact ID from filename if possible
@@ -97,60 +116,76 @@ class EvidenceValidator:
             # Determine if evidence is required based on file TYPE
             required = any(typ in file_path.name for typ in self.EVIDENCE_REQUIRED_TYPES)
             
-            # Search for evidence patterns
-            for kind, pattern in self.EVIDENCE_KINDS.items():
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+            # Search for evidence patterns (raw matches are cached per file)
+            matches = self.cache.get(file_path, 'evidence_refs', self._find_evidence_refs)
+            records = []
+            for kind, target in matches:
+                # Check if target resolves
+                resolved, errors = self._resolve_evidence(target, base_dir)
+                
+                link = EvidenceLink(
+                    source_path=relative_path,
+                    source_artifact_id=artifact_id,
+                    target_path=target,
+                    target_artifact_id=None,
+                    evidence_kind=kind,
+                    required=required,
+                    resolved=resolved,
+                    errors=errors
+                )
+                
+                links.append(link)
+                self.evidence_links.append(link)
+                
+                if not resolved:
+                    self.unresolved_links.append(link)
                 
-                for match in matches:
-                    full_match = match.group(0)
-                    # Extract target path/ID from match
-                    parts = full_match.split(':', 1)
-                    target = parts[1].strip() if len(parts) > 1 else None
-                    
-                    # Check if target resolves
-                    resolved, errors = self._resolve_evidence(target, base_dir)
-                    
-                    link = EvidenceLink(
-                        source_path=relative_path,
-                        source_artifact_id=artifact_id,
-                        target_path=target,
-                        target_artifact_id=None,
-                        evidence_kind=kind,
-                        required=required,
-                        resolved=resolved,
-                        errors=errors
-                    )
-                    
-                    links.append(link)
-                    self.evidence_links.append(link)
-                    
-                    if not resolved:
-                        self.unresolved_links.append(link)
-                    
-                    # Record in database
-                    try:
-                        evidence_id = self.db.record_evidence_ref(
-                            source_artifact_id=artifact_id,
-                            source_artifact_path=relative_path,
-                            evidence_kind=kind,
-                            target_path=target,
-                            required=required
-                        )
-                        
-                        self.db.update_evidence_resolution(
-                            evidence_id=evidence_id,
-                            resolved=resolved,
-                            resolved_path=target if resolved else None,
-                            validation_errors=errors if errors else None
-                        )
-                    except Exception:
-                        pass  # Database may not be initialized
+                records.append({
+                    'source_artifact_id': artifact_id,
+                    'source_artifact_path': relative_path,
+                    'evidence_kind': kind,
+                    'target_path': target,
+                    'required': required,
+                    'resolved': resolved,
+                    'resolved_path': target if resolved else None,
+                    'validation_errors': errors if errors else None,
+                })
+            
+            # Record references and their resolution in database
+            if self.writer:
+                self.writer.record_evidence_refs(records)
+            else:
+                try:
+                    self.db.record_evidence_refs(records)
+                except sqlite3.Error as e:
+                    self.db_errors.append(f"{relative_path}: {e}")
+                    print(f"  Warning: Could not record {relative_path} in database: {e}",
+                          file=sys.stderr)
             
         except Exception as e:
             print(f"  Warning: Could not scan {file_path}: {e}")
         
         return links
     
+    def _find_evidence_refs(self, file_path: Path) -> List[list]:
+        """
+        Find raw evidence references in a file (uncached).
+        
+        Returns:
+            [evidence_kind, target] records
+        """
+        refs = []
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        
+        for kind, pattern in self.EVIDENCE_KINDS.items():
+            for match in re.finditer(pattern, content, re.IGNORECASE):
+                # Extract target path/ID from match
+                parts = match.group(0).split(':', 1)
+                target = parts[1].strip() if len(parts) > 1 else None
+                refs.append([kind, target])
+        
+        return refs
+    
     def _resolve_evidence(
         self,
         target: Optional[str],
@@ -194,14 +229,13 @@ class EvidenceValidator:
         all_links = []
         
         # Find files that typically contain evidence references
-        md_files = list(directory.rglob('*.md'))
-        json_files = list(directory.rglob('*.json'))
-        
-        # Exclude certain directories
+        # (one view per suffix keeps the scan order)
         excluded_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+        self.index = index_for(directory, self.index)
         files_to_scan = [
-            f for f in (md_files + json_files)
-            if not any(exc in f.parts for exc in excluded_dirs)
+            f for ext in ('.md', '.json')
+            for f in self.index.paths(under=directory, suffixes={ext},
+                                      exclude_dirs=excluded_dirs)
         ]
         
         print(f"Found {len(files_to_scan)} files to scan")
@@ -245,68 +279,97 @@ class EvidenceValidator:
 def run_gate_008(
     db_path: str = "plc_ontology.db",
     directory: Path = Path('.'),
-    required_only: bool = False
+    required_only: bool = False,
+    cache: Optional[ContentCache] = None,
+    index: Optional[RepoIndex] = None,
+    async_db: bool = False
 ) -> Tuple[bool, Dict[str, Any]]:
     """
     Execute GATE-008 check.
     
+    With async_db, database writes go through a background writer thread
+    and its stats are reported under report['db_writer']. The writer is
+    always drained; rows it failed to write fail the gate. Without it, a
+    failed synchronous write is counted in report['db_errors'] and also
+    fails the gate.
+    
     Returns:
         (passed, report)
     """
     import time
     start_time = time.time()
     
-    validator = EvidenceValidator(db_path)
-    
-    # Scan repository
-    all_links = validator.scan_repository(directory)
-    
-    # Filter for required only if requested
-    unresolved = validator.unresolved_links
-    if required_only:
-        unresolved = [link for link in unresolved if link.required]
-    
-    # Generate report
-    report = {
-        'total_evidence_links': len(all_links),
-        'unresolved_links': len(unresolved),
-        'required_unresolved': len([l for l in unresolved if l.required]),
-        'optional_unresolved': len([l for l in unresolved if not l.required]),
-    }
-    
-    execution_time_ms = int((time.time() - start_time) * 1000)
-    
-    # For GATE-008, we use WARN level by default per Known Issues document
-    # Only FAIL if required evidence is missing
-    required_unresolved = [l for l in unresolved if l.required]
-    passed = len(required_unresolved) == 0
-    
-    run_id = validator.db.record_gate_run(
-        gate_code='GATE-008',
-        passed=passed,
-        error_count=len(required_unresolved),
-        warning_count=len(unresolved) - len(required_unresolved),
-        execution_time_ms=execution_time_ms,
-        metadata=report
-    )
-    
-    # Record findings
-    for link in unresolved:
-        severity = 'ERROR' if link.required else 'WARN'
-        validator.db.record_gate_finding(
-            run_id=run_id,
-            gate_code='GATE-008',
-            severity=severity,
-            message=f"Unresolved {link.evidence_kind} evidence: {link.target_path}",
-            artifact_path=link.source_path,
-            finding_code='UNRESOLVED_EVIDENCE',
-            details={
-                'evidence_kind': link.evidence_kind,
-                'target_path': link.target_path,
-                'required': link.required,
-                'errors': link.errors
+    writer = BackgroundWriter(db_path) if async_db else None
+    writer_stats = None
+    try:
+        validator = EvidenceValidator(db_path, index=index, cache=cache, writer=writer)
+        db = writer or validator.db
+        
+        # Scan and record the whole run in a single transaction
+        with validator.db.transaction():
+            # Scan repository
+            all_links = validator.scan_repository(directory)
+            
+            # Filter for required only if requested
+            unresolved = validator.unresolved_links
+            if required_only:
+                unresolved = [link for link in unresolved if link.required]
+            
+            # Generate report
+            report = {
+                'total_evidence_links': len(all_links),
+                'unresolved_links': len(unresolved),
+                'required_unresolved': len([l for l in unresolved if l.required]),
+                'optional_unresolved': len([l for l in unresolved if not l.required]),
             }
-        )
+            if validator.db_errors:
+                report['db_errors'] = len(validator.db_errors)
+            
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            
+            # For GATE-008, we use WARN level by default per Known Issues document
+            # Only FAIL if required evidence is missing
+            required_unresolved = [l for l in unresolved if l.required]
+            passed = len(required_unresolved) == 0 and not validator.db_errors
+            
+            run_id = db.record_gate_run(
+                gate_code='GATE-008',
+                passed=passed,
+                error_count=len(required_unresolved),
+                warning_count=len(unresolved) - len(required_unresolved),
+                execution_time_ms=execution_time_ms,
+                metadata=report
+            )
+            
+            # Record findings
+            db.record_gate_findings(run_id, 'GATE-008', (
+                {
+                    'severity': 'ERROR' if link.required else 'WARN',
+                    'message': f"Unresolved {link.evidence_kind} evidence: {link.target_path}",
+                    'artifact_path': link.source_path,
+                    'finding_code': 'UNRESOLVED_EVIDENCE',
+                    'details': {
+                        'evidence_kind': link.evidence_kind,
+                        'target_path': link.target_path,
+                        'required': link.required,
+                        'errors': link.errors
+                    }
+                }
+                for link in unresolved
+            ))
+    finally:
+        # Always drain the queue, also when the scan or recording failed
+        if writer:
+            writer_stats = writer.close()
+            if writer_stats.errors:
+                print(f"Warning: DB writer: {writer_stats.summary()}", file=sys.stderr)
+                for message in writer_stats.error_messages:
+                    print(f"  {message}", file=sys.stderr)
+    
+    if writer_stats is not None:
+        report['db_writer'] = asdict(writer_stats)
+        if writer_stats.errors:
+            passed = False  # Results were not fully recorded
     
     return (passed, report)
 
@@ -359,6 +422,13 @@ Examples:
         action='store_true',
         help='Output report in JSON format'
     )
+    parser.add_argument(
+        '--async-db',
+        action='store_true',
+        help='Record to the database from a background writer thread'
+    )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
@@ -368,7 +438,15 @@ Examples:
     directory = Path(args.directory)
     
     try:
-        validator = EvidenceValidator(args.db_path)
+        # Restrict the repository scan to files changed since --since REF
+        changes = change_set_from_args(args, directory)
+    except ChangeSetError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    
+    cache = cache_from_args(args, args.db_path)
+    try:
+        validator = EvidenceValidator(args.db_path, cache=cache)
         
         # Initialize database if needed
         try:
@@ -398,11 +476,15 @@ Examples:
                 print(f"Found {len(links)} evidence link(s) in {args.file}")
                 validator.print_unresolved_links()
             
-            return 0 if all(l.resolved for l in links) else 1
+            return 0 if all(l.resolved for l in links) and not validator.db_errors else 1
         
         # Scan all
         if args.all:
-            passed, report = run_gate_008(args.db_path, directory, args.required_only)
+            passed, report = run_gate_008(
+                args.db_path, directory, args.required_only, cache,
+                index=changes.index() if changes else None,
+                async_db=args.async_db
+            )
             
             if args.json:
                 print(json.dumps(report, indent=2))
@@ -420,6 +502,8 @@ Examples:
                 print(f"Unresolved links: {report['unresolved_links']}")
                 print(f"  Required: {report['required_unresolved']}")
                 print(f"  Optional: {report['optional_unresolved']}")
+                if 'db_writer' in report:
+                    print(f"DB writer: {WriterStats(**report['db_writer']).summary()}")
                 print(f"{'═'*70}")
             
             return 0 if passed else 1
@@ -429,6 +513,8 @@ Examples:
         import traceback
         traceback.print_exc()
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
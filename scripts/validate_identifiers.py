@@ -15,6 +15,7 @@ Usage:
     python scripts/validate_identifiers.py --all
     python scripts/validate_identifiers.py --file <path>
     python scripts/validate_identifiers.py --kind <identifier_kind>
+    python scripts/validate_identifiers.py --all --async-db
 
 Exit codes:
     0: All identifiers valid
@@ -23,19 +24,27 @@ Exit codes:
 """
 
 import argparse
+import hashlib
 import json
 import re
+import sqlite3
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
-# Import PLC database module
+# Import PLC database, repository index, content cache and change set modules
 try:
-    from plc_db import PLCDatabase
+    from plc_db import BackgroundWriter, PLCDatabase, WriterStats
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
-    from plc_db import PLCDatabase
+    from plc_db import BackgroundWriter, PLCDatabase, WriterStats
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
 
 
 @dataclass
@@ -58,11 +67,23 @@ class IdentifierValidator:
     the basic nomenclature validation.
     """
     
-    def __init__(self, db_path: str = "plc_ontology.db"):
-        """Initialize with database connection."""
+    def __init__(self, db_path: str = "plc_ontology.db",
+                 index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None,
+                 writer: Optional[BackgroundWriter] = None):
+        """
+        Initialize with database connection and optional shared index/cache.
+        
+        With a background writer, identifier instances are queued to it
+        instead of being written from the scan loop.
+        """
         self.db = PLCDatabase(db_path)
+        self.writer = writer
+        self.index = index
+        self.cache = cache or ContentCache.disabled()
         self.grammars = self._load_grammars()
         self.invalid_instances: List[IdentifierInstance] = []
+        self.db_errors: List[str] = []  # Failed database writes (fail the gate)
     
     def _load_grammars(self) -> Dict[str, Dict[str, Any]]:
         """Load identifier grammars from database."""
@@ -140,59 +161,78 @@ class IdentifierValidator:
         instances = []
         
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            lines = content.split('\n')
-            
             relative_path = str(file_path.relative_to(base_dir))
+            matches = self.cache.get(file_path, self._match_facet(), self._find_matches)
+            records = []
             
-            for line_num, line in enumerate(lines, 1):
-                # Check each identifier pattern
-                for id_kind, grammar in self.grammars.items():
-                    pattern = grammar['regex']
-                    
-                    # Find all matches in the line
-                    matches = re.finditer(pattern, line)
-                    
-                    for match in matches:
-                        id_value = match.group(0)
-                        
-                        # Validate the identifier
-                        is_valid, errors = self.validate_identifier(id_kind, id_value)
-                        
-                        instance = IdentifierInstance(
-                            identifier_kind=id_kind,
-                            identifier_value=id_value,
-                            artifact_path=relative_path,
-                            line_number=line_num,
-                            context=line.strip()[:100],  # First 100 chars of line
-                            valid=is_valid,
-                            errors=errors
-                        )
-                        
-                        instances.append(instance)
-                        
-                        if not is_valid:
-                            self.invalid_instances.append(instance)
-                        
-                        # Record in database
-                        try:
-                            self.db.record_identifier_instance(
-                                identifier_kind=id_kind,
-                                identifier_value=id_value,
-                                artifact_path=relative_path,
-                                valid=is_valid,
-                                artifact_line=line_num,
-                                context={'line': line.strip()[:100]},
-                                validation_errors=errors if errors else None
-                            )
-                        except Exception:
-                            pass  # Database may not be initialized
+            for id_kind, id_value, line_num, context in matches:
+                # Validate the identifier
+                is_valid, errors = self.validate_identifier(id_kind, id_value)
+                
+                instance = IdentifierInstance(
+                    identifier_kind=id_kind,
+                    identifier_value=id_value,
+                    artifact_path=relative_path,
+                    line_number=line_num,
+                    context=context,
+                    valid=is_valid,
+                    errors=errors
+                )
+                
+                instances.append(instance)
+                
+                if not is_valid:
+                    self.invalid_instances.append(instance)
+                
+                records.append({
+                    'identifier_kind': id_kind,
+                    'identifier_value': id_value,
+                    'artifact_path': relative_path,
+                    'valid': is_valid,
+                    'artifact_line': line_num,
+                    'context': {'line': context},
+                    'validation_errors': errors if errors else None,
+                })
+            
+            # Record in database
+            if self.writer:
+                self.writer.record_identifier_instances(records)
+            else:
+                try:
+                    self.db.record_identifier_instances(records)
+                except sqlite3.Error as e:
+                    self.db_errors.append(f"{relative_path}: {e}")
+                    print(f"  Warning: Could not record {relative_path} in database: {e}",
+                          file=sys.stderr)
             
         except Exception as e:
             print(f"  Warning: Could not scan {file_path}: {e}")
         
         return instances
     
+    def _match_facet(self) -> str:
+        """Cache facet name, tagged with the grammar set the matches depend on."""
+        signature = json.dumps(sorted((k, g['regex']) for k, g in self.grammars.items()))
+        return 'identifiers:' + hashlib.sha256(signature.encode()).hexdigest()[:12]
+    
+    def _find_matches(self, file_path: Path) -> List[list]:
+        """
+        Find raw identifier matches in a file (uncached).
+        
+        Returns:
+            [identifier_kind, identifier_value, line_number, context] records
+        """
+        matches = []
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        
+        for line_num, line in enumerate(content.split('\n'), 1):
+            # Check each identifier pattern
+            for id_kind, grammar in self.grammars.items():
+                for match in re.finditer(grammar['regex'], line):
+                    matches.append([id_kind, match.group(0), line_num, line.strip()[:100]])
+        
+        return matches
+    
     def scan_repository(self, directory: Path = Path('.')) -> List[IdentifierInstance]:
         """
         Scan entire repository for identifiers.
@@ -205,15 +245,13 @@ class IdentifierValidator:
         all_instances = []
         
         # Find Markdown, JSON, and YAML files
-        md_files = list(directory.rglob('*.md'))
-        json_files = list(directory.rglob('*.json'))
-        yaml_files = list(directory.rglob('*.yaml')) + list(directory.rglob('*.yml'))
-        
-        # Exclude certain directories
+        # Find files to scan (one view per suffix keeps the scan order)
         excluded_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+        self.index = index_for(directory, self.index)
         files_to_scan = [
-            f for f in (md_files + json_files + yaml_files)
-            if not any(exc in f.parts for exc in excluded_dirs)
+            f for ext in ('.md', '.json', '.yaml', '.yml')
+            for f in self.index.paths(under=directory, suffixes={ext},
+                                      exclude_dirs=excluded_dirs)
         ]
         
         print(f"Found {len(files_to_scan)} files to scan")
@@ -288,67 +326,97 @@ class IdentifierValidator:
                 print(f"    ...and {len(instances) - 5} more\n")
 
 
-def run_gate_005(db_path: str = "plc_ontology.db", directory: Path = Path('.')) -> Tuple[bool, Dict[str, Any]]:
+def run_gate_005(db_path: str = "plc_ontology.db", directory: Path = Path('.'),
+                 cache: Optional[ContentCache] = None,
+                 index: Optional[RepoIndex] = None,
+                 async_db: bool = False) -> Tuple[bool, Dict[str, Any]]:
     """
     Execute GATE-005 check.
     
+    With async_db, database writes go through a background writer thread
+    and its stats are reported under report['db_writer']. The writer is
+    always drained; rows it failed to write fail the gate. Without it, a
+    failed synchronous write is counted in report['db_errors'] and also
+    fails the gate.
+    
     Returns:
         (passed, report)
     """
     import time
     start_time = time.time()
     
-    validator = IdentifierValidator(db_path)
-    
-    # Scan repository
-    all_instances = validator.scan_repository(directory)
-    
-    # Generate report
-    report = {
-        'total_identifiers': len(all_instances),
-        'invalid_identifiers': len(validator.invalid_instances),
-        'by_kind': {}
-    }
-    
-    # Count by kind
-    for instance in all_instances:
-        kind = instance.identifier_kind
-        if kind not in report['by_kind']:
-            report['by_kind'][kind] = {'total': 0, 'invalid': 0}
-        report['by_kind'][kind]['total'] += 1
-        if not instance.valid:
-            report['by_kind'][kind]['invalid'] += 1
-    
-    execution_time_ms = int((time.time() - start_time) * 1000)
-    
-    # Record gate run in database
-    passed = len(validator.invalid_instances) == 0
-    run_id = validator.db.record_gate_run(
-        gate_code='GATE-005',
-        passed=passed,
-        error_count=len(validator.invalid_instances),
-        warning_count=0,
-        execution_time_ms=execution_time_ms,
-        metadata=report
-    )
-    
-    # Record findings
-    for instance in validator.invalid_instances:
-        validator.db.record_gate_finding(
-            run_id=run_id,
-            gate_code='GATE-005',
-            severity='ERROR',
-            message=f"Invalid {instance.identifier_kind}: {instance.identifier_value}",
-            artifact_path=instance.artifact_path,
-            line_number=instance.line_number,
-            finding_code='INVALID_IDENTIFIER',
-            details={
-                'identifier_kind': instance.identifier_kind,
-                'identifier_value': instance.identifier_value,
-                'errors': instance.errors,
-                'context': instance.context
+    writer = BackgroundWriter(db_path) if async_db else None
+    writer_stats = None
+    try:
+        validator = IdentifierValidator(db_path, index=index, cache=cache, writer=writer)
+        db = writer or validator.db
+        
+        # Scan and record the whole run in a single transaction
+        with validator.db.transaction():
+            # Scan repository
+            all_instances = validator.scan_repository(directory)
+            
+            # Generate report
+            report = {
+                'total_identifiers': len(all_instances),
+                'invalid_identifiers': len(validator.invalid_instances),
+                'by_kind': {}
             }
-        )
+            if validator.db_errors:
+                report['db_errors'] = len(validator.db_errors)
+            
+            # Count by kind
+            for instance in all_instances:
+                kind = instance.identifier_kind
+                if kind not in report['by_kind']:
+                    report['by_kind'][kind] = {'total': 0, 'invalid': 0}
+                report['by_kind'][kind]['total'] += 1
+                if not instance.valid:
+                    report['by_kind'][kind]['invalid'] += 1
+            
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            
+            # Record gate run in database
+            passed = len(validator.invalid_instances) == 0 and not validator.db_errors
+            run_id = db.record_gate_run(
+                gate_code='GATE-005',
+                passed=passed,
+                error_count=len(validator.invalid_instances),
+                warning_count=0,
+                execution_time_ms=execution_time_ms,
+                metadata=report
+            )
+            
+            # Record findings
+            db.record_gate_findings(run_id, 'GATE-005', (
+                {
+                    'severity': 'ERROR',
+                    'message': f"Invalid {instance.identifier_kind}: {instance.identifier_value}",
+                    'artifact_path': instance.artifact_path,
+                    'line_number': instance.line_number,
+                    'finding_code': 'INVALID_IDENTIFIER',
+                    'details': {
+                        'identifier_kind': instance.identifier_kind,
+                        'identifier_value': instance.identifier_value,
+                        'errors': instance.errors,
+                        'context': instance.context
+                    }
+                }
+                for instance in validator.invalid_instances
+            ))
+    finally:
+        # Always drain the queue, also when the scan or recording failed
+        if writer:
+            writer_stats = writer.close()
+            if writer_stats.errors:
+                print(f"Warning: DB writer: {writer_stats.summary()}", file=sys.stderr)
+                for message in writer_stats.error_messages:
+                    print(f"  {message}", file=sys.stderr)
+    
+    if writer_stats is not None:
+        report['db_writer'] = asdict(writer_stats)
+        if writer_stats.errors:
+            passed = False  # Results were not fully recorded
     
     return (passed, report)
 
@@ -401,6 +469,13 @@ Examples:
         action='store_true',
         help='Output report in JSON format'
     )
+    parser.add_argument(
+        '--async-db',
+        action='store_true',
+        help='Record to the database from a background writer thread'
+    )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
@@ -410,7 +485,15 @@ Examples:
     directory = Path(args.directory)
     
     try:
-        validator = IdentifierValidator(args.db_path)
+        # Restrict the repository scan to files changed since --since REF
+        changes = change_set_from_args(args, directory)
+    except ChangeSetError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    
+    cache = cache_from_args(args, args.db_path)
+    try:
+        validator = IdentifierValidator(args.db_path, cache=cache)
         
         # Initialize database if needed
         try:
@@ -444,11 +527,15 @@ Examples:
                 print(f"Found {len(instances)} identifier(s) in {args.file}")
                 validator.print_invalid_identifiers()
             
-            return 0 if all(i.valid for i in instances) else 1
+            return 0 if all(i.valid for i in instances) and not validator.db_errors else 1
         
         # Scan all
         if args.all:
-            passed, report = run_gate_005(args.db_path, directory)
+            passed, report = run_gate_005(
+                args.db_path, directory, cache,
+                index=changes.index() if changes else None,
+                async_db=args.async_db
+            )
             
             # Filter by kind if specified
             if args.kind and not args.json:
@@ -468,6 +555,8 @@ Examples:
                 print(f"Result: {'✅ PASSED' if passed else '❌ FAILED'}")
                 print(f"Total identifiers: {report['total_identifiers']}")
                 print(f"Invalid identifiers: {report['invalid_identifiers']}")
+                if 'db_writer' in report:
+                    print(f"DB writer: {WriterStats(**report['db_writer']).summary()}")
                 print(f"{'═'*70}")
             
             return 0 if passed else 1
@@ -477,6 +566,8 @@ Examples:
         import traceback
         traceback.print_exc()
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
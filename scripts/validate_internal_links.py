@@ -30,18 +30,44 @@ Usage:
 
     # With report output
     python scripts/validate_internal_links.py --scope repo --report out/link_report.txt
+
+    # Also validate '#anchor' fragments against the target's headings
+    python scripts/validate_internal_links.py --scope repo --check-anchors
+
+Anchor mode builds a per-file index of GitHub-style heading slugs while the
+files are read for link extraction, and checks 'file.md#anchor' and
+'#anchor' links against it. The anchor lists are kept in the content cache,
+so unchanged target files are not parsed again on later runs.
 """
 
 import argparse
-import csv
 import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from collections import defaultdict
 
+# Import shared filename parser, repository index, change set and rename map
+try:
+    import nomenclature
+    from repo_index import RepoIndex, index_for
+    from change_set import ChangeSet, add_since_argument
+    from rename_map import RenameMap
+    from markdown_anchors import ANCHORS_FACET, heading_anchors, has_anchor
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from link_extractor import INLINE, mapped_file, scan_links
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    import nomenclature
+    from repo_index import RepoIndex, index_for
+    from change_set import ChangeSet, add_since_argument
+    from rename_map import RenameMap
+    from markdown_anchors import ANCHORS_FACET, heading_anchors, has_anchor
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from link_extractor import INLINE, mapped_file, scan_links
+
 
 class LinkIntegrityGate:
     """
@@ -54,6 +80,9 @@ class LinkIntegrityGate:
     GATE_CODE = "GATE-LINK-001"
     GATE_NAME = "Link Integrity Check"
     
+    # Reference diffed against for scope 'diff' when no --since is given
+    DEFAULT_DIFF_BASE = 'HEAD~1'
+    
     # Excluded directories
     EXCLUDED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'out', '.cache'}
     
@@ -86,11 +115,18 @@ class LinkIntegrityGate:
         r'k01-authority-pack-example-manifest',  # Example manifest files
     ]
     
+    # Kebab-case filename parts longer than this are used for partial matching
+    MIN_MATCH_TOKEN_LENGTH = 10
+    
     def __init__(
         self,
         repo_root: Path = Path('.'),
         rename_maps: Optional[List[str]] = None,
-        db_path: Optional[str] = None
+        db_path: Optional[str] = None,
+        index: Optional[RepoIndex] = None,
+        since: Optional[str] = None,
+        cache: Optional[ContentCache] = None,
+        check_anchors: bool = False
     ):
         """
         Initialize the link integrity gate.
@@ -99,12 +135,20 @@ class LinkIntegrityGate:
             repo_root: Repository root directory
             rename_maps: List of rename map CSV paths to load
             db_path: Optional path to PLC database
+            index: Shared repository index (walked on demand if not given)
+            since: Git reference for scope 'diff' (default: HEAD~1)
+            cache: Persistent content cache for heading anchors
+            check_anchors: Also validate '#anchor' fragments of links
         """
         self.repo_root = repo_root.resolve()
-        self.rename_map: Dict[str, str] = {}
-        self.reverse_map: Dict[str, str] = {}  # For name-based matching
+        self.index = index
+        self.since = since
+        self.changes: Optional[ChangeSet] = None  # Computed on first diff scan
+        self.rename_map = RenameMap()  # Suffix-indexed old -> new paths
         self.db_path = db_path
         self.db = None
+        self.cache = cache or ContentCache.disabled()
+        self.check_anchors = check_anchors
         
         # Load rename maps
         if rename_maps is None:
@@ -125,6 +169,8 @@ class LinkIntegrityGate:
         self.files_updated: int = 0
         self.run_id: Optional[int] = None
         self.ignore_placeholders: bool = True  # By default, ignore template placeholders
+        self._match_indexes = None  # Fix suggestion indexes, built on first broken link
+        self._anchors: Dict[str, Set[str]] = {}  # Heading anchors per file (anchor mode)
     
     def _is_template_placeholder(self, link_path: str) -> bool:
         """Check if a link is a template placeholder (to non-existent template structure)."""
@@ -140,18 +186,7 @@ class LinkIntegrityGate:
             return
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    old_path = row.get('old_path', '')
-                    new_path = row.get('new_path', '')
-                    if old_path and new_path and old_path != new_path:
-                        self.rename_map[old_path] = new_path
-                        # Also map by filename only for fuzzy matching
-                        old_name = Path(old_path).name
-                        new_name = Path(new_path).name
-                        if old_name != new_name:
-                            self.reverse_map[old_name] = new_path
+            self.rename_map.read_csv(str(full_path), skip_unchanged=True)
         except Exception as e:
             print(f"Warning: Could not load rename map {csv_path}: {e}", file=sys.stderr)
     
@@ -185,53 +220,54 @@ class LinkIntegrityGate:
     
     def _get_markdown_files(self, scope: str = 'repo') -> List[Path]:
         """Get list of Markdown files to scan."""
-        if scope == 'repo':
-            md_files = list(self.repo_root.rglob('*.md'))
-        elif scope == 'diff':
+        if scope == 'diff':
             # Get files changed in current PR/branch
             md_files = self._get_diff_files()
-        else:
-            md_files = list(self.repo_root.rglob('*.md'))
-        
-        # Filter excluded paths
-        return [f for f in md_files if not self._should_exclude(f.relative_to(self.repo_root))]
+            # Filter excluded paths
+            return [f for f in md_files if not self._should_exclude(f.relative_to(self.repo_root))]
+        
+        return self._get_index().paths(
+            under=self.repo_root,
+            suffixes={'.md'},
+            exclude_dirs=self.EXCLUDED_DIRS,
+            exclude_files=self.EXCLUDED_FILES
+        )
+    
+    def _get_index(self) -> RepoIndex:
+        """Return the shared repository index, walking the tree on first use."""
+        self.index = index_for(self.repo_root, self.index)
+        return self.index
     
     def _get_diff_files(self) -> List[Path]:
-        """Get Markdown files changed in current diff."""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', 'HEAD~1'],
-                capture_output=True, text=True, cwd=self.repo_root
-            )
-            if result.returncode == 0:
-                files = result.stdout.strip().split('\n')
-                return [
-                    self.repo_root / f for f in files
-                    if f.endswith('.md') and (self.repo_root / f).exists()
-                ]
-        except Exception:
-            # Git command failed (e.g., not in a git repo or no commits), fall back to glob
-            pass
-        return list(self.repo_root.rglob('*.md'))
-    
-    def _extract_links(self, content: str) -> List[Tuple[str, str, int]]:
         """
-        Extract Markdown links from content.
+        Get Markdown files affected by the current diff.
         
-        Returns:
-            List of (link_text, link_path, line_number) tuples
+        Includes files linking to renamed or deleted files. Raises
+        ChangeSetError if git cannot compute the diff.
+        """
+        if self.changes is None:
+            self.changes = ChangeSet(self.repo_root, self.since or self.DEFAULT_DIFF_BASE)
+            print(f"🔀 {self.changes.summary()}", file=sys.stderr)
+        return [
+            self.repo_root / rel for rel in sorted(self.changes.affected_paths)
+            if rel.endswith('.md') and (self.repo_root / rel).exists()
+        ]
+    
+    def _extract_links(self, data: bytes) -> List[Tuple[str, str, int]]:
         """
-        links = []
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+        Extract inline Markdown links from file content (shared link extractor).
         
-        for line_num, line in enumerate(content.split('\n'), 1):
-            for match in link_pattern.finditer(line):
-                link_text = match.group(1)
-                link_path = match.group(2)
-                links.append((link_text, link_path, line_num))
+        Args:
+            data: UTF-8 encoded content (bytes or a memory-mapped file)
         
-        return links
+        Returns:
+            List of (link_text, link_path, line_number) tuples
+        """
+        return [
+            (link.text, link.target, link.line)
+            for link in scan_links(data)
+            if link.kind == INLINE
+        ]
     
     def _is_internal_link(self, link_path: str) -> bool:
         """Check if a link is an internal link (not external or anchor-only)."""
@@ -265,18 +301,21 @@ class LinkIntegrityGate:
             # Anchor-only link (validated separately)
             return True, None, None
         
+        # Existence checks are answered from the shared index (no stat per link)
+        index = self._get_index()
+        
         # Resolve relative path
         if link_path.startswith('/'):
             # Absolute from repo root
             target_path = self.repo_root / link_path.lstrip('/')
         else:
             # First try as relative to source file
-            target_path = (source_file.parent / link_path).resolve()
+            target_path = index.resolve(source_file.parent / link_path)
             
             # If that doesn't exist, check if it's an absolute path from repo root (without leading /)
-            if not target_path.exists():
+            if not index.exists(target_path):
                 alt_target = self.repo_root / link_path
-                if alt_target.exists():
+                if index.exists(alt_target):
                     # The link should be relative to source file, calculate proper relative path
                     try:
                         rel_path = os.path.relpath(alt_target, source_file.parent)
@@ -287,32 +326,33 @@ class LinkIntegrityGate:
                         pass
         
         # Check if target exists
-        if target_path.exists():
+        if index.exists(target_path):
             return True, target_path, None
         
         # Try to find a fix using rename maps
         relative_path = str(link_path)
         link_name = Path(link_path).name
         
-        # Check full path in rename map
-        for old_path, new_path in self.rename_map.items():
-            if relative_path.endswith(old_path) or old_path.endswith(relative_path):
-                suggested_path = self.repo_root / new_path
-                if suggested_path.exists():
-                    # Calculate relative path from source file
-                    try:
-                        suggested_fix = os.path.relpath(suggested_path, source_file.parent)
-                    except ValueError:
-                        suggested_fix = new_path
-                    if anchor:
-                        suggested_fix += f'#{anchor}'
-                    return False, target_path, suggested_fix
-        
-        # Check by filename only (fuzzy match)
-        if link_name in self.reverse_map:
-            suggested_path = self.repo_root / self.reverse_map[link_name]
-            if suggested_path.exists():
-                suggested_fix = self.reverse_map[link_name]
+        # Check full path in rename map (entries ending in the same components)
+        for old_path, new_path in self.rename_map.matches(relative_path):
+            suggested_path = self.repo_root / new_path
+            if index.exists(suggested_path):
+                # Calculate relative path from source file
+                try:
+                    suggested_fix = os.path.relpath(suggested_path, source_file.parent)
+                except ValueError:
+                    suggested_fix = new_path
+                if anchor:
+                    suggested_fix += f'#{anchor}'
+                return False, target_path, suggested_fix
+        
+        # Check by filename only (fuzzy match, last renamed entry wins)
+        renamed = self.rename_map.renamed_by_name(link_name)
+        if renamed:
+            new_path = renamed[-1][1]
+            suggested_path = self.repo_root / new_path
+            if index.exists(suggested_path):
+                suggested_fix = new_path
                 if anchor:
                     suggested_fix += f'#{anchor}'
                 return False, target_path, suggested_fix
@@ -322,6 +362,47 @@ class LinkIntegrityGate:
         
         return False, target_path, suggested_fix
     
+    def _get_anchors(self, path: Path, data: Optional[bytes] = None) -> Set[str]:
+        """
+        Heading anchors of a Markdown file (anchor mode).
+        
+        Anchors are computed once per run and kept in the content cache
+        (ANCHORS_FACET, versioned with the slug rules), so unchanged files
+        are not parsed again.
+        
+        Args:
+            path: Markdown file
+            data: The file's content if it has already been read (or mapped)
+            
+        Returns:
+            Set of anchor names
+        """
+        key = str(path)
+        anchors = self._anchors.get(key)
+        if anchors is None:
+            def compute(p: Path) -> List[str]:
+                if data is None:
+                    return heading_anchors(p.read_text(encoding='utf-8', errors='ignore'))
+                return heading_anchors(data[:].decode('utf-8', errors='ignore'))
+            
+            entry = None
+            index = self._get_index()
+            try:
+                entry = index.get(path.relative_to(index.root).as_posix())
+            except ValueError:
+                pass
+            anchors = set(self.cache.get(path, ANCHORS_FACET, compute, entry))
+            self._anchors[key] = anchors
+        return anchors
+    
+    def _check_anchor(self, source_file: Path, target_path: Optional[Path], anchor: str) -> bool:
+        """Check an anchor against the headings of a link target (non-Markdown targets pass)."""
+        if target_path is None:
+            target_path = source_file
+        if target_path.suffix.lower() != '.md' or not self._get_index().is_file(target_path):
+            return True
+        return has_anchor(self._get_anchors(target_path), anchor)
+    
     def _extract_subject_from_filename(self, filename: str) -> Optional[str]:
         """
         Extract the SUBJECT field from a v6.0 filename (after __).
@@ -330,6 +411,12 @@ class LinkIntegrityGate:
         The subject is everything between __ and the TYPE code.
         TYPE codes are uppercase 2-4 letter codes like STD, IDX, RPT, etc.
         """
+        # Conforming v6.0/v5.0 names: use the shared parser
+        for standard in ('v6.0', 'v5.0'):
+            fields = nomenclature.parse(filename, standard)
+            if fields:
+                return fields.subject
+        
         if '__' not in filename:
             return None
         
@@ -362,66 +449,138 @@ class LinkIntegrityGate:
         
         return parts[0] if parts else None
     
+    def _match_tokens(self, filename: str) -> List[str]:
+        """Kebab-case descriptive parts of a filename used for partial matching."""
+        name_parts = filename.replace('.md', '').split('_')
+        return [part for part in name_parts
+                if '-' in part and len(part) > self.MIN_MATCH_TOKEN_LENGTH]
+    
+    def _get_match_indexes(self) -> Dict[str, Dict[str, List[Tuple[Tuple[str, ...], Path]]]]:
+        """
+        Return the fix suggestion indexes, building them on first use.
+        
+        Built once per gate from the shared repository index:
+            'name':    basename -> files and directories with that name
+            'subject': nomenclature SUBJECT -> Markdown files
+            'token':   kebab-case filename part -> Markdown files
+        Each candidate is stored as (directory parts, absolute path).
+        Partial matches are resolved against the distinct kebab-case parts
+        and memoized in 'partial'.
+        """
+        if self._match_indexes is not None:
+            return self._match_indexes
+        
+        by_name: Dict[str, List[Tuple[Tuple[str, ...], Path]]] = defaultdict(list)
+        by_subject: Dict[str, List[Tuple[Tuple[str, ...], Path]]] = defaultdict(list)
+        by_token: Dict[str, List[Tuple[Tuple[str, ...], Path]]] = defaultdict(list)
+        directories = set()
+        
+        index = self._get_index()
+        for entry in index:
+            candidate = (entry.dir_parts, entry.path)
+            by_name[entry.name].append(candidate)
+            for depth in range(1, len(entry.dir_parts) + 1):
+                directories.add(entry.dir_parts[:depth])
+            
+            if entry.ext != '.md':
+                continue
+            subject = self._extract_subject_from_filename(entry.name)
+            if subject:
+                by_subject[subject].append(candidate)
+            for part in set(entry.name[:-len(entry.ext)].split('_')):
+                if '-' in part:
+                    by_token[part].append(candidate)
+        
+        # Links may also point at directories
+        for parts in sorted(directories):
+            by_name[parts[-1]].append((parts[:-1], index.root.joinpath(*parts)))
+        
+        self._match_indexes = {
+            'name': by_name, 'subject': by_subject, 'token': by_token, 'partial': {}
+        }
+        return self._match_indexes
+    
+    def _partial_matches(self, token: str) -> List[Tuple[Tuple[str, ...], Path]]:
+        """Markdown files whose name contains a kebab-case token (like rglob('*token*.md'))."""
+        indexes = self._get_match_indexes()
+        partial = indexes['partial']
+        if token not in partial:
+            partial[token] = [
+                candidate
+                for part, candidates in indexes['token'].items() if token in part
+                for candidate in candidates
+            ]
+        return partial[token]
+    
+    @staticmethod
+    def _directory_distance(source_parts: Tuple[str, ...], target_parts: Tuple[str, ...]) -> int:
+        """Number of directory steps (up, then down) between two directories."""
+        common = 0
+        for a, b in zip(source_parts, target_parts):
+            if a != b:
+                break
+            common += 1
+        return (len(source_parts) - common) + (len(target_parts) - common)
+    
     def _find_nearest_match(
         self,
         source_file: Path,
         link_name: str,
         original_path: str
     ) -> Optional[str]:
-        """Find the nearest matching file by name or SUBJECT field and return relative path."""
-        # Search in same directory first, then portal, then repo root
-        search_dirs = [
-            source_file.parent,
-            self.repo_root / 'AMPEL360-SPACE-T-PORTAL',
-            self.repo_root,
-        ]
+        """
+        Find the nearest matching file by name or SUBJECT field and return relative path.
         
-        # Also add directories from the original path
-        if '/' in original_path:
-            base_parts = Path(original_path).parts[:-1]
-            for i in range(len(base_parts)):
-                search_dirs.append(source_file.parent.joinpath(*base_parts[:i+1]))
+        Candidates are looked up by exact name, then by SUBJECT, then by
+        kebab-case descriptive part in the indexes of _get_match_indexes().
+        Among the candidates of the first lookup that finds any, the one
+        closest to the source file's directory wins (ties broken by path).
         
-        def get_relative_path(match: Path) -> str:
-            """Get relative path from source file."""
+        Args:
+            source_file: The file containing the broken link
+            link_name: Filename of the link target
+            original_path: The link path as written (the indexes cover the
+                           whole repository, so its directories are no
+                           longer searched separately)
+        """
+        indexes = self._get_match_indexes()
+        try:
+            source_parts = source_file.parent.relative_to(self._get_index().root).parts
+        except ValueError:
+            source_parts = ()
+        
+        def nearest(candidates: List[Tuple[Tuple[str, ...], Path]]) -> Optional[str]:
+            """Relative path from the source file to the closest candidate."""
+            if not candidates:
+                return None
+            _, match = min(
+                candidates,
+                key=lambda c: (self._directory_distance(source_parts, c[0]), str(c[1]))
+            )
             try:
                 return os.path.relpath(match, source_file.parent)
             except ValueError:
                 return str(match.relative_to(self.repo_root))
         
         # First try exact name match
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                for match in search_dir.rglob(link_name):
-                    if match.exists():
-                        return get_relative_path(match)
+        found = nearest(indexes['name'].get(link_name, []))
+        if found:
+            return found
         
         # Try SUBJECT-based matching for v6.0 nomenclature
         subject = self._extract_subject_from_filename(link_name)
         if subject:
-            # Find files with same subject
-            pattern = f'*__{subject}_*.md'
-            for search_dir in search_dirs:
-                if search_dir.exists():
-                    for match in search_dir.rglob(pattern):
-                        if match.exists():
-                            return get_relative_path(match)
-        
-        # Try partial filename matching (for old format links)
-        # Extract key parts from link name
+            found = nearest(indexes['subject'].get(subject, []))
+            if found:
+                return found
+        
+        # Try partial filename matching (for old format links), by the
+        # descriptive part of the filename, e.g. "stakeholder-ai-entrypoint"
         if '_' in link_name:
-            # Try to match by the descriptive part of the filename
-            # E.g., "stakeholder-ai-entrypoint" from full filename
-            name_parts = link_name.replace('.md', '').split('_')
-            # Look for kebab-case descriptive parts
-            for part in name_parts:
-                if '-' in part and len(part) > 10:
-                    pattern = f'*{part}*.md'
-                    for search_dir in search_dirs[:3]:  # Limit search scope
-                        if search_dir.exists():
-                            for match in search_dir.rglob(pattern):
-                                if match.exists():
-                                    return get_relative_path(match)
+            for token in self._match_tokens(link_name):
+                found = nearest(self._partial_matches(token))
+                if found:
+                    return found
         
         return None
     
@@ -440,49 +599,77 @@ class LinkIntegrityGate:
         self.template_placeholders = []
         self.files_scanned = 0
         self.ignore_placeholders = ignore_placeholders
+        self._anchors = {}
         
         md_files = self._get_markdown_files(scope)
         
         for md_file in md_files:
             try:
-                content = md_file.read_text(encoding='utf-8', errors='ignore')
-                self.files_scanned += 1
-                
-                links = self._extract_links(content)
+                with mapped_file(md_file) as data:
+                    self.files_scanned += 1
+                    
+                    if self.check_anchors:
+                        # Index this file's headings from the content already mapped
+                        self._get_anchors(md_file, data)
+                    
+                    links = self._extract_links(data)
                 
                 for link_text, link_path, line_num in links:
                     if not self._is_internal_link(link_path):
+                        if self.check_anchors and link_path.startswith('#'):
+                            if not self._check_anchor(md_file, None, link_path[1:]):
+                                self._add_broken(md_file, link_text, link_path, line_num,
+                                                 md_file, None, anchor=link_path[1:])
                         continue
                     
                     exists, resolved_path, suggested_fix = self._resolve_link(md_file, link_path)
                     
                     if not exists:
-                        relative_source = str(md_file.relative_to(self.repo_root))
-                        
-                        is_placeholder = self._is_template_placeholder(link_path)
-                        
-                        broken_link = {
-                            'source_path': relative_source,
-                            'target_link': link_path,
-                            'target_resolved': str(resolved_path) if resolved_path else None,
-                            'link_text': link_text,
-                            'line_number': line_num,
-                            'fixable': suggested_fix is not None,
-                            'suggested_fix': suggested_fix,
-                            'confidence': 0.8 if suggested_fix else 0.0,
-                            'is_placeholder': is_placeholder,
-                        }
-                        
-                        if is_placeholder and ignore_placeholders:
-                            self.template_placeholders.append(broken_link)
-                        else:
-                            self.broken_links.append(broken_link)
+                        self._add_broken(md_file, link_text, link_path, line_num,
+                                         resolved_path, suggested_fix)
+                    elif self.check_anchors and '#' in link_path and resolved_path is not None:
+                        anchor = link_path.split('#', 1)[1]
+                        if not self._check_anchor(md_file, resolved_path, anchor):
+                            self._add_broken(md_file, link_text, link_path, line_num,
+                                             resolved_path, None, anchor=anchor)
                         
             except Exception as e:
                 print(f"Warning: Error scanning {md_file}: {e}", file=sys.stderr)
         
         return self.broken_links
     
+    def _add_broken(
+        self,
+        source_file: Path,
+        link_text: str,
+        link_path: str,
+        line_num: int,
+        resolved_path: Optional[Path],
+        suggested_fix: Optional[str],
+        anchor: Optional[str] = None
+    ) -> None:
+        """Record a broken link (or, with anchor, a link to a missing heading anchor)."""
+        is_placeholder = self._is_template_placeholder(link_path)
+        
+        broken_link = {
+            'source_path': str(source_file.relative_to(self.repo_root)),
+            'target_link': link_path,
+            'target_resolved': str(resolved_path) if resolved_path else None,
+            'link_text': link_text,
+            'line_number': line_num,
+            'fixable': suggested_fix is not None,
+            'suggested_fix': suggested_fix,
+            'confidence': 0.8 if suggested_fix else 0.0,
+            'is_placeholder': is_placeholder,
+        }
+        if anchor is not None:
+            broken_link['anchor'] = anchor
+        
+        if is_placeholder and self.ignore_placeholders:
+            self.template_placeholders.append(broken_link)
+        else:
+            self.broken_links.append(broken_link)
+    
     def fix(self, dry_run: bool = True) -> int:
         """
         Apply fixes to broken links.
@@ -562,53 +749,58 @@ class LinkIntegrityGate:
             return None
         
         try:
-            # Record gate run
-            self.run_id = self.db.record_gate_run(
-                gate_code=self.GATE_CODE,
-                passed=passed,
-                error_count=len([b for b in self.broken_links if not b['fixable']]),
-                warning_count=len([b for b in self.broken_links if b['fixable']]),
-                git_ref=git_ref,
-                git_sha=git_sha,
-                pr_number=pr_number,
-                metadata={
-                    'files_scanned': self.files_scanned,
-                    'broken_links_total': len(self.broken_links),
-                    'fixable_links': len([b for b in self.broken_links if b['fixable']]),
-                    'fixed_links': len(self.fixed_links),
-                    'files_updated': self.files_updated,
-                }
-            )
-            
-            # Clear previous link integrity records
-            self.db.clear_link_integrity_records()
-            
-            # Record each broken link
-            for broken in self.broken_links:
-                self.db.record_broken_link(
-                    source_path=broken['source_path'],
-                    target_link=broken['target_link'],
-                    target_resolved_path=broken.get('target_resolved'),
-                    link_type='INTERNAL',
-                    fixable=broken['fixable'],
-                    suggested_fix=broken.get('suggested_fix')
+            # Record the run, link records and findings in one transaction
+            with self.db.transaction():
+                # Record gate run
+                self.run_id = self.db.record_gate_run(
+                    gate_code=self.GATE_CODE,
+                    passed=passed,
+                    error_count=len([b for b in self.broken_links if not b['fixable']]),
+                    warning_count=len([b for b in self.broken_links if b['fixable']]),
+                    git_ref=git_ref,
+                    git_sha=git_sha,
+                    pr_number=pr_number,
+                    metadata={
+                        'files_scanned': self.files_scanned,
+                        'broken_links_total': len(self.broken_links),
+                        'fixable_links': len([b for b in self.broken_links if b['fixable']]),
+                        'fixed_links': len(self.fixed_links),
+                        'files_updated': self.files_updated,
+                    }
                 )
                 
-                # Also record as gate finding
-                self.db.record_gate_finding(
-                    run_id=self.run_id,
-                    gate_code=self.GATE_CODE,
-                    severity='WARN' if broken['fixable'] else 'ERROR',
-                    message=f"Broken link: {broken['target_link']}",
-                    artifact_path=broken['source_path'],
-                    finding_code='BROKEN_LINK',
-                    line_number=broken['line_number'],
-                    details={
+                # Clear previous link integrity records
+                self.db.clear_link_integrity_records()
+                
+                # Record each broken link
+                self.db.record_broken_links(
+                    {
+                        'source_path': broken['source_path'],
+                        'target_link': broken['target_link'],
+                        'target_resolved_path': broken.get('target_resolved'),
+                        'link_type': 'ANCHOR' if 'anchor' in broken else 'INTERNAL',
+                        'fixable': broken['fixable'],
                         'suggested_fix': broken.get('suggested_fix'),
-                        'confidence': broken.get('confidence'),
                     }
+                    for broken in self.broken_links
                 )
-            
+                
+                # Also record each as gate finding
+                self.db.record_gate_findings(self.run_id, self.GATE_CODE, (
+                    {
+                        'severity': 'WARN' if broken['fixable'] else 'ERROR',
+                        'message': f"{'Broken anchor' if 'anchor' in broken else 'Broken link'}: {broken['target_link']}",
+                        'artifact_path': broken['source_path'],
+                        'finding_code': 'BROKEN_ANCHOR' if 'anchor' in broken else 'BROKEN_LINK',
+                        'line_number': broken['line_number'],
+                        'details': {
+                            'suggested_fix': broken.get('suggested_fix'),
+                            'confidence': broken.get('confidence'),
+                        },
+                    }
+                    for broken in self.broken_links
+                ))
+                
             return self.run_id
             
         except Exception as e:
@@ -635,6 +827,8 @@ class LinkIntegrityGate:
         lines.append("## Summary")
         lines.append(f"  Markdown files scanned: {self.files_scanned}")
         lines.append(f"  Broken internal links: {len(self.broken_links)}")
+        if self.check_anchors:
+            lines.append(f"  Broken anchors: {sum(1 for b in self.broken_links if 'anchor' in b)}")
         lines.append(f"  Template placeholders (ignored): {len(self.template_placeholders)}")
         
         fixable = [b for b in self.broken_links if b['fixable']]
@@ -662,6 +856,8 @@ class LinkIntegrityGate:
                     lines.append(f"  - [{status}] Line {link['line_number']}: {link['target_link']}")
                     if link['suggested_fix']:
                         lines.append(f"    → Suggested: {link['suggested_fix']}")
+                    if 'anchor' in link:
+                        lines.append(f"    → No heading anchor '#{link['anchor']}' in target")
                 lines.append("")
         
         if self.fixed_links:
@@ -713,8 +909,14 @@ Examples:
   # Check only changed files
   %(prog)s --scope diff --mode block
 
+  # Check files changed on this branch
+  %(prog)s --since origin/main --mode block
+
   # With database recording
   %(prog)s --scope repo --db plc_ontology.db
+
+  # Also validate heading anchors of links
+  %(prog)s --scope repo --check-anchors
         """
     )
     
@@ -775,14 +977,31 @@ Examples:
         help='Include template placeholder links in broken count (normally ignored)'
     )
     
+    parser.add_argument(
+        '--check-anchors',
+        action='store_true',
+        help="Also validate '#anchor' fragments against the target file's headings"
+    )
+    add_since_argument(parser)
+    add_cache_arguments(parser)
+    
     args = parser.parse_args()
     
+    # --since selects the diff scope against the given reference
+    if args.since:
+        args.scope = 'diff'
+    
+    cache = cache_from_args(args, args.db or "plc_ontology.db") if args.check_anchors else None
+    
     try:
         # Initialize gate
         gate = LinkIntegrityGate(
             repo_root=Path('.'),
             rename_maps=args.rename_maps,
-            db_path=args.db
+            db_path=args.db,
+            since=args.since,
+            cache=cache,
+            check_anchors=args.check_anchors
         )
         
         ignore_placeholders = not args.include_placeholders
@@ -797,6 +1016,8 @@ Examples:
         print(f"{'='*70}")
         print(f"Markdown files scanned: {gate.files_scanned}")
         print(f"Broken internal links: {len(broken)}")
+        if args.check_anchors:
+            print(f"  Broken anchors: {sum(1 for b in broken if 'anchor' in b)}")
         print(f"Template placeholders (ignored): {len(gate.template_placeholders)}")
         
         fixable = [b for b in broken if b['fixable']]
@@ -850,6 +1071,9 @@ Examples:
         import traceback
         traceback.print_exc()
         return 2
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == '__main__':
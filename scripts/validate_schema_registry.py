@@ -30,7 +30,6 @@ Exit codes:
 
 import argparse
 import csv
-import hashlib
 import json
 import re
 import sys
@@ -38,6 +37,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Import shared repository index and content cache
+try:
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+
 
 @dataclass
 class SchemaEntry:
@@ -145,15 +153,21 @@ class SchemaRegistryValidator:
         '.eslintrc.json', '.prettierrc.json'
     }
 
-    def __init__(self, repo_root: Path = Path('.'), verbose: bool = False):
+    def __init__(self, repo_root: Path = Path('.'), verbose: bool = False,
+                 index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None):
         """
         Initialize the validator.
 
         Args:
             repo_root: Path to the repository root
             verbose: Enable verbose output
+            index: Shared repository index (walked on demand if not given)
+            cache: Persistent content cache for parsed JSON and hashes
         """
         self.repo_root = repo_root
+        self.index = index
+        self.cache = cache or ContentCache.disabled()
         self.verbose = verbose
         self.registry: Dict[str, SchemaEntry] = {}
         self.discovered_schemas: Dict[str, List[Path]] = {}
@@ -167,15 +181,10 @@ class SchemaRegistryValidator:
         """
         schemas: Dict[str, List[Path]] = {}
 
-        for path in self.repo_root.rglob('*.json'):
-            # Skip excluded directories
-            if self._is_excluded_path(path):
-                continue
-
-            # Skip excluded files
-            if path.name in self.EXCLUDED_FILES:
-                continue
-
+        self.index = index_for(self.repo_root, self.index)
+        for path in self.index.paths(under=self.repo_root, suffixes={'.json'},
+                                     exclude_dirs=self.EXCLUDED_DIRS,
+                                     exclude_files=self.EXCLUDED_FILES):
             # Try to identify as a JSON schema file
             schema_info = self._extract_schema_info(path)
             if schema_info:
@@ -207,9 +216,7 @@ class SchemaRegistryValidator:
             Tuple of (schema_id, version) if valid schema, None otherwise
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                data = json.loads(content)
+            data = self.cache.load_json(path)
 
             # Check if this is a JSON Schema file
             if not isinstance(data, dict):
@@ -247,8 +254,7 @@ class SchemaRegistryValidator:
             SHA-256 hex digest
         """
         try:
-            with open(path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            return self.cache.sha256(path)
         except OSError:
             return ""
 
@@ -372,9 +378,8 @@ class SchemaRegistryValidator:
                 # Get version from schema or filename
                 version = "unknown"
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        version = str(data.get('version', 'unknown'))
+                    data = self.cache.load_json(path)
+                    version = str(data.get('version', 'unknown'))
                 except (json.JSONDecodeError, OSError):
                     # Silently continue if unable to read version from file
                     pass
@@ -454,8 +459,7 @@ class SchemaRegistryValidator:
             result: ValidationResult to update
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.cache.load_json(path)
 
             # Check for required JSON Schema fields
             if '$schema' not in data:
@@ -531,12 +535,14 @@ class SchemaRegistryValidator:
         return result
 
 
-def find_registry_files(repo_root: Path) -> List[Path]:
+def find_registry_files(repo_root: Path,
+                        index: Optional[RepoIndex] = None) -> List[Path]:
     """
     Find schema registry files in the repository.
 
     Args:
         repo_root: Path to repository root
+        index: Shared repository index (walked on demand if not given)
 
     Returns:
         List of paths to registry files
@@ -553,8 +559,9 @@ def find_registry_files(repo_root: Path) -> List[Path]:
         '**/91_*__schema-registry_TAB_*.csv'  # v6.0 format with TYPE=TAB and double underscore before subject
     ]
 
+    index = index_for(repo_root, index)
     for pattern in patterns:
-        registries.extend(repo_root.glob(pattern))
+        registries.extend(index.glob(pattern, under=repo_root))
 
     return list(set(registries))
 
@@ -603,6 +610,7 @@ Exit codes:
         action='store_true',
         help='Enable verbose output'
     )
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
 
@@ -615,8 +623,11 @@ Exit codes:
         print(f"Error: '{args.repo_root}' is not a directory", file=sys.stderr)
         return 2
 
+    cache = cache_from_args(args)
     try:
-        validator = SchemaRegistryValidator(repo_root, verbose=args.verbose)
+        index = RepoIndex(repo_root)
+        validator = SchemaRegistryValidator(repo_root, verbose=args.verbose,
+                                            index=index, cache=cache)
 
         if args.schema:
             # Validate single schema file
@@ -641,7 +652,7 @@ Exit codes:
                 registry_path = None
         elif args.check_all:
             # Try to auto-discover registry
-            registries = find_registry_files(repo_root)
+            registries = find_registry_files(repo_root, index)
             if registries:
                 registry_path = registries[0]
                 print(f"📄 Auto-discovered registry: {registry_path}")
@@ -659,6 +670,8 @@ Exit codes:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
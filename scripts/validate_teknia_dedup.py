@@ -27,13 +27,23 @@ Exit codes:
 
 import argparse
 import csv
-import hashlib
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Import shared repository index, content cache and change set
+try:
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSet, ChangeSetError, add_since_argument, change_set_from_args
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSet, ChangeSetError, add_since_argument, change_set_from_args
+
 
 @dataclass
 class DuplicateEntry:
@@ -174,7 +184,9 @@ class TekniaDedupValidator:
     ]
 
     def __init__(self, repo_root: Path = Path('.'), verbose: bool = False,
-                 strict: bool = False):
+                 strict: bool = False, index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None,
+                 changes: Optional[ChangeSet] = None):
         """
         Initialize the validator.
 
@@ -182,8 +194,15 @@ class TekniaDedupValidator:
             repo_root: Path to the repository root
             verbose: Enable verbose output
             strict: If True, flag all duplicates as errors; if False, allowlist expected patterns
+            index: Shared repository index (walked on first use if not given)
+            cache: Persistent content cache for hashes and identifier scans
+            changes: Only report duplicates involving these changed files
+                     (the whole repository is still scanned for the other copy)
         """
         self.repo_root = repo_root
+        self._index = index
+        self.cache = cache or ContentCache.disabled()
+        self.changes = changes
         self.verbose = verbose
         self.strict = strict
         self._compiled_allowlist = [
@@ -204,6 +223,16 @@ class TekniaDedupValidator:
                 return True
         return False
 
+    @property
+    def index(self) -> RepoIndex:
+        """Repository index shared by the hash and namespace passes."""
+        self._index = index_for(self.repo_root, self._index)
+        return self._index
+
+    def _is_affected(self, rel_path: str) -> bool:
+        """Check whether a repo-relative path is in scope for reporting."""
+        return self.changes is None or self.changes.is_affected(Path(rel_path).as_posix())
+
     def _is_excluded_path(self, path: Path) -> bool:
         """Check if path should be excluded from scanning."""
         for parent in path.parents:
@@ -228,8 +257,7 @@ class TekniaDedupValidator:
             SHA-256 hex digest or None if file cannot be read
         """
         try:
-            with open(path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            return self.cache.sha256(path)
         except OSError:
             return None
 
@@ -248,11 +276,10 @@ class TekniaDedupValidator:
         hash_to_files: Dict[str, List[Path]] = {}
         file_count = 0
 
-        for path in self.repo_root.rglob('*'):
-            if not path.is_file():
-                continue
-
-            if not self._should_include_file(path):
+        for path in self.index.paths(under=self.repo_root,
+                                     exclude_dirs=self.EXCLUDED_DIRS,
+                                     exclude_files=self.EXCLUDED_FILES):
+            if path.suffix.lower() not in self.INCLUDE_EXTENSIONS:
                 continue
 
             file_hash = self._compute_file_hash(path)
@@ -276,6 +303,10 @@ class TekniaDedupValidator:
         problematic_duplicates = {}
 
         for file_hash, paths in duplicates.items():
+            # In --since mode, skip groups that no changed file belongs to
+            if not any(self._is_affected(str(p.relative_to(self.repo_root))) for p in paths):
+                continue
+
             # Check if all paths match allowlisted patterns
             all_allowlisted = all(
                 self._is_allowlisted_duplicate(p) for p in paths
@@ -321,6 +352,11 @@ class TekniaDedupValidator:
         Returns:
             Dictionary mapping identifier type to set of identifiers found
         """
+        cached = self.cache.get(path, 'teknia_identifiers', self._scan_identifiers)
+        return {id_type: set(values) for id_type, values in cached.items()}
+
+    def _scan_identifiers(self, path: Path) -> Dict[str, List[str]]:
+        """Scan a file for identifiers (uncached; sorted lists for storage)."""
         identifiers: Dict[str, Set[str]] = {}
 
         try:
@@ -362,7 +398,7 @@ class TekniaDedupValidator:
             # Silently skip files that cannot be read (binary files, encoding issues)
             pass
 
-        return identifiers
+        return {id_type: sorted(values) for id_type, values in identifiers.items()}
 
     def _find_registry_files(self) -> List[Path]:
         """
@@ -373,7 +409,7 @@ class TekniaDedupValidator:
         """
         registries = []
         for pattern in self.REGISTRY_PATTERNS:
-            registries.extend(self.repo_root.glob(pattern))
+            registries.extend(self.index.glob(pattern, under=self.repo_root))
         return list(set(registries))
 
     def _parse_registry_identifiers(self, path: Path) -> Dict[str, Tuple[str, str]]:
@@ -490,9 +526,9 @@ class TekniaDedupValidator:
                 all_identifiers[identifier].append((namespace, source))
 
         # Scan markdown files for identifiers (beyond registries)
-        for path in self.repo_root.rglob('*.md'):
-            if self._is_excluded_path(path):
-                continue
+        for path in self.index.paths(under=self.repo_root, suffixes={'.md'},
+                                     exclude_dirs=self.EXCLUDED_DIRS,
+                                     exclude_files=self.EXCLUDED_FILES):
             if path in registries:  # Already processed
                 continue
 
@@ -519,7 +555,7 @@ class TekniaDedupValidator:
                     # Same namespace - might be intentional references
                     # Only flag if it appears in multiple distinct files
                     sources = set(loc[1] for loc in locations)
-                    if len(sources) > 1:
+                    if len(sources) > 1 and any(self._is_affected(src) for src in sources):
                         # Multiple definitions in same namespace
                         duplicates_found += 1
                         result.add_warning(
@@ -655,6 +691,8 @@ Exit codes:
         action='store_true',
         help='Strict mode: flag all duplicates as errors, ignore allowlist'
     )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
 
     args = parser.parse_args()
 
@@ -675,9 +713,18 @@ Exit codes:
         print(f"Error: '{args.repo_root}' is not a directory", file=sys.stderr)
         return 2
 
+    try:
+        # Report only duplicates involving files changed since --since REF
+        changes = change_set_from_args(args, repo_root)
+    except ChangeSetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    cache = cache_from_args(args)
     try:
         validator = TekniaDedupValidator(
-            repo_root, verbose=args.verbose, strict=args.strict
+            repo_root, verbose=args.verbose, strict=args.strict, cache=cache,
+            changes=changes
         )
 
         if args.check_all:
@@ -697,6 +744,8 @@ Exit codes:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
@@ -37,6 +37,19 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import unquote, urlparse
 
+# Import shared repository index, content cache, change set and link extractor
+try:
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+    from link_extractor import HTML, INLINE, REFERENCE, read_links
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from repo_index import RepoIndex, index_for
+    from content_cache import ContentCache, add_cache_arguments, cache_from_args
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+    from link_extractor import HTML, INLINE, REFERENCE, read_links
+
 
 @dataclass
 class LinkInfo:
@@ -118,19 +131,10 @@ class ValidationResult:
 class TraceLinkValidator:
     """Validates trace links and internal references in markdown files."""
 
-    # Markdown link pattern: [text](target) or [text](target "title")
-    MARKDOWN_LINK_PATTERN = re.compile(
-        r'\[([^\]]+)\]\(([^)\s]+)(?:\s+"[^"]*")?\)'
-    )
-
-    # Reference-style link pattern: [text][ref]
-    REF_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\[([^\]]+)\]')
-
-    # Reference definition pattern: [ref]: target
-    REF_DEF_PATTERN = re.compile(r'^\[([^\]]+)\]:\s*(.+)$', re.MULTILINE)
-
-    # HTML anchor link pattern: <a href="target">text</a>
-    HTML_LINK_PATTERN = re.compile(r'<a\s+href="([^"]+)"[^>]*>([^<]*)</a>')
+    # Link kinds reported per line, in this order: [text](target) or
+    # [text](target "title"), [text][ref] with a [ref]: target definition,
+    # and <a href="target">text</a>
+    LINK_KIND_ORDER = {INLINE: 0, REFERENCE: 1, HTML: 2}
 
     # Directories to exclude from validation
     EXCLUDED_DIRS = {
@@ -167,7 +171,8 @@ class TraceLinkValidator:
     ]
 
     def __init__(self, repo_root: Path = Path('.'), verbose: bool = False,
-                 skip_templates: bool = False):
+                 skip_templates: bool = False, index: Optional[RepoIndex] = None,
+                 cache: Optional[ContentCache] = None):
         """
         Initialize the validator.
 
@@ -175,8 +180,12 @@ class TraceLinkValidator:
             repo_root: Path to the repository root
             verbose: Enable verbose output
             skip_templates: Skip validation of template files and placeholder patterns
+            index: Shared repository index (walked on demand if not given)
+            cache: Persistent content cache for extracted links
         """
         self.repo_root = repo_root.resolve()
+        self.index = index
+        self.cache = cache or ContentCache.disabled()
         self.verbose = verbose
         self.skip_templates = skip_templates
         self.external_pattern = re.compile('|'.join(self.EXTERNAL_PATTERNS))
@@ -221,9 +230,17 @@ class TraceLinkValidator:
         
         return False
 
+    def _exists(self, path: Path) -> bool:
+        """Path.exists(), answered from the shared index once it is built."""
+        return self.index.exists(path) if self.index is not None else path.exists()
+
+    def _is_dir(self, path: Path) -> bool:
+        """Path.is_dir(), answered from the shared index once it is built."""
+        return self.index.is_dir(path) if self.index is not None else path.is_dir()
+
     def is_structural_directory(self, path: Path) -> bool:
         """Check if a directory matches known structural patterns."""
-        if not path.is_dir():
+        if not self._is_dir(path):
             return False
         
         dir_name = path.name
@@ -246,83 +263,46 @@ class TraceLinkValidator:
         Returns:
             List of LinkInfo objects
         """
-        links = []
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            records = self.cache.get(file_path, 'trace_links', self._scan_links)
         except (OSError, UnicodeDecodeError) as e:
             if self.verbose:
                 print(f"  Warning: Cannot read {file_path}: {e}")
             return []
 
-        # Build reference definitions map
-        ref_defs = {}
-        for match in self.REF_DEF_PATTERN.finditer(content):
-            ref_name = match.group(1).lower()
-            ref_target = match.group(2).strip()
-            ref_defs[ref_name] = ref_target
-
-        # Find inline markdown links
-        for line_num, line in enumerate(lines, 1):
-            for match in self.MARKDOWN_LINK_PATTERN.finditer(line):
-                link_text = match.group(1)
-                link_target = match.group(2)
-
-                # Skip external links
-                if self.is_external_link(link_target):
-                    link_type = 'external'
-                else:
-                    link_type = 'relative' if not link_target.startswith('/') else 'absolute'
-
-                links.append(LinkInfo(
-                    source_file=file_path,
-                    line_number=line_num,
-                    link_text=link_text,
-                    link_target=link_target,
-                    link_type=link_type
-                ))
-
-            # Find reference-style links
-            for match in self.REF_LINK_PATTERN.finditer(line):
-                link_text = match.group(1)
-                ref_name = match.group(2).lower()
-
-                if ref_name in ref_defs:
-                    link_target = ref_defs[ref_name]
-                    if self.is_external_link(link_target):
-                        link_type = 'external'
-                    else:
-                        link_type = 'reference'
-
-                    links.append(LinkInfo(
-                        source_file=file_path,
-                        line_number=line_num,
-                        link_text=link_text,
-                        link_target=link_target,
-                        link_type=link_type
-                    ))
-
-            # Find HTML links
-            for match in self.HTML_LINK_PATTERN.finditer(line):
-                link_target = match.group(1)
-                link_text = match.group(2)
-
-                if self.is_external_link(link_target):
-                    link_type = 'external'
-                else:
-                    link_type = 'html'
-
-                links.append(LinkInfo(
-                    source_file=file_path,
-                    line_number=line_num,
-                    link_text=link_text,
-                    link_target=link_target,
-                    link_type=link_type
-                ))
-
-        return links
+        return [LinkInfo(file_path, *record) for record in records]
+
+    def _scan_links(self, file_path: Path) -> List[list]:
+        """
+        Scan a markdown file for links (uncached, one pass of the shared extractor).
+
+        Returns:
+            [line_number, link_text, link_target, link_type] records
+        """
+        links = sorted(
+            (link for link in read_links(file_path, errors='strict')
+             if link.kind in self.LINK_KIND_ORDER),
+            key=lambda link: (link.line, self.LINK_KIND_ORDER[link.kind])
+        )
+
+        records = []
+        for link in links:
+            link_target = link.destination
+            if link_target is None:
+                continue  # Inline target with spaces and no "title"
+
+            if self.is_external_link(link_target):
+                link_type = 'external'
+            elif link.kind == INLINE:
+                link_type = 'relative' if not link_target.startswith('/') else 'absolute'
+            elif link.kind == REFERENCE:
+                link_type = 'reference'
+            else:
+                link_type = 'html'
+
+            records.append([link.line, link.text, link_target, link_type])
+
+        return records
 
     def resolve_link_target(self, source_file: Path, link_target: str) -> Optional[Path]:
         """
@@ -352,6 +332,9 @@ class TraceLinkValidator:
             # Relative path from source file directory
             resolved = source_file.parent / target
 
+        # '..' segments are resolved in memory when the index covers the path
+        if self.index is not None:
+            return self.index.resolve(resolved)
         return resolved.resolve()
 
     def validate_link(self, link: LinkInfo) -> bool:
@@ -386,9 +369,9 @@ class TraceLinkValidator:
             return False
 
         # Check if it's a directory with index file
-        if resolved.is_dir():
+        if self._is_dir(resolved):
             for index_name in ['index.md', 'README.md', 'index.html']:
-                if (resolved / index_name).exists():
+                if self._exists(resolved / index_name):
                     return True
             
             # When skip_templates is enabled, allow links to structural directories
@@ -401,7 +384,7 @@ class TraceLinkValidator:
             return False
 
         # Check if target file exists
-        return resolved.exists()
+        return self._exists(resolved)
 
     def validate_file(self, file_path: Path, result: ValidationResult) -> None:
         """
@@ -436,15 +419,19 @@ class TraceLinkValidator:
             result: ValidationResult to update
             recursive: If True, scan recursively
         """
-        pattern = '**/*.md' if recursive else '*.md'
-
-        for path in directory.glob(pattern):
-            if not path.is_file():
-                continue
+        if not recursive:
+            for path in directory.glob('*.md'):
+                if path.is_file() and not self.is_excluded_path(path):
+                    self.validate_file(path, result)
+            return
 
-            if self.is_excluded_path(path):
-                continue
+        excluded_dirs = set(self.EXCLUDED_DIRS)
+        if self.skip_templates:
+            excluded_dirs.add('templates')
 
+        self.index = index_for(directory, self.index)
+        for path in self.index.paths(under=directory, suffixes={'.md'},
+                                     exclude_dirs=excluded_dirs):
             self.validate_file(path, result)
 
     def validate_all(self) -> ValidationResult:
@@ -520,6 +507,8 @@ Exit codes:
         action='store_true',
         help='Skip validation of template files and placeholder patterns (e.g., {{PLACEHOLDER}})'
     )
+    add_cache_arguments(parser)
+    add_since_argument(parser)
 
     args = parser.parse_args()
 
@@ -532,11 +521,21 @@ Exit codes:
         print(f"Error: '{args.repo_root}' is not a directory", file=sys.stderr)
         return 2
 
+    try:
+        # Restrict directory scans to files changed since --since REF
+        changes = change_set_from_args(args, repo_root)
+    except ChangeSetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    cache = cache_from_args(args)
     try:
         validator = TraceLinkValidator(
             repo_root,
             verbose=args.verbose,
-            skip_templates=args.skip_templates
+            skip_templates=args.skip_templates,
+            index=changes.index() if changes else None,
+            cache=cache
         )
         result = ValidationResult()
 
@@ -570,6 +569,8 @@ Exit codes:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 2
+    finally:
+        cache.close()
 
 
 if __name__ == '__main__':
@@ -14,6 +14,8 @@ Usage:
     python validate_nomenclature.py --standard v6.0 --check-all
     python validate_nomenclature.py --standard v6.0 --mode warn --check-all
     python validate_nomenclature.py --check-dir <directory>
+    python validate_nomenclature.py --standard v6.0 --check-all --jobs 8
+    git diff --cached --name-only -z | python validate_nomenclature.py --stdin --ndjson
 
 Exit codes:
     0: All files valid
@@ -22,13 +24,28 @@ Exit codes:
 """
 
 import argparse
+import contextlib
+import json
+import os
 import re
 import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Import shared filename parser, repository index and change set
+try:
+    import nomenclature
+    from repo_index import RepoIndex, index_for, compile_exclusion_pattern
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+    import nomenclature
+    from repo_index import RepoIndex, index_for, compile_exclusion_pattern
+    from change_set import ChangeSetError, add_since_argument, change_set_from_args
+
 
 @dataclass
 class ValidationResult:
@@ -45,43 +62,9 @@ class NomenclatureValidator:
     # Default config path
     DEFAULT_CONFIG_PATH = "config/nomenclature/v5_0.yaml"
     
-    # Primary regex pattern (v5.0 format)
-    PRIMARY_PATTERN_V5 = re.compile(
-        r'^(?P<ata_root>(?:0[0-9]|[1-9][0-9]|10[0-9]|11[0-6]))_'
-        r'(?P<project>AMPEL360)_'
-        r'(?P<program>SPACET)_'
-        r'(?P<variant>[A-Z0-9]+(?:-[A-Z0-9]+)*)_'
-        r'(?P<block>[A-Z0-9]+)_'
-        r'(?P<phase>(?:LC(?:0[1-9]|1[0-4])|SB(?:0[1-9]|[1-9][0-9])))_'
-        r'(?P<knot_task>K(?:0[1-9]|1[0-4])(?:-T[0-9]{3})?)_'
-        r'(?P<aor>[A-Z]+)__'
-        r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
-        r'(?P<type>[A-Z0-9]+)_'
-        r'(?P<version>v[0-9]{2})_'
-        r'(?P<status>[A-Z]+)'
-        r'\.(?P<ext>[a-z0-9]{1,6})$'
-    )
-    
-    # Primary regex pattern (v6.0 format)
-    # VERSION supports optional 2-digit iteration: (PLUS|PLUSULTRA)[0-9]{2}?
-    PRIMARY_PATTERN_V6 = re.compile(
-        r'^(?P<ata_root>(?:0[0-9]|[1-9][0-9]|10[0-9]|11[0-6]))_'
-        r'(?P<project>AMPEL360)_'
-        r'(?P<program>SPACET)_'
-        r'(?P<family>Q[0-9]{2,3})_'
-        r'(?P<variant>[A-Z0-9]+)_'
-        r'(?P<version>(?:PLUS|PLUSULTRA)(?:[0-9]{2})?)_'  # R1.0: optional 2-digit iteration
-        r'(?P<model>[A-Z]{2})_'
-        r'(?P<block>[A-Z0-9]+)_'
-        r'(?P<phase>(?:LC(?:0[1-9]|1[0-4])|SB(?:0[1-9]|[1-9][0-9])))_'
-        r'(?P<knot_task>K(?:0[1-9]|1[0-4])(?:-T[0-9]{3})?)_'
-        r'(?P<aor>[A-Z]+)__'
-        r'(?P<subject>[a-z0-9]+(?:-[a-z0-9]+)*)_'
-        r'(?P<type>[A-Z0-9]+)_'
-        r'(?P<issue_revision>I[0-9]{2}-R[0-9]{2})_'
-        r'(?P<status>[A-Z]+)'
-        r'\.(?P<ext>[a-z0-9]{1,6})$'
-    )
+    # Primary regex patterns (shared grammar, see scripts/nomenclature.py)
+    PRIMARY_PATTERN_V5 = nomenclature.PATTERN_V5
+    PRIMARY_PATTERN_V6 = nomenclature.PATTERN_V6
     
     # LC stage pattern (LC01-LC14)
     LC_PATTERN = re.compile(r'^LC(0[1-9]|1[0-4])$')
@@ -110,6 +93,9 @@ class NomenclatureValidator:
     # Allowed PROGRAM values (fixed)
     ALLOWED_PROGRAMS = {'SPACET'}
     
+    # Shards handed to each worker process by validate_directory(jobs=N)
+    SHARDS_PER_JOB = 4
+    
     def __init__(self, config_path: Optional[str] = None, strict: bool = True, 
                  standard: str = "v5.0", mode: str = "block"):
         """
@@ -132,6 +118,7 @@ class NomenclatureValidator:
             else:
                 config_path = self.DEFAULT_CONFIG_PATH
         
+        self.config_path = config_path
         self.config = self._load_config(config_path)
         
         # Extract allowlists from config
@@ -167,6 +154,7 @@ class NomenclatureValidator:
         self.excluded_files = set(exemptions.get('files', []))
         self.excluded_dirs = set(exemptions.get('directories', []))
         self.excluded_patterns = exemptions.get('patterns', [])
+        self._excluded_regex = compile_exclusion_pattern(self.excluded_patterns)
         
         # Extract phase-block mapping
         self.phase_block_mapping = self.config.get('phase_block_mapping', {})
@@ -236,47 +224,45 @@ class NomenclatureValidator:
             return ValidationResult(filename, True, [], [])
         
         # Check if filename matches any excluded pattern
-        for pattern in self.excluded_patterns:
-            if re.match(pattern, filename):
-                return ValidationResult(filename, True, [], [])
+        if self._excluded_regex and self._excluded_regex.match(filename):
+            return ValidationResult(filename, True, [], [])
         
         # Match against primary pattern based on standard version
         if self.standard == "v6.0":
-            match = self.PRIMARY_PATTERN_V6.match(filename)
+            components = nomenclature.parse(filename, 'v6.0')
             pattern_desc = "[ATA_ROOT]_[PROJECT]_[PROGRAM]_[FAMILY]_[VARIANT]_[VERSION]_[MODEL]_[BLOCK]_[PHASE]_[KNOT_TASK]_[AoR]__[SUBJECT]_[TYPE]_[ISSUE-REVISION]_[STATUS].[EXT]"
         else:
-            match = self.PRIMARY_PATTERN_V5.match(filename)
+            components = nomenclature.parse(filename, 'v5.0')
             pattern_desc = "[ATA_ROOT]_[PROJECT]_[PROGRAM]_[VARIANT]_[BLOCK]_[PHASE]_[KNOT_TASK]_[AoR]__[SUBJECT]_[TYPE]_[VERSION]_[STATUS].[EXT]"
         
-        if not match:
+        if components is None:
             errors.append(
                 f"Filename does not match required pattern ({self.standard}): {pattern_desc}"
             )
             return ValidationResult(filename, False, errors, warnings)
         
         # Extract components
-        components = match.groupdict()
-        ata_root = components['ata_root']
-        project = components['project']
-        program = components['program']
-        variant = components['variant']
-        block = components['block']
-        phase = components['phase']
-        knot_task = components['knot_task']
-        aor = components['aor']
-        subject = components['subject']
-        type_code = components['type']
-        status = components['status']
-        ext = components['ext']
+        ata_root = components.ata_root
+        project = components.project
+        program = components.program
+        variant = components.variant
+        block = components.block
+        phase = components.phase
+        knot_task = components.knot_task
+        aor = components.aor
+        subject = components.subject
+        type_code = components.type
+        status = components.status
+        ext = components.ext
         
         # v6.0 specific fields
         if self.standard == "v6.0":
-            family = components.get('family')
-            version = components.get('version')
-            model = components.get('model')
-            issue_revision = components.get('issue_revision')
+            family = components.family
+            version = components.version
+            model = components.model
+            issue_revision = components.issue_revision
         else:
-            version = components.get('version')  # vNN format in v5.0
+            version = components.version  # vNN format in v5.0
         
         # Validate ATA_ROOT padding
         ata_num = int(ata_root)
@@ -480,47 +466,140 @@ class NomenclatureValidator:
         """
         return self.validate_filename(filepath.name)
     
-    def validate_directory(self, directory: Path, recursive: bool = True) -> List[ValidationResult]:
+    def validate_directory(self, directory: Path, recursive: bool = True,
+                           index: Optional[RepoIndex] = None,
+                           jobs: int = 1) -> List[ValidationResult]:
         """
         Validate all files in a directory.
         
         Args:
             directory: Directory path to scan
             recursive: If True, scan recursively
+            index: Shared repository index (walked on demand if not given)
+            jobs: Worker processes; above 1 the file list is sharded across
+                  a process pool and results are merged in scan order
             
         Returns:
             List of ValidationResult objects
         """
-        results = []
-        
         if recursive:
-            for path in directory.rglob('*'):
-                if path.is_file() and not self._is_excluded_path(path):
-                    results.append(self.validate_file_path(path))
+            index = index_for(directory, index)
+            names = [entry.name for entry in index.files(
+                under=directory,
+                exclude_dirs=self.excluded_dirs,
+                exclude_files=self.excluded_files,
+                exclude_patterns=self.excluded_patterns
+            )]
         else:
-            for path in directory.iterdir():
-                if path.is_file() and path.name not in self.excluded_files:
-                    results.append(self.validate_file_path(path))
+            names = [path.name for path in directory.iterdir()
+                     if path.is_file() and path.name not in self.excluded_files]
         
+        if jobs <= 1 or len(names) <= jobs:
+            return [self.validate_filename(name) for name in names]
+        return self._validate_sharded(names, jobs)
+    
+    def _validate_sharded(self, names: List[str], jobs: int) -> List[ValidationResult]:
+        """Validate filenames on a process pool, preserving input order."""
+        # A few shards per worker keeps the pool busy when shards vary in cost
+        shard_size = -(-len(names) // (jobs * self.SHARDS_PER_JOB))
+        shards = [names[i:i + shard_size] for i in range(0, len(names), shard_size)]
+        
+        results: List[ValidationResult] = []
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_shard_worker,
+            initargs=(self.config_path, self.strict, self.standard, self.mode)
+        ) as pool:
+            # map() yields shard results in submission order: deterministic merge
+            for shard_results in pool.map(_validate_shard, shards):
+                results.extend(shard_results)
         return results
     
     def _is_excluded_path(self, path: Path) -> bool:
         """Check if path should be excluded from validation."""
         # Check if any parent directory is excluded
-        for parent in path.parents:
-            if parent.name in self.excluded_dirs:
-                return True
+        if not self.excluded_dirs.isdisjoint(path.parts[:-1]):
+            return True
         
         # Check if filename is excluded
         if path.name in self.excluded_files:
             return True
         
         # Check if filename matches any excluded pattern
-        for pattern in self.excluded_patterns:
-            if re.match(pattern, path.name):
-                return True
+        return bool(self._excluded_regex and self._excluded_regex.match(path.name))
+    
+    def validate_paths(self, paths: Iterable[str]) -> Iterator[Tuple[str, Optional[ValidationResult]]]:
+        """
+        Lazily validate a stream of repository paths.
+        
+        Exempt paths (by directory, filename or pattern) are yielded with a
+        None result so callers can still report them.
         
-        return False
+        Args:
+            paths: Iterable of file paths (e.g. from iter_paths())
+            
+        Yields:
+            (path, ValidationResult or None) tuples, in input order
+        """
+        for path in paths:
+            if self._is_excluded_path(Path(path)):
+                yield path, None
+            else:
+                yield path, self.validate_filename(Path(path).name)
+
+
+# Validator owned by each worker process of a sharded validate_directory()
+_shard_validator: Optional[NomenclatureValidator] = None
+
+
+def _init_shard_worker(config_path: str, strict: bool, standard: str, mode: str) -> None:
+    """Process pool initializer: load the config once per worker."""
+    global _shard_validator
+    _shard_validator = NomenclatureValidator(
+        config_path=config_path, strict=strict, standard=standard, mode=mode
+    )
+
+
+def _validate_shard(names: List[str]) -> List[ValidationResult]:
+    """Validate one shard of filenames in a worker process."""
+    return [_shard_validator.validate_filename(name) for name in names]
+
+
+def iter_paths(stream: BinaryIO) -> Iterator[str]:
+    """
+    Yield paths from a binary stream as soon as each one is complete.
+    
+    Records may be separated by newlines or NULs (as produced by
+    `git diff --name-only -z`); empty records are skipped.
+    """
+    separators = re.compile(rb'[\n\0]')
+    read = getattr(stream, 'read1', stream.read)
+    pending = b''
+    while True:
+        chunk = read(65536)
+        if not chunk:
+            break
+        *records, pending = separators.split(pending + chunk)
+        for record in records:
+            path = os.fsdecode(record).rstrip('\r')
+            if path:
+                yield path
+    path = os.fsdecode(pending).rstrip('\r')
+    if path:
+        yield path
+
+
+def result_to_json(result: Optional[ValidationResult], path: Optional[str] = None) -> str:
+    """Serialize a result as one NDJSON line (None marks an exempt path)."""
+    if result is None:
+        record = {'filename': Path(path).name, 'valid': True, 'exempt': True,
+                  'errors': [], 'warnings': []}
+    else:
+        record = {'filename': result.filename, 'valid': result.valid, 'exempt': False,
+                  'errors': result.errors, 'warnings': result.warnings}
+    if path is not None:
+        record = {'path': path, **record}
+    return json.dumps(record, ensure_ascii=False)
 
 
 def print_result(result: ValidationResult, verbose: bool = False) -> None:
@@ -554,6 +633,9 @@ Examples:
   %(prog)s --standard v6.0 --mode warn --check-all
   %(prog)s --standard v6.0 --mode block --check-all
   
+  # Staged files, one process (pre-commit), streamed as NDJSON
+  git diff --cached --name-only -z | %(prog)s --stdin --ndjson
+  
   # v6.0 examples
   %(prog)s --standard v6.0 27_AMPEL360_SPACET_Q10_GEN_PLUS_BB_OPS_LC03_K06_SE__thermal-loop_STD_I01-R01_ACTIVE.md
   %(prog)s --standard v6.0 27_AMPEL360_SPACET_Q10_CUST_PLUS01_SW_OPS_LC03_K06_SE__cust-airbus-thermal_STD_I01-R01_DRAFT.md
@@ -610,12 +692,38 @@ Examples:
         action='store_true',
         help='Show all results including valid files'
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Validate directory scans on N worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--files-from',
+        metavar='FILE',
+        help='Validate paths listed in FILE, newline- or NUL-separated ("-" for stdin)'
+    )
+    parser.add_argument(
+        '--stdin',
+        dest='files_from',
+        action='store_const',
+        const='-',
+        help='Validate paths read from stdin (same as --files-from -)'
+    )
+    parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Emit one JSON result per line (NDJSON) as files are validated'
+    )
+    add_since_argument(parser)
     
     args = parser.parse_args()
     
     # Validate arguments
-    if not any([args.filename, args.check_all, args.check_dir]):
-        parser.error('Must specify filename, --check-all, or --check-dir')
+    if not any([args.filename, args.check_all, args.check_dir, args.files_from]):
+        parser.error('Must specify filename, --check-all, --check-dir, or --files-from/--stdin')
     
     validator = NomenclatureValidator(
         config_path=args.config, 
@@ -623,40 +731,62 @@ Examples:
         standard=args.standard,
         mode=args.mode
     )
-    results = []
     
     try:
-        if args.filename:
-            # Validate single filename
-            result = validator.validate_filename(args.filename)
-            results = [result]
-        elif args.check_dir:
-            # Validate directory
-            dir_path = Path(args.check_dir)
-            if not dir_path.is_dir():
-                print(f"Error: '{args.check_dir}' is not a directory", file=sys.stderr)
-                return 2
-            results = validator.validate_directory(dir_path, recursive=True)
-        elif args.check_all:
-            # Validate current directory
-            results = validator.validate_directory(Path('.'), recursive=True)
-        
-        # Print results
-        valid_count = 0
-        invalid_count = 0
-        
-        for result in results:
-            if result.valid:
-                valid_count += 1
-                if args.verbose:
-                    print_result(result, verbose=True)
-            else:
-                invalid_count += 1
-                print_result(result, verbose=args.verbose)
+        # Restrict directory scans to files changed since --since REF
+        changes = change_set_from_args(args, Path('.'))
+        index = changes.index(args.config) if changes else None
+    except ChangeSetError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        with contextlib.ExitStack() as stack:
+            if args.filename:
+                # Validate single filename
+                results = [(None, validator.validate_filename(args.filename))]
+            elif args.files_from:
+                # Validate a stream of paths, reporting each as it is read
+                if args.files_from == '-':
+                    stream = sys.stdin.buffer
+                else:
+                    stream = stack.enter_context(open(args.files_from, 'rb'))
+                results = validator.validate_paths(iter_paths(stream))
+            elif args.check_dir:
+                # Validate directory
+                dir_path = Path(args.check_dir)
+                if not dir_path.is_dir():
+                    print(f"Error: '{args.check_dir}' is not a directory", file=sys.stderr)
+                    return 2
+                results = [(None, r) for r in validator.validate_directory(
+                    dir_path, recursive=True, index=index, jobs=args.jobs)]
+            elif args.check_all:
+                # Validate current directory
+                results = [(None, r) for r in validator.validate_directory(
+                    Path('.'), recursive=True, index=index, jobs=args.jobs)]
+            
+            # Print results
+            valid_count = 0
+            invalid_count = 0
+            
+            for path, result in results:
+                if args.ndjson:
+                    print(result_to_json(result, path), flush=True)
+                if result is None:
+                    continue  # Exempt path
+                if result.valid:
+                    valid_count += 1
+                    if args.verbose and not args.ndjson:
+                        print_result(result, verbose=True)
+                else:
+                    invalid_count += 1
+                    if not args.ndjson:
+                        print_result(result, verbose=args.verbose)
+                        sys.stdout.flush()
         
         # Print summary
-        total = len(results)
-        if total > 1 or args.check_all or args.check_dir:
+        total = valid_count + invalid_count
+        if not args.ndjson and (total > 1 or args.check_all or args.check_dir or args.files_from):
             print(f"\n{'='*60}")
             print(f"Summary: {valid_count} valid, {invalid_count} invalid (total: {total})")
             print(f"{'='*60}")